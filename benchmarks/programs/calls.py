@@ -0,0 +1,23 @@
+class Point(object):
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def add(self, other):
+        return Point(self.x + other.x, self.y + other.y)
+
+def scale(p, factor=2):
+    return Point(p.x * factor, p.y * factor)
+
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+p = Point(0, 0)
+for i in range(5000):
+    p = p.add(Point(1, 2))
+    p = scale(p, factor=1)
+
+print p.x, p.y, fib(18)
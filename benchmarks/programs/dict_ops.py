@@ -0,0 +1,19 @@
+d = {}
+for i in range(20000):
+    d[i] = i * 2
+    d["k%d" % (i % 500)] = i
+
+total = 0
+for i in range(20000):
+    if i in d:
+        total += d[i]
+    total += d.get(i + 20000, 1)
+
+for k in d.keys():
+    if k in d:
+        total += 1
+
+for i in range(0, 20000, 2):
+    del d[i]
+
+print total, len(d)
@@ -0,0 +1,72 @@
+## Headless version of examples/gol.py, with a fixed random seed
+
+class Random(object):
+
+    def __init__(self, seed):
+        self.state = seed
+
+    def next(self):
+        self.state = (self.state * 75 + 74) % 65537
+        return self.state
+
+class GoL(object):
+
+    def __init__(self, width, height, seed):
+        self.width = width
+        self.height = height
+        rnd = Random(seed)
+        self.grid = list(range(self.width * self.height))
+        for i in range(self.width * self.height):
+            self.grid[i] = rnd.next() % 7 < 3
+
+    def get(self, x, y):
+        return self.grid[((x + self.width) % self.width) + ((y + self.height) % self.height) * self.width]
+
+    def iter(self):
+        toDie = []
+        toLive = []
+        for x in range(0, self.width):
+            for y in range(0, self.height):
+                count = 0
+                if self.get(x-1, y-1):
+                    count += 1
+                if self.get(x, y-1):
+                    count += 1
+                if self.get(x+1, y-1):
+                    count += 1
+                if self.get(x-1, y):
+                    count += 1
+                if self.get(x+1, y):
+                    count += 1
+                if self.get(x-1, y+1):
+                    count += 1
+                if self.get(x, y+1):
+                    count += 1
+                if self.get(x+1, y+1):
+                    count += 1
+
+                if self.get(x, y):
+                    if count < 2:
+                        toDie.append(x + y*self.width)
+                    elif count > 3:
+                        toDie.append(x + y*self.width)
+                else:
+                    if count == 3:
+                        toLive.append(x + y*self.width)
+
+        for i in range(len(toDie)):
+            self.grid[toDie[i]] = False
+        for i in range(len(toLive)):
+            self.grid[toLive[i]] = True
+
+    def population(self):
+        count = 0
+        for cell in self.grid:
+            if cell:
+                count += 1
+        return count
+
+gol = GoL(30, 30, 42)
+for generation in range(10):
+    gol.iter()
+    print generation, gol.population()
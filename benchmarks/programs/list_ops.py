@@ -0,0 +1,20 @@
+l = []
+for i in range(20000):
+    l.append(i % 97)
+
+total = 0
+for x in l:
+    total += x
+for i in range(len(l)):
+    l[i] = l[i] + 1
+
+l.sort()
+r = sorted(l, reverse=True)
+s = l[100:5000]
+while len(s) > 100:
+    s.pop()
+l.extend(s)
+l.insert(0, 5)
+l.reverse()
+
+print total, len(l), len(r), r[0], l[-1], l.index(5), l.count(3)
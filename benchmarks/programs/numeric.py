@@ -0,0 +1,33 @@
+def collatz(n):
+    steps = 0
+    while n != 1:
+        if n % 2 == 0:
+            n = n // 2
+        else:
+            n = 3 * n + 1
+        steps += 1
+    return steps
+
+def mandel(w, h, iterations):
+    count = 0
+    for y in range(h):
+        for x in range(w):
+            cr = 3.0 * x / w - 2.0
+            ci = 2.0 * y / h - 1.0
+            zr = 0.0
+            zi = 0.0
+            i = 0
+            while i < iterations and zr * zr + zi * zi < 4.0:
+                zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+                i += 1
+            if i == iterations:
+                count += 1
+    return count
+
+best = 0
+for n in range(1, 2000):
+    steps = collatz(n)
+    if steps > best:
+        best = steps
+
+print best, mandel(40, 30, 50)
@@ -0,0 +1,21 @@
+words = []
+for i in range(5000):
+    words.append("word%d" % (i % 300))
+
+text = " ".join(words)
+parts = text.split(" ")
+counts = {}
+for w in parts:
+    counts[w] = counts.get(w, 0) + 1
+
+s = ""
+for i in range(2000):
+    s += str(i)
+
+upper = text.upper()
+found = 0
+for w in parts[:2000]:
+    if w.startswith("word1") and w in upper.lower():
+        found += 1
+
+print len(text), len(counts), len(s), found, text.find("word299"), upper[:10]
@@ -0,0 +1,249 @@
+#! /usr/bin/python
+######################################################################
+##
+## Copyright 2013 Christian Iversen <ci@sikkerhed.org>
+##
+## Permission is hereby granted, free of charge, to any person
+## obtaining a copy of this software and associated documentation
+## files (the "Software"), to deal in the Software without
+## restriction, including without limitation the rights to use,
+## copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the
+## Software is furnished to do so, subject to the following
+## conditions:
+##
+## The above copyright notice and this permission notice shall be
+## included in all copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+## EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+## OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+## NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+## HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+## WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+## OTHER DEALINGS IN THE SOFTWARE.
+##
+######################################################################
+
+"""
+pyjaco benchmarks.
+
+Times the compiler phase by phase on sources of growing size, and the
+compiled programs under a local javascript shell. The results are
+written as JSON, so they can be compared between releases.
+"""
+
+import os
+import sys
+import ast
+import glob
+import json
+import time
+import optparse
+import platform
+import datetime
+import tempfile
+import subprocess
+from distutils.spawn import find_executable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pyjaco
+from pyjs import BuiltinGenerator
+
+## Javascript shells, in order of preference, with the arguments needed
+## to run a file, and the code making print() the output method of the
+## runtime
+ENGINES = [
+    ("js",   ["-f"], 'delete this.console;'),
+    ("d8",   [],     'delete this.console;'),
+    ("node", [],     'var console, print = function(s) { process.stdout.write(s + "\\n"); };'),
+    ]
+
+PROGRAMS = sorted(glob.glob(os.path.join(ROOT, "benchmarks", "programs", "*.py"))) + \
+           sorted(glob.glob(os.path.join(ROOT, "tests", "algorithms", "*.py")))
+
+## The examples only compile piecewise through the decorators, so the
+## compiler is timed on the programs, which include headless versions of
+## examples/gol.py and examples/triangulation.py
+COMPILE_SOURCES = PROGRAMS
+
+COMPILE_SIZES = [1, 2, 4, 8]
+
+PHASES = ["parse", "ist", "fold", "infer", "typer", "jsfier", "printer"]
+
+def relpath(path):
+    return os.path.relpath(path, ROOT)
+
+def median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    else:
+        return (values[mid - 1] + values[mid]) / 2.0
+
+def summary(times):
+    return dict(times = times, min = min(times), median = median(times))
+
+def find_engine(name = None):
+    for engine, args, prelude in ENGINES:
+        if name and name != engine:
+            continue
+        path = find_executable(engine)
+        if path:
+            return engine, [path] + args, prelude
+    return None, None, None
+
+def compile_phases(source):
+    """Compiles [source] once, returning the time spent in each phase"""
+    comp = pyjaco.Compiler()
+    res = dict()
+
+    def timed(phase, func, arg):
+        start = time.time()
+        value = func(arg)
+        res[phase] = time.time() - start
+        return value
+
+    tree = timed("parse",   ast.parse,                  source)
+    tree = timed("ist",     comp.compiler.compiler.comp, tree)
+    tree = timed("fold",    comp.folder.compute,        tree)
+    tree = timed("infer",   comp.inference.compute,     tree)
+    tree = timed("typer",   comp.typer.compute,         tree)
+    tree = timed("jsfier",  comp.jsfier.compute,        tree)
+    timed("printer", comp.jsprinter.format, tree)
+    return res
+
+def bench_compile(repeat):
+    corpus = "\n".join(file(path).read() for path in COMPILE_SOURCES)
+    results = []
+    for size in COMPILE_SIZES:
+        source = "\n".join([corpus] * size)
+        runs = [compile_phases(source) for x in range(repeat)]
+        phases = dict((phase, summary([run[phase] for run in runs])) for phase in PHASES)
+        total = summary([sum(run.values()) for run in runs])
+        lines = source.count("\n") + 1
+        results.append(dict(
+                size = size,
+                lines = lines,
+                bytes = len(source),
+                phases = phases,
+                total = total,
+                lines_per_second = lines / total["min"]))
+        print >> sys.stderr, "compile  x%-3d %6d lines  %8.3fs" % (size, lines, total["min"])
+    return results
+
+def run_timed(command):
+    start = time.time()
+    proc = subprocess.Popen(command, stdout = subprocess.PIPE, stderr = subprocess.PIPE, cwd = ROOT)
+    out, err = proc.communicate()
+    return time.time() - start, proc.returncode, out
+
+def compile_program(source, builtins, directory, name):
+    path = os.path.join(directory, name + ".js")
+    js = file(path, "w")
+    js.write(builtins)
+    js.write("\n")
+    js.write(pyjaco.compile_string(source))
+    js.close()
+    return path
+
+def bench_runtime(engine, prelude, programs, repeat):
+    builtins = prelude + "\n" + BuiltinGenerator().generate_builtins()
+    directory = tempfile.mkdtemp(prefix = "pyjaco-bench-")
+
+    empty = compile_program("pass", builtins, directory, "empty")
+    startup = summary([run_timed(engine + [empty])[0] for x in range(repeat)])
+    print >> sys.stderr, "startup  %8.3fs" % startup["min"]
+
+    results = []
+    for index, path in enumerate(programs):
+        name = relpath(path)
+        pytime, pycode, expected = run_timed([sys.executable, path])
+        script = compile_program(file(path).read(), builtins, directory, "%d" % index)
+
+        times, ok = [], pycode == 0
+        for x in range(repeat):
+            elapsed, code, out = run_timed(engine + [script])
+            times.append(elapsed)
+            ok = ok and code == 0 and out == expected
+
+        res = summary(times)
+        res.update(name = name, net = max(0.0, res["min"] - startup["min"]), python = pytime, ok = ok)
+        results.append(res)
+        print >> sys.stderr, "runtime  %-40s %8.3fs%s" % (name, res["min"], "" if ok else "  (output differs)")
+
+    for x in os.listdir(directory):
+        os.remove(os.path.join(directory, x))
+    os.rmdir(directory)
+    return dict(startup = startup, programs = results)
+
+def main():
+    option_parser = optparse.OptionParser(
+        usage="%prog [options] [programs]",
+        description="pyjaco benchmarks. Runs the benchmark programs, or the given programs."
+        )
+    option_parser.add_option(
+        "-e",
+        "--engine",
+        dest="engine",
+        default=None,
+        help="javascript shell to use (%s). Default is the first one found" % ", ".join(x[0] for x in ENGINES)
+        )
+    option_parser.add_option(
+        "-n",
+        "--repeat",
+        type="int",
+        dest="repeat",
+        default=3,
+        help="number of times to run each benchmark"
+        )
+    option_parser.add_option(
+        "-o",
+        "--output",
+        dest="output",
+        default=None,
+        help="write the JSON results to this file, instead of standard output"
+        )
+    option_parser.add_option(
+        "--compile-only",
+        action="store_true",
+        dest="compile_only",
+        default=False,
+        help="only time the compiler"
+        )
+    option_parser.add_option(
+        "--runtime-only",
+        action="store_true",
+        dest="runtime_only",
+        default=False,
+        help="only time the compiled programs"
+        )
+    options, args = option_parser.parse_args()
+
+    results = dict(
+        date = datetime.datetime.utcnow().isoformat(),
+        python = platform.python_version(),
+        platform = platform.platform(),
+        repeat = options.repeat)
+
+    if not options.runtime_only:
+        results["compile"] = bench_compile(options.repeat)
+
+    if not options.compile_only:
+        name, engine, prelude = find_engine(options.engine)
+        if not engine:
+            option_parser.error("No javascript shell found")
+        results["engine"] = dict(name = name, path = engine[0])
+        programs = [os.path.abspath(x) for x in args] or PROGRAMS
+        results["runtime"] = bench_runtime(engine, prelude, programs, options.repeat)
+
+    output = file(options.output, "w") if options.output else sys.stdout
+    json.dump(results, output, indent = 2, sort_keys = True)
+    output.write("\n")
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,9 @@
 ######################################################################
 
 import pyjaco.compiler.istcompiler
+import pyjaco.compiler.istinfer
+import pyjaco.compiler.isttyper
+import pyjaco.compiler.istfold
 import pyjaco.compiler.pyprinter
 import pyjaco.compiler.jsprinter
 import pyjaco.compiler.jsfier
@@ -64,19 +67,28 @@ class Compiler(object):
     re_comment = re.compile("^[ ]*#")
 
     def __init__(self, jsvars = None, opts = dict()):
-        defaults = dict(check_params = True)
+        defaults = dict(check_params = True, native_numbers = True, es6_generators = False)
 
         compiler_opts = dict()
         compiler_opts.update(defaults)
         compiler_opts.update(opts)
+        Transformer = pyjaco.compiler.jsfier.Transformer
         self.compiler  = pyjaco.compiler.istcompiler.Compiler()
-        self.jsfier    = pyjaco.compiler.jsfier.Transformer()
+        self.folder    = pyjaco.compiler.istfold.Folder()
+        reserved = Transformer.builtin_names + Transformer.name_map.keys()
+        self.inference = pyjaco.compiler.istinfer.Inference(reserved = reserved)
+        self.typer     = pyjaco.compiler.isttyper.Typer(reserved = reserved)
+        self.jsfier    = Transformer(native_numbers = compiler_opts["native_numbers"],
+                                     es6_generators = compiler_opts["es6_generators"])
         self.jsprinter = pyjaco.compiler.jsprinter.Printer()
         self.buffer = None
         self.reset()
 
     def _compile(self, ast):
         ist = self.compiler.compile(ast)
+        ist = self.folder.compute(ist)
+        ist = self.inference.compute(ist)
+        ist = self.typer.compute(ist)
         js  = self.jsfier.compute(ist)
         return self.jsprinter.format(js)
 
@@ -178,7 +190,11 @@ class Compiler(object):
         return "\n".join(res)
 
     def compile_data(self, key, value):
-        return "var %s = %s" % (key, self._compile(repr(value)))
+        return "var %s = %s" % (key, self.compile_expr(value))
 
     def compile_expr(self, value):
-        return self._compile(repr(value))
+        self.jsfier.hoist = False
+        try:
+            return self._compile(repr(value))
+        finally:
+            self.jsfier.hoist = True
@@ -25,7 +25,7 @@
 ##
 ######################################################################
 
-__all__ = ["ISTNode", "Annotation", "Comment", "Code", "Nop", "Function", "Parameters", "Statement", "Module", "If", "While", "TryExcept", "For", "ForEach", "Raise", "Break", "Continue", "Return", "ClassDef", "Call", "Assign", "BinOp", "Number", "GetAttr", "Name", "String", "TryExcept", "TryFinally", "TryHandler", "Tuple", "List", "AugAssign", "Delete", "BoolOp", "Compare", "GetItem", "Lambda", "UnaryOp", "Dict", "Global", "Yield", "Slice", "Generator", "ListComp", "Comprehension", "Import", "ImportFrom", "IfExp", "Assert", "Var"]
+__all__ = ["ISTNode", "Annotation", "Comment", "Code", "Nop", "Function", "Parameters", "Statement", "Module", "If", "While", "TryExcept", "For", "ForEach", "Raise", "Break", "Continue", "Return", "ClassDef", "Call", "Assign", "BinOp", "Number", "GetAttr", "Name", "String", "TryExcept", "TryFinally", "TryHandler", "Tuple", "List", "AugAssign", "Delete", "BoolOp", "Compare", "GetItem", "Lambda", "UnaryOp", "Dict", "Set", "Global", "Yield", "Slice", "Generator", "ListComp", "SetComp", "Comprehension", "Import", "ImportFrom", "IfExp", "Assert", "Var", "Switch", "Case"]
 
 class ISTNode(object):
 
@@ -189,8 +189,8 @@ class GetItem(Code):
     _fields = ["value", "slice"]
 
 class Lambda(Code):
-    _fields = ["body", "params", "name"]
-    _defaults = dict(name = "")
+    _fields = ["body", "params", "name", "generator"]
+    _defaults = dict(name = "", generator = False)
 
 class UnaryOp(Code):
     _fields = ["op", "lvalue"]
@@ -198,6 +198,9 @@ class UnaryOp(Code):
 class Dict(Code):
     _fields = ["keys", "values"]
 
+class Set(Code):
+    _fields = ["values"]
+
 class Global(Code):
     _fields = ["names"]
 
@@ -213,6 +216,9 @@ class Generator(Code):
 class ListComp(Code):
     _fields = ["expr", "generators"]
 
+class SetComp(Code):
+    _fields = ["expr", "generators"]
+
 class Comprehension(Code):
     _fields = ["conds", "iter", "target"]
 
@@ -231,3 +237,9 @@ class Assert(Code):
 class Var(Code):
     _fields = ["name", "expr"]
     _defaults = dict(expr = None)
+
+class Switch(Code):
+    _fields = ["expr", "cases"]
+
+class Case(Code):
+    _fields = ["value", "body"]
@@ -209,11 +209,14 @@ class ISTCompiler(Multiplexer):
     def node_dict(self, node):
         return Dict(keys = self.comp(node.keys), values = self.comp(node.values))
 
+    def node_set(self, node):
+        return Set(values = self.comp(node.elts))
+
     def node_global(self, node):
         return Global(names = node.names[:])
 
     def node_yield(self, node):
-        return Yield(value = self.comp(node.value))
+        return Yield(value = self.comp(node.value) if node.value else None)
 
     def node_slice(self, node):
         if node.lower:
@@ -241,6 +244,9 @@ class ISTCompiler(Multiplexer):
     def node_listcomp(self, node):
         return ListComp(expr = self.comp(node.elt), generators = self.comp(node.generators))
 
+    def node_setcomp(self, node):
+        return SetComp(expr = self.comp(node.elt), generators = self.comp(node.generators))
+
     def node_importfrom(self, node):
         assert node.level == 0
         names = dict()
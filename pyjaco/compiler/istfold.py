@@ -0,0 +1,173 @@
+######################################################################
+##
+## Copyright 2013 Christian Iversen <ci@sikkerhed.org>
+##
+## Permission is hereby granted, free of charge, to any person
+## obtaining a copy of this software and associated documentation
+## files (the "Software"), to deal in the Software without
+## restriction, including without limitation the rights to use,
+## copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the
+## Software is furnished to do so, subject to the following
+## conditions:
+##
+## The above copyright notice and this permission notice shall be
+## included in all copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+## EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+## OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+## NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+## HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+## WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+## OTHER DEALINGS IN THE SOFTWARE.
+##
+######################################################################
+
+import ist
+import operator
+import isttransform
+from istinfer import walk
+
+MAX_NATIVE = 2**53
+
+## Largest string made by folding a repetition
+MAX_STRING = 1024
+
+binops = {
+    "Add"     : operator.add,
+    "Sub"     : operator.sub,
+    "Mult"    : operator.mul,
+    "Div"     : operator.div,
+    "FloorDiv": operator.floordiv,
+    "Mod"     : operator.mod,
+    "Pow"     : operator.pow,
+    "BitAnd"  : operator.and_,
+    "BitOr"   : operator.or_,
+    "BitXor"  : operator.xor,
+    "LShift"  : operator.lshift,
+    "RShift"  : operator.rshift,
+}
+
+unaryops = {
+    "UAdd"  : operator.pos,
+    "USub"  : operator.neg,
+    "Invert": operator.invert,
+    "Not"   : operator.not_,
+}
+
+## Builtins evaluated at compile time, when called on literals
+builtins = {
+    "len": len,
+    "abs": abs,
+    "ord": ord,
+    "chr": lambda x: chr(x) if x < 128 else None,
+}
+
+def literal(node):
+    """The python value of [node], if it is a number or string literal"""
+    if isinstance(node, (ist.Number, ist.String)):
+        return node.value
+    elif isinstance(node, ist.Tuple) and all(isinstance(x, (ist.Number, ist.String)) for x in node.values):
+        return tuple(x.value for x in node.values)
+    else:
+        raise ValueError()
+
+def make(value):
+    """A literal node for [value], or None if javascript cannot hold it"""
+    if isinstance(value, bool):
+        return ist.Name(id = str(value))
+    elif isinstance(value, (int, long)) and -MAX_NATIVE <= value <= MAX_NATIVE:
+        return ist.Number(value = int(value))
+    elif isinstance(value, float) and value - value == 0:
+        return ist.Number(value = value)
+    elif isinstance(value, basestring) and len(value) <= MAX_STRING:
+        return ist.String(value = value)
+    else:
+        return None
+
+def rebound(tree):
+    """Names bound anywhere in [tree]"""
+    res = set()
+    for node in walk(tree):
+        targets = []
+        if isinstance(node, ist.Assign):
+            targets = node.lvalue
+        elif isinstance(node, (ist.AugAssign, ist.ForEach, ist.Comprehension)):
+            targets = node.target
+        elif isinstance(node, ist.TryHandler):
+            targets = node.name
+        elif isinstance(node, (ist.Function, ist.ClassDef)):
+            res.add(node.name)
+        elif isinstance(node, ist.Parameters):
+            res.update(node.args)
+            res.update([x for x in (node.varargs, node.kwargs) if x])
+        elif isinstance(node, (ist.Import, ist.ImportFrom)):
+            res.update([v or k.split(".")[0] for k, v in node.names.iteritems()])
+        elif isinstance(node, ist.Global):
+            res.update(node.names)
+        res.update(x.id for x in walk(targets) if isinstance(x, ist.Name))
+    return res
+
+class Folder(isttransform.Transformer):
+    """
+    Pass run between the IST compiler and the type inference.
+
+    Replaces operators and calls of a few builtins on number and string
+    literals with their result, as computed by python, so 2*3 and
+    len("abc") compile to constants. Results javascript cannot hold
+    exactly, like large integers, are left to the runtime.
+    """
+
+    def compute(self, tree):
+        self.future_division = False
+        if isinstance(tree, ist.Module):
+            for st in tree.body:
+                if isinstance(st, ist.ImportFrom) and st.module == "__future__" and "division" in st.names:
+                    self.future_division = True
+        self.shadowed = rebound(tree)
+        return self.comp(tree)
+
+    def fold(self, node, func, *args):
+        try:
+            values = [literal(x) for x in args]
+            res = func(*values)
+        except (ValueError, TypeError, ArithmeticError):
+            return node
+        return make(res) or node
+
+    def node_binop(self, node):
+        node.left = self.comp(node.left)
+        node.right = self.comp(node.right)
+        func = binops[node.op]
+        if node.op == "Div" and self.future_division:
+            func = operator.truediv
+        elif node.op in ("Pow", "LShift", "Mult"):
+            ## Keeps the work bounded, before make() rejects the result
+            try:
+                left, right = literal(node.left), literal(node.right)
+            except ValueError:
+                return node
+            if node.op == "Mult" and isinstance(left, (int, long)):
+                left, right = right, left
+            if isinstance(right, (int, long)) and abs(right) > MAX_STRING and not (node.op == "Mult" and isinstance(left, (int, long, float))):
+                return node
+        return self.fold(node, func, node.left, node.right)
+
+    def node_unaryop(self, node):
+        node.lvalue = self.comp(node.lvalue)
+        return self.fold(node, unaryops[node.op], node.lvalue)
+
+    def node_call(self, node):
+        node.func = self.comp(node.func)
+        node.args = self.comp(node.args)
+        node.keywords = [(k, self.comp(v)) for k, v in node.keywords or []]
+        if node.varargs:
+            node.varargs = self.comp(node.varargs)
+        if node.kwargs:
+            node.kwargs = self.comp(node.kwargs)
+        if isinstance(node.func, ist.Name) and node.func.id in builtins and not node.func.id in self.shadowed and \
+                len(node.args) == 1 and not (node.keywords or node.varargs or node.kwargs):
+            return self.fold(node, builtins[node.func.id], node.args[0])
+        return node
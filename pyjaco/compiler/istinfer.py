@@ -0,0 +1,644 @@
+######################################################################
+##
+## Copyright 2013 Christian Iversen <ci@sikkerhed.org>
+##
+## Permission is hereby granted, free of charge, to any person
+## obtaining a copy of this software and associated documentation
+## files (the "Software"), to deal in the Software without
+## restriction, including without limitation the rights to use,
+## copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the
+## Software is furnished to do so, subject to the following
+## conditions:
+##
+## The above copyright notice and this permission notice shall be
+## included in all copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+## EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+## OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+## NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+## HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+## WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+## OTHER DEALINGS IN THE SOFTWARE.
+##
+######################################################################
+
+"""
+Flow-sensitive local type inference over the IST.
+
+Every expression node visited gets an [itype] attribute, holding the
+type the expression is known to evaluate to, or ANY. Types of builtin
+values are the names of their python types ("int", "str", ...), and
+instances of classes defined in the compiled code are written as
+"<Name>" (see instance()).
+"""
+
+import ist
+
+INT     = "int"
+FLOAT   = "float"
+BOOL    = "bool"
+STR     = "str"
+LIST    = "list"
+DICT    = "dict"
+SET     = "set"
+TUPLE   = "tuple"
+NONE    = "NoneType"
+ANY     = None
+
+## Types whose comparison operators always return True or False
+SCALARS = (INT, FLOAT, BOOL, STR, NONE)
+NUMBERS = (INT, FLOAT, BOOL)
+
+MAX_NATIVE = 2**53
+
+## Result types of builtin functions, whatever their arguments
+builtin_results = {
+    "int"       : INT,
+    "float"     : FLOAT,
+    "str"       : STR,
+    "repr"      : STR,
+    "chr"       : STR,
+    "hex"       : STR,
+    "oct"       : STR,
+    "bin"       : STR,
+    "list"      : LIST,
+    "range"     : LIST,
+    "sorted"    : LIST,
+    "dict"      : DICT,
+    "set"       : SET,
+    "tuple"     : TUPLE,
+    "bool"      : BOOL,
+    "callable"  : BOOL,
+    "hasattr"   : BOOL,
+    "isinstance": BOOL,
+    "issubclass": BOOL,
+    "len"       : INT,
+    "ord"       : INT,
+    "hash"      : INT,
+    "id"        : INT,
+}
+
+## Result types of methods on builtin values
+method_results = {
+    STR: {
+        "join"      : STR,
+        "upper"     : STR,
+        "lower"     : STR,
+        "strip"     : STR,
+        "lstrip"    : STR,
+        "rstrip"    : STR,
+        "replace"   : STR,
+        "split"     : LIST,
+        "find"      : INT,
+        "index"     : INT,
+        "count"     : INT,
+        "startswith": BOOL,
+        "endswith"  : BOOL,
+    },
+    LIST: {
+        "index"     : INT,
+        "count"     : INT,
+    },
+    TUPLE: {
+        "index"     : INT,
+        "count"     : INT,
+    },
+    ## keys(), values() and items() return views under python 3 semantics
+    DICT: {
+        "has_key"   : BOOL,
+    },
+}
+
+def instance(name):
+    return "<%s>" % name
+
+def classtype(name):
+    return "<class %s>" % name
+
+def join(a, b):
+    return a if a == b else ANY
+
+def join_env(a, b):
+    """Join two environments. None is an environment never reached."""
+    if a is None:
+        return b
+    elif b is None:
+        return a
+    res = dict()
+    for k in a:
+        if k in b and a[k] == b[k]:
+            res[k] = a[k]
+    return res
+
+def assigned(nodes):
+    """Names bound anywhere in [nodes], not counting nested scopes"""
+    return set(bindings(nodes))
+
+def bindings(nodes):
+    """List of names bound in [nodes], once for every binding statement"""
+    res = []
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, ist.Name):
+            res.append(node.id)
+        elif isinstance(node, (ist.Function, ist.ClassDef)):
+            res.append(node.name)
+        elif isinstance(node, (ist.Import, ist.ImportFrom)):
+            res.extend([v or k.split(".")[0] for k, v in node.names.iteritems()])
+        elif isinstance(node, ist.Assign):
+            stack.extend(node.lvalue)
+        elif isinstance(node, ist.AugAssign):
+            stack.append(node.target)
+        elif isinstance(node, (ist.ForEach, ist.Comprehension)):
+            stack.append(node.target)
+            stack.append(node.body if isinstance(node, ist.ForEach) else [])
+            stack.append(node.orelse if isinstance(node, ist.ForEach) else [])
+        elif isinstance(node, ist.ListComp):
+            stack.extend(node.generators)
+        elif isinstance(node, ist.TryHandler):
+            stack.append(node.body)
+            if node.name:
+                stack.append(node.name)
+        elif isinstance(node, (ist.Tuple, ist.List)):
+            stack.extend(node.values)
+        elif isinstance(node, ist.Delete):
+            stack.extend(node.targets)
+        elif isinstance(node, (ist.If, ist.While)):
+            stack.extend([node.body, node.orelse])
+        elif isinstance(node, ist.TryExcept):
+            stack.extend([node.body, node.handlers, node.orelse])
+        elif isinstance(node, ist.TryFinally):
+            stack.extend([node.body, node.finalbody])
+    return res
+
+def declared_globals(body):
+    """Names declared global in [body], not counting nested scopes"""
+    res = set()
+    stack = list(body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, ist.Global):
+            res.update(node.names)
+        elif isinstance(node, ist.ISTNode) and not isinstance(node, (ist.Function, ist.ClassDef, ist.Lambda)):
+            stack.extend(getattr(node, f) for f in node._fields)
+    return res
+
+def walk(node):
+    """Yield [node] and all nodes below it"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, tuple):
+            stack.extend(node)
+        elif isinstance(node, ist.ISTNode):
+            yield node
+            stack.extend(getattr(node, f) for f in node._fields)
+
+class Loop(object):
+
+    def __init__(self):
+        self.breaks = None
+        self.continues = None
+
+class Inference(object):
+    """
+    Analysis pass run between the IST compiler and the jsfier.
+
+    Module, class and function bodies are each walked once in program
+    order, keeping an environment of the known types of local names.
+    Branches are joined where they meet, and loops are iterated until
+    their environment is stable.
+    """
+
+    def __init__(self, reserved = ()):
+        self.reserved = set(reserved)
+
+    def compute(self, tree):
+        self.future_division = False
+        if isinstance(tree, ist.Module):
+            for st in tree.body:
+                if isinstance(st, ist.ImportFrom) and st.module == "__future__" and "division" in st.names:
+                    self.future_division = True
+            body = tree.body
+        else:
+            body = [tree]
+
+        ## Names declared global anywhere can change behind our back
+        self.globals = set()
+        for node in walk(tree):
+            if isinstance(node, ist.Global):
+                self.globals.update(node.names)
+
+        ## Classes bound once at module level are known everywhere
+        names = bindings(body)
+        self.classes = dict()
+        for st in body:
+            if isinstance(st, ist.ClassDef) and not st.decorators and names.count(st.name) == 1 and \
+                    not st.name in self.globals and not st.name in self.reserved:
+                self.classes[st.name] = classtype(st.name)
+
+        self.loops = []
+        self.untracked = set()
+        self.shadowed = set()
+        self.scope(body, self.globals)
+        return tree
+
+    def scope(self, body, untracked = (), params = ()):
+        saved = self.loops, self.untracked, self.shadowed
+        local = assigned(body) | set(params)
+        env = dict((k, v) for k, v in self.classes.iteritems() if not k in local)
+        self.loops = []
+        self.untracked = set(untracked) | declared_globals(body)
+        self.shadowed = self.shadowed | local | self.untracked
+        self.block(body, env)
+        self.loops, self.untracked, self.shadowed = saved
+
+    ## Statements. Each returns the environment after the statement, or
+    ## None if control never continues past it.
+
+    def block(self, body, env):
+        for st in body:
+            if env is None:
+                ## Unreachable code, typed as unknown
+                env = self.stmt(st, dict())
+                env = None
+            else:
+                env = self.stmt(st, env)
+        return env
+
+    def stmt(self, node, env):
+        name = "stmt_%s" % node.__class__.__name__.lower()
+        if hasattr(self, name):
+            return getattr(self, name)(node, env)
+        else:
+            self.expr(node, env)
+            return env
+
+    def bind(self, target, t, env):
+        if isinstance(target, ist.Name):
+            if target.id in self.untracked:
+                env.pop(target.id, None)
+            elif t is ANY:
+                env.pop(target.id, None)
+            else:
+                env[target.id] = t
+            target.itype = t
+        elif isinstance(target, (ist.Tuple, ist.List)):
+            for x in target.values:
+                self.bind(x, ANY, env)
+        else:
+            self.expr(target, env)
+
+    def unbind(self, names, env):
+        for name in names:
+            env.pop(name, None)
+        return env
+
+    def stmt_assign(self, node, env):
+        t = self.expr(node.rvalue, env)
+        for lvalue in node.lvalue:
+            if isinstance(lvalue, (ist.Tuple, ist.List)) and isinstance(node.rvalue, ist.Tuple) and \
+                    len(lvalue.values) == len(node.rvalue.values):
+                for target, value in zip(lvalue.values, node.rvalue.values):
+                    self.bind(target, value.itype, env)
+            else:
+                self.bind(lvalue, t, env)
+        return env
+
+    def stmt_augassign(self, node, env):
+        left = self.expr(node.target, env)
+        right = self.expr(node.value, env)
+        if left == LIST and node.op == "Add":
+            t = LIST
+        else:
+            t = self.binop(node.op, left, right)
+        if isinstance(node.target, ist.Name):
+            self.bind(node.target, t, env)
+        return env
+
+    def stmt_delete(self, node, env):
+        for target in node.targets:
+            if isinstance(target, ist.Name):
+                env.pop(target.id, None)
+            else:
+                self.expr(target, env)
+        return env
+
+    def stmt_global(self, node, env):
+        self.untracked.update(node.names)
+        return self.unbind(node.names, env)
+
+    def stmt_import(self, node, env):
+        return self.unbind([v or k.split(".")[0] for k, v in node.names.iteritems()], env)
+
+    def stmt_importfrom(self, node, env):
+        return self.unbind([v or k for k, v in node.names.iteritems()], env)
+
+    def stmt_return(self, node, env):
+        if node.expr:
+            self.expr(node.expr, env)
+        return None
+
+    def stmt_raise(self, node, env):
+        if node.expr:
+            self.expr(node.expr, env)
+        return None
+
+    def stmt_break(self, node, env):
+        if self.loops:
+            self.loops[-1].breaks = join_env(self.loops[-1].breaks, env)
+        return None
+
+    def stmt_continue(self, node, env):
+        if self.loops:
+            self.loops[-1].continues = join_env(self.loops[-1].continues, env)
+        return None
+
+    def stmt_if(self, node, env):
+        self.expr(node.cond, env)
+        body = self.block(node.body, dict(env))
+        orelse = self.block(node.orelse, dict(env))
+        return join_env(body, orelse)
+
+    def loop(self, node, env, enter):
+        """
+        Find the environment at the head of a loop. [enter] binds the
+        loop variables (if any) at the start of an iteration.
+        """
+        head = dict(env)
+        while True:
+            self.loops.append(Loop())
+            body = self.block(node.body, enter(dict(head)))
+            loop = self.loops.pop()
+            new = join_env(head, join_env(body, loop.continues))
+            if new == head:
+                break
+            head = new
+        after = self.block(node.orelse, dict(head))
+        return join_env(after, loop.breaks)
+
+    def stmt_while(self, node, env):
+        def enter(env):
+            self.expr(node.cond, env)
+            return env
+        res = self.loop(node, env, enter)
+        return res
+
+    def stmt_foreach(self, node, env):
+        t = self.elemtype(node.iter, env)
+        def enter(env):
+            self.bind(node.target, t, env)
+            return env
+        return self.loop(node, env, enter)
+
+    def stmt_tryexcept(self, node, env):
+        ## An exception can happen anywhere in the body, so assume
+        ## nothing about what it assigns.
+        clobbered = self.unbind(assigned(node.body), dict(env))
+        res = self.block(node.body, dict(env))
+        res = self.block(node.orelse, res) if res is not None else None
+        for handler in node.handlers:
+            henv = dict(clobbered)
+            if handler.type:
+                self.expr(handler.type, henv)
+            if handler.name:
+                self.bind(handler.name, ANY, henv)
+            res = join_env(res, self.block(handler.body, henv))
+        return res
+
+    def stmt_tryfinally(self, node, env):
+        clobbered = self.unbind(assigned(node.body), dict(env))
+        res = self.block(node.body, dict(env))
+        final = self.block(node.finalbody, join_env(res, clobbered))
+        if res is None:
+            return None
+        else:
+            return final
+
+    def stmt_function(self, node, env):
+        for x in node.decorators:
+            self.expr(x, env)
+        self.params(node.params, env)
+        self.scope(node.body, params = self.paramnames(node.params))
+        self.bind(ist.Name(id = node.name), ANY, env)
+        return env
+
+    def stmt_classdef(self, node, env):
+        for x in node.bases + node.decorators:
+            self.expr(x, env)
+        self.scope(node.body)
+        if node.decorators or node.name in self.reserved:
+            t = ANY
+        else:
+            t = classtype(node.name)
+        self.bind(ist.Name(id = node.name), t, env)
+        return env
+
+    def params(self, node, env):
+        for x in node.defaults:
+            self.expr(x, env)
+
+    def paramnames(self, node):
+        return node.args + [x for x in (node.varargs, node.kwargs) if x]
+
+    ## Expressions. Each annotates the node, and returns its type.
+
+    def expr(self, node, env):
+        if isinstance(node, list):
+            for x in node:
+                self.expr(x, env)
+            return ANY
+        elif not isinstance(node, ist.ISTNode):
+            return ANY
+        name = "expr_%s" % node.__class__.__name__.lower()
+        if hasattr(self, name):
+            t = getattr(self, name)(node, env)
+        else:
+            for f in node._fields:
+                self.expr(getattr(node, f), env)
+            t = ANY
+        node.itype = t
+        return t
+
+    def expr_number(self, node, env):
+        if isinstance(node.value, float):
+            return FLOAT
+        elif -MAX_NATIVE <= node.value <= MAX_NATIVE:
+            return INT
+        else:
+            return ANY
+
+    def expr_string(self, node, env):
+        return STR
+
+    def expr_name(self, node, env):
+        if node.id in ("True", "False"):
+            return BOOL
+        elif node.id == "None":
+            return NONE
+        else:
+            return env.get(node.id, ANY)
+
+    def expr_list(self, node, env):
+        self.expr(node.values, env)
+        return LIST
+
+    def expr_tuple(self, node, env):
+        self.expr(node.values, env)
+        return TUPLE
+
+    def expr_dict(self, node, env):
+        self.expr(node.keys, env)
+        self.expr(node.values, env)
+        return DICT
+
+    def expr_set(self, node, env):
+        self.expr(node.values, env)
+        return SET
+
+    def binop(self, op, l, r):
+        if l in NUMBERS and r in NUMBERS:
+            if FLOAT in (l, r):
+                return FLOAT if op not in ("BitAnd", "BitOr", "BitXor", "LShift", "RShift") else ANY
+            elif op == "Div" and self.future_division:
+                return FLOAT
+            elif op == "Pow":
+                return ANY
+            else:
+                return INT
+        elif l == STR and (op == "Mod" or (op == "Add" and r == STR) or (op == "Mult" and r in (INT, BOOL))):
+            return STR
+        elif r == STR and op == "Mult" and l in (INT, BOOL):
+            return STR
+        elif l in (LIST, TUPLE) and ((op == "Add" and r == l) or (op == "Mult" and r in (INT, BOOL))):
+            return l
+        elif r in (LIST, TUPLE) and op == "Mult" and l in (INT, BOOL):
+            return r
+        else:
+            return ANY
+
+    def expr_binop(self, node, env):
+        l = self.expr(node.left, env)
+        r = self.expr(node.right, env)
+        return self.binop(node.op, l, r)
+
+    def expr_unaryop(self, node, env):
+        t = self.expr(node.lvalue, env)
+        if node.op == "Not":
+            return BOOL
+        elif t in NUMBERS and node.op in ("UAdd", "USub", "Invert"):
+            if t == FLOAT and node.op == "Invert":
+                return ANY
+            return INT if t == BOOL else t
+        else:
+            return ANY
+
+    def expr_boolop(self, node, env):
+        types = [self.expr(x, env) for x in node.values]
+        return reduce(join, types)
+
+    def expr_compare(self, node, env):
+        types = [self.expr(node.lvalue, env)] + [self.expr(x, env) for x in node.comps]
+        if all(op in ("Is", "IsNot") for op in node.ops):
+            return BOOL
+        elif all(t in SCALARS for t in types) and not any(op in ("In", "NotIn") for op in node.ops):
+            return BOOL
+        else:
+            return ANY
+
+    def expr_ifexp(self, node, env):
+        self.expr(node.cond, env)
+        return join(self.expr(node.body, env), self.expr(node.orelse, env))
+
+    def expr_getitem(self, node, env):
+        t = self.expr(node.value, env)
+        self.expr(node.slice, env)
+        if t == STR:
+            return STR
+        elif t in (LIST, TUPLE) and isinstance(node.slice, ist.Slice):
+            return t
+        else:
+            return ANY
+
+    def expr_slice(self, node, env):
+        for x in (node.lower, node.upper, node.step):
+            if x:
+                self.expr(x, env)
+        return ANY
+
+    def expr_call(self, node, env):
+        func = self.expr(node.func, env)
+        self.expr(node.args, env)
+        for k, v in node.keywords or []:
+            self.expr(v, env)
+        for x in (node.varargs, node.kwargs):
+            if x:
+                self.expr(x, env)
+
+        if isinstance(node.func, ist.Name) and node.func.id in builtin_results and \
+                node.func.id not in env and node.func.id not in self.shadowed:
+            return builtin_results[node.func.id]
+        elif func and func.startswith("<class "):
+            return instance(func[7:-1])
+        elif isinstance(node.func, ist.GetAttr) and node.func.base.itype in method_results:
+            return method_results[node.func.base.itype].get(node.func.attr, ANY)
+        else:
+            return ANY
+
+    def expr_getattr(self, node, env):
+        self.expr(node.base, env)
+        return ANY
+
+    def expr_lambda(self, node, env):
+        self.params(node.params, env)
+        saved = self.shadowed
+        self.shadowed = self.shadowed | set(self.paramnames(node.params))
+        self.expr(node.body, dict())
+        self.shadowed = saved
+        return ANY
+
+    def elemtype(self, node, env):
+        t = self.expr(node, env)
+        if isinstance(node, ist.Call) and isinstance(node.func, ist.Name) and node.func.id in ("range", "xrange") and \
+                node.func.id not in env and node.func.id not in self.shadowed:
+            return INT
+        elif t == STR:
+            return STR
+        else:
+            return ANY
+
+    def comprehension(self, node, env):
+        for gen in node.generators:
+            self.bind(gen.target, self.elemtype(gen.iter, env), env)
+            self.expr(gen.conds, env)
+            gen.itype = ANY
+        self.expr(node.expr, env)
+
+    def expr_listcomp(self, node, env):
+        inner = dict(env)
+        self.comprehension(node, inner)
+        ## List comprehensions leak their variables in python 2, with
+        ## the old value kept if nothing was iterated over
+        for name in assigned(node.generators):
+            if env.get(name) != inner.get(name):
+                env.pop(name, None)
+        return LIST
+
+    def expr_generator(self, node, env):
+        ## The body runs lazily, after the enclosing scope may have changed
+        self.comprehension(node, dict())
+        return ANY
+
+    def expr_setcomp(self, node, env):
+        self.comprehension(node, dict(env))
+        return SET
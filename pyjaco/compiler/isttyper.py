@@ -0,0 +1,260 @@
+######################################################################
+##
+## Copyright 2013 Christian Iversen <ci@sikkerhed.org>
+##
+## Permission is hereby granted, free of charge, to any person
+## obtaining a copy of this software and associated documentation
+## files (the "Software"), to deal in the Software without
+## restriction, including without limitation the rights to use,
+## copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the
+## Software is furnished to do so, subject to the following
+## conditions:
+##
+## The above copyright notice and this permission notice shall be
+## included in all copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+## EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+## OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+## NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+## HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+## WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+## OTHER DEALINGS IN THE SOFTWARE.
+##
+######################################################################
+
+import ist
+
+INT   = "int"
+FLOAT = "float"
+
+## Pseudo-types used while solving. UNSET means "no value seen yet",
+## and is optimistic. ANY means "could be anything", and is final.
+UNSET = "<unset>"
+ANY   = "<any>"
+
+MAX_NATIVE = 2**53
+
+ops_arith = ["Add", "Sub", "Mult", "Mod", "FloorDiv"]
+ops_bits  = ["BitAnd", "BitOr", "BitXor", "LShift", "RShift"]
+
+def join(a, b):
+    if a == UNSET:
+        return b
+    elif b == UNSET or a == b:
+        return a
+    else:
+        return ANY
+
+def numtype(node, env, future_division = False):
+    """
+    Returns INT or FLOAT if [node] can be evaluated as a plain javascript
+    number, given [env], a mapping of unboxed local names to their types.
+    """
+    if isinstance(node, ist.Number):
+        if isinstance(node.value, float):
+            return FLOAT
+        elif isinstance(node.value, (int, long)) and -MAX_NATIVE <= node.value <= MAX_NATIVE:
+            return INT
+        else:
+            return ANY
+    elif isinstance(node, ist.Name):
+        return env.get(node.id, ANY)
+    elif isinstance(node, ist.UnaryOp):
+        t = numtype(node.lvalue, env, future_division)
+        if node.op in ("UAdd", "USub") or (node.op == "Invert" and t in (INT, UNSET)):
+            return t
+        else:
+            return ANY
+    elif isinstance(node, ist.BinOp):
+        l = numtype(node.left, env, future_division)
+        r = numtype(node.right, env, future_division)
+        if ANY in (l, r):
+            return ANY
+        elif UNSET in (l, r):
+            return UNSET
+        elif node.op in ops_arith:
+            return FLOAT if FLOAT in (l, r) else INT
+        elif node.op == "Div":
+            return FLOAT if future_division or FLOAT in (l, r) else INT
+        elif node.op == "Pow":
+            if FLOAT in (l, r):
+                return FLOAT
+            elif isinstance(node.right, ist.Number) and node.right.value >= 0:
+                return INT
+            else:
+                return ANY
+        elif node.op in ops_bits:
+            return INT if l == r == INT else ANY
+        else:
+            return ANY
+    elif isinstance(node, ist.Call):
+        if isinstance(node.func, ist.Name) and node.func.id in ("int", "float") and not node.func.id in env and \
+                len(node.args) == 1 and not (node.keywords or node.varargs or node.kwargs):
+            return INT if node.func.id == "int" else FLOAT
+        elif islen(node) and not "len" in env:
+            return INT
+        else:
+            return ANY
+    else:
+        return ANY
+
+def islen(node):
+    """True if [node] is a direct call to the len builtin"""
+    return isinstance(node, ist.Call) and isinstance(node.func, ist.Name) and node.func.id == "len" and \
+        len(node.args) == 1 and not (node.keywords or node.varargs or node.kwargs)
+
+def isrange(node):
+    """True if [node] is a direct call to the range or xrange builtin"""
+    return isinstance(node, ist.Call) and isinstance(node.func, ist.Name) and node.func.id in ("range", "xrange") and \
+        1 <= len(node.args) <= 3 and not (node.keywords or node.varargs or node.kwargs)
+
+def ispairs(node):
+    """True if [node] is a "for a, b in ..." loop"""
+    return isinstance(node, ist.ForEach) and isinstance(node.target, ist.Tuple) and len(node.target.values) == 2 and \
+        all(isinstance(x, ist.Name) for x in node.target.values)
+
+def isitems(node):
+    """True if [node] is a call of the items or iteritems method"""
+    return isinstance(node, ist.Call) and isinstance(node.func, ist.GetAttr) and node.func.attr in ("items", "iteritems") and \
+        not (node.args or node.keywords or node.varargs or node.kwargs)
+
+class Scope(object):
+    """Bindings of a single function body, as seen by the number analysis"""
+
+    def __init__(self):
+        self.bindings = []
+        self.blocked = set()
+
+    def bind(self, target, expr):
+        if isinstance(target, ist.Name):
+            self.bindings.append((target.id, expr))
+        elif isinstance(target, (ist.Tuple, ist.List)):
+            self.block(target)
+
+    def block(self, node):
+        if isinstance(node, basestring):
+            self.blocked.add(node)
+            return
+        elif isinstance(node, ist.Name):
+            self.blocked.add(node.id)
+        elif isinstance(node, ist.Parameters):
+            self.blocked.update(node.args)
+            self.blocked.update([x for x in (node.varargs, node.kwargs) if x])
+        elif isinstance(node, (ist.Function, ist.ClassDef)):
+            self.blocked.add(node.name)
+        for x in children(node):
+            if isinstance(x, (ist.ISTNode, list)):
+                self.block(x)
+
+def children(node):
+    if isinstance(node, list):
+        return node
+    elif isinstance(node, tuple):
+        return list(node)
+    elif isinstance(node, dict):
+        return node.values()
+    elif isinstance(node, ist.ISTNode):
+        return [getattr(node, f) for f in node._fields]
+    else:
+        return []
+
+class Typer(object):
+    """
+    Analysis pass run between the IST compiler and the jsfier.
+
+    Decides which function locals are only ever assigned int (or only
+    ever assigned float) values, so the jsfier can keep them as plain
+    javascript numbers. The result is stored on every ist.Function as
+    [natives], a dict of name -> INT or FLOAT.
+    """
+
+    def __init__(self, reserved = ()):
+        self.reserved = set(reserved)
+
+    def compute(self, tree):
+        self.future_division = False
+        if isinstance(tree, ist.Module):
+            for st in tree.body:
+                if isinstance(st, ist.ImportFrom) and st.module == "__future__" and "division" in st.names:
+                    self.future_division = True
+        self.visit(tree)
+        return tree
+
+    def visit(self, node):
+        if isinstance(node, ist.Function):
+            self.function(node)
+        for x in children(node):
+            self.visit(x)
+
+    def function(self, node):
+        scope = Scope()
+        scope.block(node.params)
+        for st in node.body:
+            self.collect(st, scope)
+
+        env = dict()
+        for name, expr in scope.bindings:
+            if name in scope.blocked or name in self.reserved:
+                env[name] = ANY
+            else:
+                env[name] = UNSET
+        for name in scope.blocked:
+            env[name] = ANY
+
+        changed = True
+        while changed:
+            changed = False
+            for name, expr in scope.bindings:
+                if name in env:
+                    t = join(env[name], numtype(expr, env, self.future_division))
+                    if t != env[name]:
+                        env[name] = t
+                        changed = True
+
+        node.natives = dict((k, v) for k, v in env.iteritems() if v in (INT, FLOAT))
+
+    def collect(self, node, scope):
+        if isinstance(node, (ist.Function, ist.Lambda, ist.ClassDef, ist.Generator)):
+            if isinstance(node, (ist.Function, ist.ClassDef)):
+                scope.block(node.name)
+            ## Anything a nested scope touches is captured by a javascript
+            ## closure, and must stay boxed. Generator expressions are
+            ## compiled to nested functions too.
+            scope.block(node)
+        elif isinstance(node, ist.Assign):
+            for lvalue in node.lvalue:
+                scope.bind(lvalue, node.rvalue)
+                self.collect(lvalue, scope)
+            self.collect(node.rvalue, scope)
+        elif isinstance(node, ist.AugAssign):
+            scope.bind(node.target, ist.BinOp(left = node.target, right = node.value, op = node.op))
+            self.collect(node.target, scope)
+            self.collect(node.value, scope)
+        elif isinstance(node, ist.ForEach) and isinstance(node.target, ist.Name) and isrange(node.iter):
+            ## Compiled to a counting loop by the jsfier
+            scope.bind(node.target, ist.Number(value = 0))
+            for x in children(node):
+                self.collect(x, scope)
+        elif isinstance(node, (ist.ForEach, ist.Comprehension)):
+            scope.block(node.target)
+            for x in children(node):
+                self.collect(x, scope)
+        elif isinstance(node, ist.TryHandler):
+            if node.name:
+                scope.block(node.name)
+            for x in children(node):
+                self.collect(x, scope)
+        elif isinstance(node, ist.Global):
+            for x in node.names:
+                scope.block(x)
+        elif isinstance(node, ist.Delete):
+            scope.block(node)
+        elif isinstance(node, (ist.Import, ist.ImportFrom)):
+            for k, v in node.names.iteritems():
+                scope.block(v or k)
+        else:
+            for x in children(node):
+                self.collect(x, scope)
@@ -1,10 +1,15 @@
 import ist
 import sys
+import re
+import hashlib
 G = globals()
 for x in ist.__all__:
     G["I%s" % x] = getattr(ist, x)
 import istcompiler
 import isttransform
+import jsgenerator
+import istinfer
+import isttyper
 
 class Transformer(isttransform.Transformer):
 
@@ -58,6 +63,27 @@ class Transformer(isttransform.Transformer):
         'default': '$default',
     }
 
+    builtin_names = ["copyright", "credits", "license", "help"] + ["abs", "all", "any", "apply", "bin", "callable", "chr", "cmp", "coerce", "delattr", "dir", "enumerate", "filter", "getattr", "hasattr", "hash", "hex", "id", "intern", "isinstance", "issubclass", "len", "map", "max", "min", "oct", "ord", "pow", "quit", "range", "reduce", "repr", "reversed", "round", "setattr", "sorted", "staticmethod", "sum", "type", "unichr", "xrange", "zip"] + ["Exception", "TypeError", "IOError", "ValueError", "ZeroDivisionError", "StopIteration", "GeneratorExit", "IndexError", "KeyError", "ImportError", "RuntimeError", "__import__"]
+
+    ## Native helpers for operators whose javascript counterpart differs
+    ## from python (rounding, sign of modulo, division by zero)
+    native_helpers = {
+        ("Div", isttyper.INT)       : "$PY.idiv",
+        ("Div", isttyper.FLOAT)     : "$PY.fdiv",
+        ("FloorDiv", isttyper.INT)  : "$PY.idiv",
+        ("FloorDiv", isttyper.FLOAT): "$PY.ffloordiv",
+        ("Mod", isttyper.INT)       : "$PY.imod",
+        ("Mod", isttyper.FLOAT)     : "$PY.fmod",
+    }
+
+    def __init__(self, native_numbers = False, es6_generators = False):
+        self.native_numbers = native_numbers
+        self.es6_generators = es6_generators
+        ## Constants are declared at the top of the module, unless the
+        ## result must be a single expression
+        self.hoist = True
+        super(Transformer, self).__init__()
+
     def compute(self, tree):
         self.index_var = 0
         self.future_division = False
@@ -65,20 +91,39 @@ class Transformer(isttransform.Transformer):
         self.exceptions = []
         self._loops = []
         self._class_name = []
-        self.emulate_generators = True
-        return self.comp(tree)
+        self._natives = [dict()]
+        self.constants = []
+        self.constant_names = set()
+        self._temps = [[]]
+        res = self.comp(tree)
+        if isinstance(res, IModule):
+            res.body[0:0] = [IVar(name = name, expr = expr) for name, expr in self.constants] + self.temps_declare()
+        return res
 
     def alloc_var(self):
         self.index_var += 1
         return "$v%d" % self.index_var
 
+    def temp_var(self):
+        """Allocates a variable declared at the top of the enclosing function"""
+        var = self.alloc_var()
+        self._temps[-1].append(var)
+        return var
+
+    def temps_declare(self):
+        return [IVar(name = var) for var in self._temps.pop()]
+
     def ispure(self, tree):
-        return isinstance(tree, IName)
+        return isinstance(tree, (IName, INumber, IString))
 
     def purecall(self, obj, func, *args):
         target = self.comp(obj)
         args = [self.comp(n) for n in args]
-        if self.ispure(obj):
+        return self.methodcall(target, func, args, self.ispure(obj))
+
+    def methodcall(self, target, func, args, pure):
+        """Calls the method [func] of the compiled expression [target]"""
+        if pure:
             return ICall(
                 func = IGetAttr(base = target, attr = func),
                 args = [target] + args,
@@ -88,9 +133,95 @@ class Transformer(isttransform.Transformer):
         else:
             return ICall(func = IName(id = "$PY.call"), args = [target, IString(value = func)] + args)
 
+    ## Unboxed numbers
+
+    def numtype(self, node):
+        t = isttyper.numtype(node, self._natives[-1], self.future_division)
+        if t in (isttyper.INT, isttyper.FLOAT):
+            return t
+        else:
+            return None
+
+    def box(self, value, t):
+        return ICall(func = IName(id = t), args = [value])
+
+    def native(self, node):
+        """Compile an expression accepted by numtype() to a plain javascript number"""
+        t = self.numtype(node)
+        if isinstance(node, INumber):
+            return node
+        elif isinstance(node, IName):
+            if node.id in self._natives[-1]:
+                return node
+            else:
+                return IGetAttr(base = self.comp(node), attr = "obj")
+        elif isinstance(node, IUnaryOp):
+            return IUnaryOp(op = node.op, lvalue = self.native(node.lvalue))
+        elif isinstance(node, IBinOp):
+            left, right = self.native(node.left), self.native(node.right)
+            if node.op == "Pow":
+                return ICall(func = IName(id = "Math.pow"), args = [left, right])
+            elif (node.op, t) in self.native_helpers:
+                return ICall(func = IName(id = self.native_helpers[node.op, t]), args = [left, right])
+            else:
+                return IBinOp(left = left, right = right, op = node.op)
+        elif isinstance(node, ICall) and node.func.id == "len":
+            return self.length(node.args[0])
+        elif isinstance(node, ICall):
+            if self.numtype(node.args[0]) in (t, isttyper.INT):
+                return self.native(node.args[0])
+            else:
+                return IGetAttr(base = ICall(func = IName(id = node.func.id), args = [self.comp(node.args[0])]), attr = "obj")
+        else:
+            raise NotImplementedError("Cannot compile %s as a native number" % node)
+
+    def length(self, node):
+        """Compile len([node]) to a plain javascript number"""
+        t = getattr(node, "itype", None)
+        if t == istinfer.STR:
+            return IGetAttr(base = IGetAttr(base = self.comp(node), attr = "obj"), attr = "length")
+        elif t == istinfer.TUPLE:
+            return IGetAttr(base = IGetAttr(base = self.comp(node), attr = "items"), attr = "length")
+        else:
+            return ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "len"), args = [self.comp(node)])
+
+    def native_compare(self, node):
+        """Compile a comparison of native numbers to a javascript boolean, or return None"""
+        operands = [node.lvalue] + node.comps
+        if not all(op in self.ops_compare for op in node.ops) or not all(self.numtype(x) for x in operands):
+            return None
+        if len(node.ops) > 1 and not all(isinstance(x, (IName, INumber)) for x in node.comps[:-1]):
+            return None
+        values = [self.native(x) for x in operands]
+        terms = [ICompare(lvalue = l, ops = [op], comps = [r]) for l, op, r in zip(values, node.ops, values[1:])]
+        if len(terms) == 1:
+            return terms[0]
+        else:
+            return IBoolOp(op = "And", values = terms)
+
+    def condition(self, node):
+        """Compiles [node] to a javascript boolean"""
+        cond = isinstance(node, ICompare) and self.native_compare(node)
+        if cond:
+            return cond
+        elif isinstance(node, IUnaryOp) and node.op == "Not":
+            return IUnaryOp(op = "Not", lvalue = self.condition(node.lvalue))
+        elif isinstance(node, IBoolOp):
+            return IBoolOp(op = node.op, values = [self.condition(x) for x in node.values])
+        elif getattr(node, "itype", None) == istinfer.BOOL:
+            return ICompare(lvalue = self.comp(node), ops = ["Eq"], comps = [IName(id = "True")])
+        else:
+            return self.truthy(self.comp(node))
+
+    def truthy(self, value):
+        return ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "truthy"), args = [value])
+
     def node_name(self, node):
-        if node.id in ["copyright", "credits", "license", "help"] + ["abs", "all", "any", "apply", "bin", "callable", "chr", "cmp", "coerce", "delattr", "dir", "enumerate", "filter", "getattr", "hasattr", "hash", "hex", "id", "intern", "isinstance", "issubclass", "len", "map", "max", "min", "oct", "ord", "pow", "quit", "range", "reduce", "repr", "reversed", "round", "setattr", "sorted", "staticmethod", "sum", "type", "unichr", "xrange", "zip"] + ["Exception", "TypeError", "IOError", "ValueError", "ZeroDivisionError", "StopIteration", "IndexError"]:
-            return ist.GetAttr(base = ist.Name(id = "__builtins__"), attr = "PY$%s" % node.id)
+        if node.id in self.builtin_names:
+            ## Builtins are looked up once per module
+            return self.constant("$b_%s" % node.id, IGetAttr(base = IName(id = "__builtins__"), attr = "PY$%s" % node.id))
+        elif node.id in self._natives[-1]:
+            return self.box(node, self._natives[-1][node.id])
         else:
             node.id = self.name_map.get(node.id, node.id)
             return node
@@ -99,7 +230,8 @@ class Transformer(isttransform.Transformer):
         if isinstance(node.base, ist.Name) and node.base.id == "__builtins__":
             return node
         else:
-            return ist.Call(func = ist.GetAttr(base = IName(id = "$PY"), attr = "getattr"), args = [self.comp(node.base), ist.String(value = node.attr)], keywords = [], kwargs = None, varargs = None)
+            cache = self.constant("$ca_%s" % node.attr, ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "attrcache"), args = [IString(value = node.attr)]))
+            return ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "attr"), args = [self.comp(node.base), cache])
 
     def node_tuple(self, node):
         return ist.Call(func = ist.Name(id = "tuple"), args = [ist.List(values = self.comp(node.values))])
@@ -121,21 +253,41 @@ class Transformer(isttransform.Transformer):
     def node_list(self, node):
         return ist.Call(func = ist.Name(id = "list"), args = [ist.List(values = self.comp(node.values))])
 
+    def node_set(self, node):
+        return ist.Call(func = ist.Name(id = "set"), args = [ist.List(values = self.comp(node.values))])
+
     def node_getitem(self, node):
         target = self.comp(node.value)
         func = "PY$__getitem__"
         return self.purecall(node.value, func, node.slice)
 
+    ## Constants
+
+    def constant(self, name, expr):
+        """
+        Returns a reference to the module level constant [name], which is
+        declared as [expr] at the top of the module. The name is derived
+        from the value, so separately compiled modules agree on it.
+        """
+        if not self.hoist:
+            return expr
+        elif not name in self.constant_names:
+            self.constant_names.add(name)
+            self.constants.append((name, expr))
+        return IName(id = name)
+
     def node_number(self, node):
         if isinstance(node.value, (int, long)):
             if 0 <= node.value <= 9:
                 return ist.Name(id = "$c%s" % node.value)
             elif -2**53 <= node.value <= 2**53:
-                return ist.Call(func = ist.Name(id = "int"), args = [node])
+                name = "$ci%s" % str(node.value).replace("-", "n")
+                return self.constant(name, ist.Call(func = ist.Name(id = "int"), args = [node]))
             else:
                 raise NotImplementedError("JS doesn't support long numbers")
         elif isinstance(node.value, float):
-            return ist.Call(func = ist.Name(id = "float"), args = [node])
+            name = "$cf%s" % re.sub("[^a-z0-9]", lambda m: {".": "_", "-": "n", "+": "p"}[m.group(0)], repr(node.value))
+            return self.constant(name, ist.Call(func = ist.Name(id = "float"), args = [node]))
         else:
             raise NotImplementedError("Unknown numeric type: %s" % node.n.__class__.__name__)
 
@@ -146,11 +298,23 @@ class Transformer(isttransform.Transformer):
         return ist.Call(func = ist.Name(id = "slice"), args = [lower, upper, step])
 
     def node_string(self, node):
-        return ist.Call(func = ist.Name(id = "str"), args = [ist.String(value = node.value)])
+        value = node.value
+        if isinstance(value, unicode):
+            value, prefix, cls = value.encode("utf-8"), "$cu", "unicode"
+        else:
+            prefix, cls = "$cs", "str"
+        if re.match("^[A-Za-z0-9_]{0,24}$", value):
+            name = "%s_%s" % (prefix, value)
+        else:
+            name = "%s$%s" % (prefix, hashlib.md5(value).hexdigest()[:12])
+        return self.constant(name, ist.Call(func = ist.Name(id = cls), args = [ist.String(value = node.value)]))
 
     def node_call(self, node):
         js = []
 
+        if isttyper.islen(node) and getattr(node.args[0], "itype", None) in (istinfer.STR, istinfer.TUPLE, istinfer.LIST):
+            return self.box(self.length(node.args[0]), isttyper.INT)
+
         posargs = self.comp(node.args)
 
         if isinstance(node.func, ist.GetAttr) and isinstance(node.func.base, IName) and node.func.base.id == '__builtins__' and node.func.attr == "print":
@@ -182,9 +346,18 @@ class Transformer(isttransform.Transformer):
         else:
             cooked = []
 
-        return ICall(func = self.comp(node.func), args = posargs + cooked)
+        func = self.comp(node.func)
+        if isinstance(node.func, ist.GetAttr) and isinstance(func, ICall):
+            ## Calls the method found on the class directly, instead of
+            ## making a bound method
+            return ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "callmethod"), args = func.args + posargs + cooked)
+        else:
+            return ICall(func = func, args = posargs + cooked)
 
     def node_binop(self, node):
+        t = self.numtype(node)
+        if t:
+            return self.box(self.native(node), t)
         if node.op == "Div":
             if self.future_division:
                 op = "div"
@@ -196,6 +369,9 @@ class Transformer(isttransform.Transformer):
         return self.purecall(node.left, func, node.right)
 
     def node_unaryop(self, node):
+        t = self.numtype(node)
+        if t:
+            return self.box(self.native(node), t)
         if node.op == "Not":
             return ist.Call(func = ist.GetAttr(base = ist.Name(id = "$PY"), attr = "__not__"), args = [self.comp(node.lvalue)])
         elif node.op in self.uopmap:
@@ -204,8 +380,11 @@ class Transformer(isttransform.Transformer):
         else:
             raise NotImplementedError()
 
+    def node_ifexp(self, node):
+        return IIfExp(cond = self.condition(node.cond), body = self.comp(node.body), orelse = self.comp(node.orelse))
+
     def node_if(self, node):
-        node.cond = ist.Compare(lvalue = ist.Call(func = ist.Name(id = "bool"), args = [self.comp(node.cond)]), ops = ["Eq"], comps = [ist.Name(id = "True")])
+        node.cond = self.condition(node.cond)
         node.body = self.comp(node.body)
         if node.orelse:
             node.orelse = self.comp(node.orelse)
@@ -214,14 +393,16 @@ class Transformer(isttransform.Transformer):
     def node_while(self, node):
         if node.orelse:
             orelse_var = self.alloc_var()
-            self._loops.append(orelse_var)
             decl = IVar(name = orelse_var, expr = ist.Name(id = "true"))
+        else:
+            orelse_var = None
+        self._loops.append(orelse_var)
 
-        node.cond = ist.Compare(lvalue = ist.Call(func = ist.Name(id = "bool"), args = [self.comp(node.cond)]), ops = ["Eq"], comps = [ist.Name(id = "True")])
+        node.cond = self.condition(node.cond)
         node.body = self.comp(node.body)
+        self._loops.pop()
 
         if node.orelse:
-            self._loops.pop()
             code = [decl, node, IIf(cond = IName(id = orelse_var), body = self.comp(node.orelse))]
             node.orelse = None
             return code
@@ -229,12 +410,116 @@ class Transformer(isttransform.Transformer):
             return node
 
     def node_break(self, node):
-        if self._loops:
+        if self._loops and self._loops[-1]:
             return [IAssign(lvalue = [IName(id = self._loops[-1])], rvalue = IName(id = "false")), node]
         else:
             return node
 
+    def range_bound(self, node, js):
+        """Compile a range() argument to a javascript number, hoisted into a variable unless constant"""
+        if self.numtype(node) == isttyper.INT:
+            value = self.native(node)
+        else:
+            value = ICall(func = IName(id = "js"), args = [self.comp(node)])
+        if isinstance(value, INumber) or (isinstance(value, IUnaryOp) and value.op == "USub" and isinstance(value.lvalue, INumber)):
+            return value
+        var = self.alloc_var()
+        js.append(IVar(name = var, expr = value))
+        return IName(id = var)
+
+    def range_loop(self, node):
+        """Compile "for x in range(...)" to a counting loop, without creating the list"""
+        js = []
+        args = node.iter.args
+        if len(args) == 1:
+            start, stop, step = INumber(value = 0), self.range_bound(args[0], js), INumber(value = 1)
+        else:
+            start = self.range_bound(args[0], js)
+            stop = self.range_bound(args[1], js)
+            if len(args) == 3:
+                step = self.range_bound(args[2], js)
+            else:
+                step = INumber(value = 1)
+
+        counter = self.alloc_var()
+        if isinstance(step, IUnaryOp) and step.op == "USub":
+            step = INumber(value = -step.lvalue.value)
+        if isinstance(step, INumber) and step.value > 0:
+            cond = ICompare(lvalue = IName(id = counter), ops = ["Lt"], comps = [stop])
+        elif isinstance(step, INumber) and step.value < 0:
+            cond = ICompare(lvalue = IName(id = counter), ops = ["Gt"], comps = [stop])
+        else:
+            if not isinstance(step, IName):
+                var = self.alloc_var()
+                js.append(IVar(name = var, expr = step))
+                step = IName(id = var)
+            js.append(ICall(func = IName(id = "$PY.rangestep"), args = [step]))
+            cond = IIfExp(cond = ICompare(lvalue = step, ops = ["Gt"], comps = [INumber(value = 0)]),
+                          body = ICompare(lvalue = IName(id = counter), ops = ["Lt"], comps = [stop]),
+                          orelse = ICompare(lvalue = IName(id = counter), ops = ["Gt"], comps = [stop]))
+
+        if node.target.id in self._natives[-1]:
+            target, value = node.target, IName(id = counter)
+        else:
+            target, value = self.comp(node.target), ICall(func = IName(id = "int"), args = [IName(id = counter)])
+
+        if node.orelse:
+            orelse_var = self.alloc_var()
+            js.append(IVar(name = orelse_var, expr = IName(id = "true")))
+        else:
+            orelse_var = None
+        self._loops.append(orelse_var)
+
+        js.append(IVar(name = target.id))
+        js.append(IFor(body = [IAssign(lvalue = [target], rvalue = value)] + self.comp(node.body),
+                       init = IVar(name = counter, expr = start),
+                       cond = cond,
+                       incr = IAugAssign(target = IName(id = counter), value = step, op = "Add")))
+        self._loops.pop()
+
+        if node.orelse:
+            js.append(IIf(cond = IName(id = orelse_var), body = self.comp(node.orelse)))
+
+        return js
+
+    def pairs_loop(self, node):
+        """Compile "for a, b in ..." to a loop over pairs, which dicts, enumerate() and zip() make without creating tuples"""
+        js = []
+        pairs = self.alloc_var()
+        if isttyper.isitems(node.iter):
+            live = INumber(value = 1 if node.iter.func.attr == "iteritems" else 0)
+            init = ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "dictpairs"), args = [self.comp(node.iter.func.base), live])
+        else:
+            init = ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "pairs"), args = [self.comp(node.iter)])
+
+        if node.orelse:
+            orelse_var = self.alloc_var()
+            js.append(IVar(name = orelse_var, expr = IName(id = "true")))
+        else:
+            orelse_var = None
+        self._loops.append(orelse_var)
+
+        key, value = node.target.values
+        body = [IVar(name = key.id, expr = IGetAttr(base = IName(id = pairs), attr = "key")),
+                IVar(name = value.id, expr = IGetAttr(base = IName(id = pairs), attr = "value"))]
+        js.append(IFor(body = body + self.comp(node.body),
+                       init = IVar(name = pairs, expr = init),
+                       cond = ICall(func = IGetAttr(base = IName(id = pairs), attr = "advance"), args = []),
+                       incr = None))
+        self._loops.pop()
+
+        if node.orelse:
+            js.append(IIf(cond = IName(id = orelse_var), body = self.comp(node.orelse)))
+
+        return js
+
     def node_foreach(self, node):
+        if isinstance(node.target, ist.Name) and isttyper.isrange(node.iter):
+            return self.range_loop(node)
+
+        if isttyper.ispairs(node):
+            return self.pairs_loop(node)
+
         if isinstance(node.target, ist.Name):
             for_target = self.comp(node.target)
         elif isinstance(node.target, ist.Tuple):
@@ -250,8 +535,10 @@ class Transformer(isttransform.Transformer):
 
         if node.orelse:
             orelse_var = self.alloc_var()
-            self._loops.append(orelse_var)
             js.append(ist.Var(name = orelse_var, expr = ist.Name(id = "true")))
+        else:
+            orelse_var = None
+        self._loops.append(orelse_var)
 
         js.append(ist.Var(name = for_target.id))
         js.append(ist.For(body = self.comp(node.body),
@@ -261,42 +548,47 @@ class Transformer(isttransform.Transformer):
                           ))
 
         if isinstance(node.target, ITuple):
-            decom = []
+            items = self.alloc_var()
+            decom = [IVar(name = items, expr = self.unpack(for_target, node.target))]
             for i, x in enumerate(node.target.values):
-                decom.append(IVar(name = x.id, expr = ICall(func = (IGetAttr(base = for_target, attr = "PY$__getitem__")), args = [for_target, INumber(value = i)])))
+                decom.append(IVar(name = x.id, expr = IGetItem(value = IName(id = items), slice = INumber(value = i))))
             js[-1].body = decom + js[-1].body
+        self._loops.pop()
 
         if node.orelse:
             js.append(IIf(cond = IName(id = orelse_var), body = self.comp(node.orelse)))
-            self._loops.pop()
 
         return js
 
+    def unpack(self, value, target):
+        """The items of [value], as a javascript array checked to fit the names in [target]"""
+        return ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "unpack"), args = [value, INumber(value = len(target.values))])
+
     def node_compare(self, node):
         assert len(node.ops) == len(node.comps)
-        if len(node.ops) == 1:
+        cond = self.native_compare(node)
+        if cond:
+            return IIfExp(cond = cond, body = IName(id = "True"), orelse = IName(id = "False"))
+        elif len(node.ops) == 1:
             return self.compare_simple(node.lvalue, node.ops[0], node.comps[0])
         else:
-            var = self.alloc_var()
-            body = []
-            body.append(IVar(name = var, expr = self.comp(node.lvalue)))
-
-            complambda = ILambda(body = body, params = None)
-
-            lastif = complambda
-            lastvar = var
-            for i, op, val in zip(range(len(node.ops)), node.ops, node.comps):
-                newvar = self.alloc_var()
-                lastif.body.append(IAssign(lvalue = [IName(id = newvar)], rvalue = self.comp(val)))
-                I = IIf(cond = ICompare(lvalue = ICall(func = IName(id = "bool"), args = [self.compare_simple(IName(id = lastvar), op, IName(id = newvar))]), ops = ["Eq"], comps = [IName(id = "True")]), body = [])
-                lastif.body.append(I)
-                lastif = I
-                lastvar = newvar
-
-            lastif.body.append(IReturn(expr = IName(id = "True")))
-
-            body.append(IReturn(expr = IName(id = "False")))
-            return ICall(func = complambda, args = [])
+            ## a < b < c is (a < b) and (b < c), evaluating b once. The
+            ## middle operands are kept in temporaries.
+            left = self.comp(node.lvalue)
+            terms = []
+            for i, (op, val) in enumerate(zip(node.ops, node.comps)):
+                right = self.comp(val)
+                if i < len(node.ops) - 1:
+                    var = self.temp_var()
+                    terms.append(self.compare_values(left, op, IAssign(lvalue = [IName(id = var)], rvalue = right)))
+                    left = IName(id = var)
+                else:
+                    terms.append(self.compare_values(left, op, right))
+            res = self.temp_var()
+            expr = terms[-1]
+            for term in reversed(terms[:-1]):
+                expr = IIfExp(cond = self.truthy(IAssign(lvalue = [IName(id = res)], rvalue = term)), body = expr, orelse = IName(id = res))
+            return expr
 
     def compare_simple(self, lvalue, op, rvalue):
         if op in self.ops_compare:
@@ -312,33 +604,77 @@ class Transformer(isttransform.Transformer):
         else:
             raise NotImplementedError(op)
 
+    def compare_values(self, lvalue, op, rvalue):
+        """Like compare_simple, for compiled operands"""
+        if op in self.ops_compare:
+            func = "PY$__%s__" % self.ops_compare[op]
+            return self.methodcall(lvalue, func, [rvalue], self.ispure(lvalue))
+        elif op == "In":
+            return self.methodcall(rvalue, "PY$__contains__", [lvalue], self.ispure(rvalue))
+        elif op == "Is":
+            return ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "__is__"), args = [lvalue, rvalue])
+        elif op == "NotIn":
+            return ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "__not__"), args = [self.compare_values(lvalue, "In", rvalue)])
+        else:
+            raise NotImplementedError(op)
+
+    def import_module(self, name, submodule = False):
+        parts = name.split(".")
+        res = ICall(func = IGetAttr(base = IName(id = "__builtins__"), attr = "PY$__import__"), args = [self.comp(ist.String(value = name))])
+        if submodule:
+            for part in parts[1:]:
+                res = ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "getattr"), args = [res, IString(value = part)])
+        return res
+
+    def node_import(self, node):
+        js = []
+        for name, asname in sorted(node.names.items()):
+            if asname:
+                js.extend(self.assign_simple(IName(id = asname), self.import_module(name, True)))
+            else:
+                js.extend(self.assign_simple(IName(id = name.split(".")[0]), self.import_module(name)))
+        return js
+
     def node_importfrom(self, node):
         if node.module == "__future__" and node.names == dict(division = None):
             self.future_division = True
             return None
+        elif "*" in node.names:
+            raise NotImplementedError("from %s import * is not supported" % node.module)
         else:
-            raise NotImplementedError()
+            js = []
+            for name, asname in sorted(node.names.items()):
+                value = ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "getattr"), args = [self.import_module(node.module, True), IString(value = name)])
+                js.extend(self.assign_simple(IName(id = asname or name), value))
+            return js
 
     def node_assign(self, node):
         res = []
+        t = self.numtype(node.rvalue)
+        if t and any(isinstance(lval, IName) and lval.id in self._natives[-1] for lval in node.lvalue):
+            value = self.native(node.rvalue)
+        else:
+            value, t = self.comp(node.rvalue), None
         if len(node.lvalue) > 1:
             tmp = self.alloc_var()
-            res.append(ist.Var(name = tmp, expr = self.comp(node.rvalue)))
+            res.append(ist.Var(name = tmp, expr = value))
             for lval in node.lvalue:
-                res.extend(self.assign_simple(lval, ist.Name(id = tmp)))
+                res.extend(self.assign_simple(lval, ist.Name(id = tmp), t))
             return res
         else:
-            return self.assign_simple(node.lvalue[0], self.comp(node.rvalue))
+            return self.assign_simple(node.lvalue[0], value, t)
 
-    def assign_simple(self, target, value):
+    def assign_simple(self, target, value, native = None):
+        if native and not (isinstance(target, IName) and target.id in self._natives[-1]):
+            value = self.box(value, native)
         if isinstance(target, (ist.Tuple, ist.List)):
             t1 = self.alloc_var()
-            js = [ist.Var(name = t1, expr = value)]
+            js = [ist.Var(name = t1, expr = self.unpack(value, target))]
 
             for i, target in enumerate(target.values):
                 var = target.id
                 assert isinstance(target, IName)
-                expr = ICall(func = IGetAttr(base = IName(id = t1), attr = "PY$__getitem__"), args = [IName(id = t1), INumber(value = i)])
+                expr = IGetItem(value = IName(id = t1), slice = INumber(value = i))
                 if isinstance(target, IName) and not (var in self.scope):
                     self.scope.append(var)
                     js.append(IVar(name = target.id, expr = expr))
@@ -351,7 +687,7 @@ class Transformer(isttransform.Transformer):
                 lower = self.comp(slice.lower) if slice.lower else IName(id = "None")
                 upper = self.comp(slice.upper) if slice.upper else IName(id = "None")
                 step  = self.comp(slice.step ) if slice.step  else IName(id = "None")
-                js = [self.purecall(target.value, func, lower, upper, step, value)]
+                js = [self.methodcall(self.comp(target.value), func, [lower, upper, step, value], self.ispure(target.value))]
             else:
                 js = [ist.Call(func = ist.GetAttr(base = self.comp(target.value), attr = "PY$__setitem__"), args = [self.comp(target.value), self.comp(target.slice), value])]
         elif isinstance(target, ist.Name):
@@ -362,7 +698,11 @@ class Transformer(isttransform.Transformer):
                 self.scope.append(var)
                 js = [ist.Var(name = var, expr = value)]
         elif isinstance(target, ist.GetAttr):
-            js = [ist.Call(func = ist.GetAttr(base = IName(id = "$PY"), attr = "setattr"), args = [self.comp(target.base), IString(value = target.attr), value])]
+            if target.attr == "__getattribute__":
+                ## Invalidates the attribute caches
+                js = [ist.Call(func = ist.GetAttr(base = IName(id = "$PY"), attr = "setattr"), args = [self.comp(target.base), IString(value = target.attr), value])]
+            else:
+                js = [IAssign(lvalue = [IGetAttr(base = self.comp(target.base), attr = "PY$%s" % target.attr)], rvalue = value)]
         else:
             raise NotImplementedError("Unsupported assignment type", target)
         return js
@@ -372,69 +712,89 @@ class Transformer(isttransform.Transformer):
 
         js = []
 
+        scope = self.scope
         self.scope = [arg for arg in node.params.args]
+        self._temps.append([])
+        if self.native_numbers:
+            self._natives.append(getattr(node, "natives", dict()))
+        else:
+            self._natives.append(dict())
 
+        ## Positional calls pass the arguments straight to the javascript
+        ## parameters. Calls with keywords, *args or **kwargs pass a
+        ## cooked argument object last, which is unpacked by __uncook.
+        params = [self.name_map.get(arg, arg) for arg in node.params.args]
         pyargs = IName(id = "$pyargs")
         pyargs_kw = IGetAttr(base = pyargs, attr = "kw")
+        arguments = IName(id = "arguments")
+        nargs = IGetAttr(base = arguments, attr = "length")
 
         newargs = self.alloc_var()
+        loopvar = self.alloc_var()
 
-        js.append(IVar(name = pyargs.id,  expr = ICall(func = IName(id = "__uncook"),  args = [IName(id = "arguments")])))
-        js.append(IVar(name = newargs, expr = IGetAttr(base = IName(id = "$pyargs"), attr = "varargs")))
-
-        if node.params.kwargs:
-            js.append(IVar(name = node.params.kwargs, expr = ICall(func = IName(id = "dict"), args = [IGetAttr(base = pyargs, attr = "kwargs")])))
-
-        if node.params.varargs:
-            js.append(IVar(name = node.params.varargs, expr = IName(id = "tuple(%s.slice(%s))" % (newargs, len(node.params.args)))))
+        cooked = []
+        cooked.append(IVar(name = pyargs.id,  expr = ICall(func = IName(id = "__uncook"),  args = [arguments])))
+        cooked.append(IVar(name = newargs, expr = IGetAttr(base = pyargs, attr = "varargs")))
 
-        for i, arg in enumerate(node.params.args):
-            arg = self.name_map.get(arg, arg)
+        for i, arg in enumerate(params):
             if defaults[i] == None:
-                js.append(
-                    IVar(
-                        name = arg,
-                        expr = IBinOp(left = IGetAttr(base = pyargs_kw, attr = arg), op = "Or", right = IGetItem(value = IName(id = newargs), slice = INumber(value = i)))))
+                cooked.append(IAssign(lvalue = [IName(id = arg)],
+                                      rvalue = IBinOp(left = IGetAttr(base = pyargs_kw, attr = arg), op = "Or", right = IGetItem(value = IName(id = newargs), slice = INumber(value = i)))))
             else:
-                js.append(IVar(name = arg, expr = IGetItem(value = IName(id = newargs), slice = INumber(value = i))))
-                js.append(IIf(cond = ICompare(lvalue = IName(id = arg), ops = ["Eq"], comps = [IName(id = "undefined")]), body = [
-                            IAssign(
-                                lvalue = [IName(id = arg)],
-                                rvalue = IIfExp(
-                                    cond = ICompare(
-                                        lvalue = IGetAttr(
-                                            base = pyargs_kw,
-                                            attr = arg),
-                                        comps = [IName(id = "undefined")],
-                                        ops = ["Eq"]),
-                                    body = self.comp(defaults[i]),
-                                    orelse = IGetAttr(
-                                        base = pyargs_kw,
-                                        attr = arg)))]))
-            js.append(IDelete(targets = [IGetAttr(base = pyargs_kw, attr = arg)]))
+                cooked.append(IAssign(lvalue = [IName(id = arg)], rvalue = IGetItem(value = IName(id = newargs), slice = INumber(value = i))))
+                cooked.append(IIf(cond = ICompare(lvalue = IName(id = arg), ops = ["Eq"], comps = [IName(id = "undefined")]), body = [
+                            IAssign(lvalue = [IName(id = arg)], rvalue = IGetAttr(base = pyargs_kw, attr = arg))]))
+            cooked.append(IDelete(targets = [IGetAttr(base = pyargs_kw, attr = arg)]))
 
-        if node.name in ("__getattr__", "__setattr__"):
-            js.append(IName(id = "if (typeof %(id)s === 'string') { %(id)s = str(%(id)s); }" % { 'id': node.params.args[1] }))
-
-        loopvar = self.alloc_var()
+        positional = []
+        if node.params.varargs:
+            js.append(IVar(name = node.params.varargs))
+            cooked.append(IAssign(lvalue = [IName(id = node.params.varargs)], rvalue = IName(id = "tuple(%s.slice(%s))" % (newargs, len(params)))))
+            positional.append(IAssign(lvalue = [IName(id = node.params.varargs)], rvalue = IName(id = "tuple(Array.prototype.slice.call(arguments, %s))" % len(params))))
 
         if node.params.kwargs:
-            js.append(IForEach(body = [
+            js.append(IVar(name = node.params.kwargs))
+            cooked.append(IAssign(lvalue = [IName(id = node.params.kwargs)], rvalue = ICall(func = IName(id = "dict"), args = [IGetAttr(base = pyargs, attr = "kwargs")])))
+            cooked.append(IForEach(body = [
                         ICall(func = IGetAttr(base = IName(id = node.params.kwargs), attr = "PY$__setitem__"),
                               args = [
                                 IName(id = node.params.kwargs),
                                 ICall(func = IName(id = "str"), args = [IName(id = loopvar)]),
                                 IGetItem(value = pyargs_kw, slice = IName(id = loopvar))])
                         ], target = IVar(name = loopvar), iter = pyargs_kw))
+            positional.append(IAssign(lvalue = [IName(id = node.params.kwargs)], rvalue = ICall(func = IName(id = "dict"), args = [])))
+
+        iscooked = IBinOp(left = ICompare(lvalue = nargs, ops = ["NotEq"], comps = [INumber(value = 0)]), op = "And",
+                          right = ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "iscooked"),
+                                        args = [IGetItem(value = arguments, slice = IBinOp(left = nargs, op = "Sub", right = INumber(value = 1)))]))
+        js.append(IIf(cond = iscooked, body = cooked, orelse = positional))
+
+        for i, arg in enumerate(params):
+            if defaults[i] != None:
+                js.append(IIf(cond = ICompare(lvalue = IName(id = arg), ops = ["Eq"], comps = [IName(id = "undefined")]), body = [
+                            IAssign(lvalue = [IName(id = arg)], rvalue = self.comp(defaults[i]))]))
 
-        js.extend(self.comp(node.body))
+        if node.name in ("__getattr__", "__setattr__"):
+            js.append(IName(id = "if (typeof %(id)s === 'string') { %(id)s = str(%(id)s); }" % { 'id': node.params.args[1] }))
+
+        if self.isgenerator(node):
+            body = self.comp(node.body)
+            if self.es6_generators:
+                body = ICall(func = ILambda(body = body, params = None, generator = True), args = [])
+                js.append(IReturn(expr = ICall(func = IGetAttr(base = IName(id = "__builtins__"), attr = "PY$generator"), args = [body])))
+            else:
+                js.extend(jsgenerator.StateMachine(self.alloc_var).compute(body))
+        else:
+            js.extend(self.comp(node.body))
 
         if not (js and isinstance(js[-1], IReturn)):
             js.append(IReturn(expr = IName(id = "None")))
 
-        self.scope = []
+        js[0:0] = self.temps_declare()
+        self.scope = scope
+        self._natives.pop()
 
-        exp = ILambda(body = js, name = node.name, params = IParameters(args = [], defaults = None, kwargs = None, varargs = None))
+        exp = ILambda(body = js, name = node.name, params = IParameters(args = params, defaults = None, kwargs = None, varargs = None))
 
         for deco in reversed(node.decorators):
             exp = ICall(func = self.comp(deco), args = [exp])
@@ -446,26 +806,41 @@ class Transformer(isttransform.Transformer):
         else:
             return IVar(name = node.name, expr = exp)
 
+    def isgenerator(self, node):
+        """True if the function [node] contains a yield of its own"""
+        stack = list(node.body)
+        while stack:
+            x = stack.pop()
+            if isinstance(x, list):
+                stack.extend(x)
+            elif isinstance(x, ist.Yield):
+                return True
+            elif isinstance(x, ist.ISTNode) and not isinstance(x, (ist.Function, ist.Lambda, ist.ClassDef)):
+                stack.extend(getattr(x, f) for f in x._fields)
+        return False
+
     def node_boolop(self, node):
-        assign_context = self.destiny(["assign", "function", "call", "comprehension"], 1) in ["assign", "call"]
-        if assign_context:
-            var = self.alloc_var()
-            evallist = [ICompare(lvalue =
-                                 ICall(func = IName(id = "bool"),
-                                       args = [IAssign(lvalue = [IName(id = var)], rvalue = self.comp(val))]),
-                                 ops = ["Eq"],
-                                 comps = [IName(id = "True")])
-                        for val in node.values]
-            return ICall(func =
-                         ILambda(body = [IVar(name = var),
-                                         IBoolOp(op = node.op, values = evallist),
-                                         IReturn(expr = IName(id = var))], params = None), args = [])
-        else:
-            return IBoolOp(values = [ICompare(lvalue = ICall(func = IName(id = "bool"), args = [self.comp(val)]), ops = ["Eq"], comps = [IName(id = "True")]) for val in node.values], op = node.op)
+        ## x or y is x if x is true, and y otherwise. The operands are
+        ## kept in a temporary while they are tested.
+        var = self.temp_var()
+        values = self.comp(node.values)
+        expr = values[-1]
+        for value in reversed(values[:-1]):
+            test = self.truthy(IAssign(lvalue = [IName(id = var)], rvalue = value))
+            if node.op == "Or":
+                expr = IIfExp(cond = test, body = IName(id = var), orelse = expr)
+            else:
+                expr = IIfExp(cond = test, body = expr, orelse = IName(id = var))
+        return expr
 
     def node_lambda(self, node):
         assert len(node.body) == 1
-        return ILambda(params = self.comp(node.params), body = [IReturn(expr = self.comp(node.body[0]))])
+        self._natives.append(dict())
+        self._temps.append([])
+        body = [IReturn(expr = self.comp(node.body[0]))]
+        body[0:0] = self.temps_declare()
+        self._natives.pop()
+        return ILambda(params = self.comp(node.params), body = body)
 
     def node_augassign(self, node):
         if node.op == "Div":
@@ -476,6 +851,10 @@ class Transformer(isttransform.Transformer):
         else:
             op = self.ops_augassign[node.op]
 
+        if isinstance(node.target, IName) and node.target.id in self._natives[-1]:
+            value = IBinOp(left = node.target, right = node.value, op = node.op)
+            return self.assign_simple(node.target, self.native(value), self.numtype(value))
+
         func = "PY$__%s__" % op
         return self.assign_simple(node.target, self.purecall(node.target, func, node.value))
 
@@ -486,7 +865,11 @@ class Transformer(isttransform.Transformer):
         if isinstance(node, ist.GetItem):
             if isinstance(node.slice, ist.Slice):
                 func = "PY$__delslice__"
-                return self.purecall(node.value, func, node.slice.lower, node.slice.upper)
+                slice = node.slice
+                lower = self.comp(slice.lower) if slice.lower else IName(id = "None")
+                upper = self.comp(slice.upper) if slice.upper else IName(id = "None")
+                step  = self.comp(slice.step ) if slice.step  else IName(id = "None")
+                return self.methodcall(self.comp(node.value), func, [lower, upper, step], self.ispure(node.value))
             else:
                 func = "PY$__delitem__"
                 return self.purecall(node.value, func, node.slice)
@@ -601,8 +984,10 @@ class Transformer(isttransform.Transformer):
             for_target = gen.target.id
         elif isinstance(gen.target, ist.Tuple):
             for_target = self.alloc_var()
+            items = self.alloc_var()
+            inner_body.append(IVar(name = items, expr = self.unpack(IName(id = for_target), gen.target)))
             for i, x in enumerate(gen.target.values):
-                inner_body.append(IVar(name = x.id, expr = ICall(func = (IGetAttr(base = IName(id = for_target), attr = "PY$__getitem__")), args = [IName(id = for_target), INumber(value = i)])))
+                inner_body.append(IVar(name = x.id, expr = IGetItem(value = IName(id = items), slice = INumber(value = i))))
         else:
             raise JSError("Advanced for-loop decomposition not supported")
 
@@ -630,6 +1015,13 @@ class Transformer(isttransform.Transformer):
         return body, innermost
 
     def node_listcomp(self, node):
+        return self.comprehension(node, "list")
+
+    def node_setcomp(self, node):
+        return self.comprehension(node, "set")
+
+    def comprehension(self, node, result):
+        """Compile a list or set comprehension to a function collecting a javascript array"""
         comp = self.alloc_var()
         body, inner_body = self.make_listcomp(node.generators[0], comp)
         for gen in node.generators[1:]:
@@ -639,14 +1031,30 @@ class Transformer(isttransform.Transformer):
 
         inner_body.append(ICall(func = IGetAttr(base = IName(id = comp), attr = "push"), args = [self.comp(node.expr)]))
         body.insert(0, IVar(name = comp, expr = IList(values = [])))
-        body.append(IReturn(expr = ICall(func = IName(id = "list"), args = [IName(id = comp)])))
+        body.append(IReturn(expr = ICall(func = IName(id = result), args = [IName(id = comp)])))
         return ICall(func = ILambda(body = body, params = []), args = [])
 
     def node_generator(self, node):
-        if self.emulate_generators:
-            return self.node_listcomp(node)
+        """Compile a generator expression to a call of a generator function"""
+        arg = self.alloc_var()
+        body = [ist.Yield(value = node.expr)]
+        for i, gen in reversed(list(enumerate(node.generators))):
+            for cond in reversed(gen.conds):
+                body = [ist.If(cond = cond, body = body)]
+            ## Only the outermost iterable is evaluated right away
+            body = [ist.ForEach(target = gen.target, iter = ist.Name(id = arg) if i == 0 else gen.iter, body = body)]
+        func = ist.Function(name = "genexpr", body = body, decorators = [],
+                            params = ist.Parameters(args = [arg], defaults = [], kwargs = None, varargs = None))
+        func = self.comp(func)
+        if isinstance(func, IVar):
+            func = func.expr
+        return ICall(func = func, args = [self.comp(node.generators[0].iter)])
+
+    def node_yield(self, node):
+        if node.value:
+            return IYield(value = self.comp(node.value))
         else:
-            raise NotImplementedError("Cannot compile generator expressions")
+            return IYield(value = IName(id = "None"))
 
     def node_comprehension(self, node):
         if isinstance(node.target, ast.Name):
@@ -0,0 +1,275 @@
+######################################################################
+##
+## Copyright 2013 Christian Iversen <ci@sikkerhed.org>
+##
+## Permission is hereby granted, free of charge, to any person
+## obtaining a copy of this software and associated documentation
+## files (the "Software"), to deal in the Software without
+## restriction, including without limitation the rights to use,
+## copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the
+## Software is furnished to do so, subject to the following
+## conditions:
+##
+## The above copyright notice and this permission notice shall be
+## included in all copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+## EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+## OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+## NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+## HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+## WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+## OTHER DEALINGS IN THE SOFTWARE.
+##
+######################################################################
+
+"""
+Lowering of generator function bodies to resumable state machines.
+
+Works on the javascript-flavoured IST produced by the jsfier. The body
+is split into numbered states at every yield, and at the control flow
+around it. Statements that do not contain a yield are kept as they are,
+except that their variables are hoisted out of the resume function, so
+they survive between calls.
+
+The result is a resume function for the runtime generator type: it is
+called with the generator object, and returns the next value, or
+$PY.c_stopgen when the body is done.
+"""
+
+import ist
+G = globals()
+for x in ist.__all__:
+    G["I%s" % x] = getattr(ist, x)
+
+def flatten(body):
+    res = []
+    for x in body:
+        if isinstance(x, list):
+            res.extend(flatten(x))
+        elif x is not None:
+            res.append(x)
+    return res
+
+def walk(node, lambdas = False):
+    """Yield [node] and all nodes below it, optionally skipping nested functions"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (list, tuple)):
+            stack.extend(node)
+        elif isinstance(node, ist.ISTNode):
+            yield node
+            if lambdas or not isinstance(node, ILambda):
+                stack.extend(getattr(node, f) for f in node._fields)
+
+def contains_yield(node):
+    return any(isinstance(x, IYield) for x in walk(node))
+
+class StateMachine(object):
+
+    def __init__(self, alloc_var):
+        self.alloc_var = alloc_var
+
+    def compute(self, body):
+        """Returns the statements replacing [body] in the generator function"""
+        self.state = self.alloc_var()
+        self.handlers = self.alloc_var()
+        self.exc = self.alloc_var()
+        self.gen = self.alloc_var()
+        self.hoisted = []
+        self.states = []
+        self.loops = []
+        self.tries = 0
+
+        self.mark(self.label())
+        self.block(body)
+        self.emit(self.done())
+
+        for node in walk(self.states, lambdas = True):
+            if isinstance(node, IYield):
+                raise NotImplementedError("yield is only supported as a statement, or as the value of an assignment")
+
+        error = self.alloc_var()
+        dispatch = ISwitch(expr = IName(id = self.state),
+                           cases = [ICase(value = INumber(value = i), body = body) for i, body in enumerate(self.states)])
+        catch = [
+            IIf(cond = ICompare(lvalue = IGetAttr(base = IName(id = self.handlers), attr = "length"), ops = ["Eq"], comps = [INumber(value = 0)]),
+                body = [IRaise(expr = IName(id = error))]),
+            IAssign(lvalue = [IName(id = self.state)], rvalue = ICall(func = IGetAttr(base = IName(id = self.handlers), attr = "pop"), args = [])),
+            IAssign(lvalue = [IName(id = self.exc)], rvalue = IName(id = error)),
+        ]
+        resume = ILambda(
+            params = IParameters(args = [self.gen], defaults = None, kwargs = None, varargs = None),
+            body = [IWhile(cond = IName(id = "true"), orelse = [], body = [
+                        ITryExcept(body = [dispatch], handlers = [ITryHandler(name = IName(id = error), type = None, body = catch)])])])
+
+        js = [IVar(name = name) for name in self.hoisted]
+        js.append(IVar(name = self.state, expr = INumber(value = 0)))
+        js.append(IVar(name = self.handlers, expr = IList(values = [])))
+        js.append(IVar(name = self.exc))
+        js.append(IReturn(expr = ICall(func = IGetAttr(base = IName(id = "__builtins__"), attr = "PY$generator"), args = [resume])))
+        return js
+
+    ## States
+
+    def label(self):
+        self.states.append(None)
+        return len(self.states) - 1
+
+    def mark(self, label):
+        self.states[label] = []
+        self.current = self.states[label]
+
+    def emit(self, code):
+        if isinstance(code, list):
+            self.current.extend(code)
+        elif code is not None:
+            self.current.append(code)
+
+    def goto(self, label, tries = None):
+        code = []
+        if tries is not None and tries < self.tries:
+            code.append(IAssign(lvalue = [IGetAttr(base = IName(id = self.handlers), attr = "length")], rvalue = INumber(value = tries)))
+        code.append(IAssign(lvalue = [IName(id = self.state)], rvalue = INumber(value = label)))
+        code.append(IContinue())
+        return code
+
+    def done(self):
+        return [IAssign(lvalue = [IName(id = self.state)], rvalue = INumber(value = -1)),
+                IReturn(expr = IGetAttr(base = IName(id = "$PY"), attr = "c_stopgen"))]
+
+    def hoist(self, name):
+        if not name in self.hoisted:
+            self.hoisted.append(name)
+
+    ## Statements without yields, kept as they are
+
+    def rewrite(self, node, depth = 0):
+        if isinstance(node, list):
+            return flatten([self.rewrite(x, depth) for x in node])
+        elif isinstance(node, IVar):
+            self.hoist(node.name)
+            if node.expr is None:
+                return None
+            return IAssign(lvalue = [IName(id = node.name)], rvalue = node.expr)
+        elif isinstance(node, IReturn):
+            return self.done()
+        elif isinstance(node, IBreak) and depth == 0 and self.loops:
+            label, _, tries = self.loops[-1]
+            return self.goto(label, tries)
+        elif isinstance(node, IContinue) and depth == 0 and self.loops:
+            _, label, tries = self.loops[-1]
+            return self.goto(label, tries)
+        elif isinstance(node, (IFor, IWhile, IForEach)):
+            if isinstance(node, IFor) and node.init:
+                node.init = self.rewrite(node.init, depth)
+            node.body = self.rewrite(node.body, depth + 1)
+            return node
+        elif isinstance(node, (IIf, ITryExcept, ITryFinally, ITryHandler)):
+            for f in node._fields:
+                value = getattr(node, f)
+                if isinstance(value, list):
+                    setattr(node, f, self.rewrite(value, depth))
+            return node
+        else:
+            return node
+
+    ## Statements with yields, split into states
+
+    def block(self, body):
+        for st in flatten(body):
+            self.stmt(st)
+
+    def stmt(self, node):
+        if not contains_yield(node):
+            self.emit(self.rewrite(node))
+        elif isinstance(node, IYield):
+            self.stmt_yield(node.value, None)
+        elif isinstance(node, IAssign) and isinstance(node.rvalue, IYield) and not contains_yield(node.lvalue):
+            self.stmt_yield(node.rvalue.value, node.lvalue)
+        elif isinstance(node, IVar) and isinstance(node.expr, IYield):
+            self.hoist(node.name)
+            self.stmt_yield(node.expr.value, [IName(id = node.name)])
+        elif isinstance(node, IIf) and not contains_yield(node.cond):
+            self.stmt_if(node)
+        elif isinstance(node, IWhile) and not contains_yield(node.cond):
+            self.stmt_while(node)
+        elif isinstance(node, IFor) and not contains_yield([node.init, node.cond, node.incr]):
+            self.stmt_for(node)
+        elif isinstance(node, ITryExcept) and len(node.handlers) == 1:
+            self.stmt_tryexcept(node)
+        elif isinstance(node, ITryFinally):
+            raise NotImplementedError("yield inside try/finally is not supported")
+        else:
+            raise NotImplementedError("yield is only supported as a statement, or as the value of an assignment")
+
+    def stmt_yield(self, value, lvalue):
+        resume = self.label()
+        self.emit(IAssign(lvalue = [IName(id = self.state)], rvalue = INumber(value = resume)))
+        self.emit(IReturn(expr = value))
+        self.mark(resume)
+        value = ICall(func = IGetAttr(base = IName(id = "$PY"), attr = "resume"), args = [IName(id = self.gen)])
+        if lvalue:
+            self.emit(IAssign(lvalue = lvalue, rvalue = value))
+        else:
+            self.emit(value)
+
+    def stmt_if(self, node):
+        then, orelse, after = self.label(), self.label(), self.label()
+        self.emit(IIf(cond = node.cond, body = self.goto(then), orelse = self.goto(orelse)))
+        self.mark(then)
+        self.block(node.body)
+        self.emit(self.goto(after))
+        self.mark(orelse)
+        self.block(node.orelse or [])
+        self.emit(self.goto(after))
+        self.mark(after)
+
+    def loop(self, body, head, cont, cond):
+        exit = self.label()
+        self.emit(self.goto(head))
+        self.mark(head)
+        if cond:
+            self.emit(IIf(cond = cond, body = [], orelse = self.goto(exit)))
+        self.loops.append((exit, cont, self.tries))
+        self.block(body)
+        self.loops.pop()
+        return exit
+
+    def stmt_while(self, node):
+        head = self.label()
+        exit = self.loop(node.body, head, head, node.cond)
+        self.emit(self.goto(head))
+        self.mark(exit)
+
+    def stmt_for(self, node):
+        if node.init:
+            self.emit(self.rewrite(node.init))
+        head, cont = self.label(), self.label()
+        exit = self.loop(node.body, head, cont, node.cond)
+        self.emit(self.goto(cont))
+        self.mark(cont)
+        if node.incr:
+            self.emit(node.incr)
+        self.emit(self.goto(head))
+        self.mark(exit)
+
+    def stmt_tryexcept(self, node):
+        handler, after = self.label(), self.label()
+        self.emit(ICall(func = IGetAttr(base = IName(id = self.handlers), attr = "push"), args = [INumber(value = handler)]))
+        self.tries += 1
+        self.block(node.body)
+        self.tries -= 1
+        self.emit(ICall(func = IGetAttr(base = IName(id = self.handlers), attr = "pop"), args = []))
+        self.emit(self.goto(after))
+
+        self.mark(handler)
+        name = node.handlers[0].name.id
+        self.hoist(name)
+        self.emit(IAssign(lvalue = [IName(id = name)], rvalue = IName(id = self.exc)))
+        self.block(node.handlers[0].body)
+        self.emit(self.goto(after))
+        self.mark(after)
@@ -1,6 +1,12 @@
+import re
 import ist
 import istcompiler
 
+def surrogates(match):
+    """Rewrites a \\U escape, which javascript lacks, as a surrogate pair"""
+    code = int(match.group(2), 16) - 0x10000
+    return "%s\\u%04x\\u%04x" % (match.group(1), 0xD800 + (code >> 10), 0xDC00 + (code & 0x3FF))
+
 class Printer(istcompiler.Multiplexer):
 
     JS_MAX_INT = 2**53
@@ -90,6 +96,8 @@ class Printer(istcompiler.Multiplexer):
     def node_number(self, node):
         if node.value > self.JS_MAX_INT or node.value < self.JS_MIN_INT:
             raise NotImplementedError("JS does not support numbers greater than +/-2^53")
+        if isinstance(node.value, float):
+            return repr(node.value)
         return "%s" % node.value
 
     def node_binop(self, node):
@@ -101,7 +109,7 @@ class Printer(istcompiler.Multiplexer):
         return "(%s)" % (" %s " % self.opmap[node.op]).join((self.comp(val) for val in node.values))
 
     def node_string(self, node):
-        return repr(node.value).lstrip("urb")
+        return re.sub(r"(?<!\\)((?:\\\\)*)\\U([0-9a-f]{8})", surrogates, repr(node.value).lstrip("urb"))
 
     def node_call(self, node):
         args = self.comp(node.args)
@@ -249,14 +257,18 @@ class Printer(istcompiler.Multiplexer):
         return "break"
 
     def node_lambda(self, node):
-        return "function%s(%s) {\n%s\n%s}" % (
+        return "function%s%s(%s) {\n%s\n%s}" % (
+            "*" if node.generator else "",
             " PY$%s" % node.name if node.name else "",
             self.comp(node.params) if node.params else "",
             "\n".join(self.capture(node.body)),
             " " * self.indentation)
 
     def node_unaryop(self, node):
-        return "%s%s" % (self.uopmap[node.op], self.comp(node.lvalue))
+        value = self.comp(node.lvalue)
+        if value[:1] in "+-" or isinstance(node.lvalue, ist.Compare):
+            value = "(%s)" % value
+        return "%s%s" % (self.uopmap[node.op], value)
 
     def node_float(self, node):
         return repr(node)
@@ -274,7 +286,10 @@ class Printer(istcompiler.Multiplexer):
         raise NotImplementedError("JS does not support global scope imports")
 
     def node_yield(self, node):
-        raise NotImplementedError("JS does not support yield")
+        if node.value:
+            return "(yield %s)" % self.comp(node.value)
+        else:
+            return "(yield)"
 
     def node_slice(self, node):
         raise NotImplementedError("JS does not support slices")
@@ -297,5 +312,15 @@ class Printer(istcompiler.Multiplexer):
         else:
             return "var %s" % node.name
 
+    def node_switch(self, node):
+        self.line("switch (%s) {" % self.comp(node.expr))
+        for case in node.cases:
+            self.comp(case)
+        self.line("}")
+
+    def node_case(self, node):
+        self.line("case %s:" % self.comp(node.value))
+        self.block(node.body)
+
     def node_ifexp(self, node):
         return "(%s ? %s : %s)" % (self.comp(node.cond), self.comp(node.body), self.comp(node.orelse))
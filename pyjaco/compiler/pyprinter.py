@@ -266,6 +266,9 @@ class Printer(istcompiler.Multiplexer):
     def node_dict(self, node):
         return "{%s}" % (", ".join('%s: %s' % (self.comp(key), self.comp(value)) for key, value in zip(node.keys, node.values)))
 
+    def node_set(self, node):
+        return "{%s}" % ", ".join(self.comp(node.values))
+
     def node_global(self, node):
         return "global %s" % ", ".join(node.names)
 
@@ -305,6 +308,12 @@ class Printer(istcompiler.Multiplexer):
             gens.append(self.comp(gen))
         return "[%s %s]" % (self.comp(node.value), " ".join(gens))
 
+    def node_setcomp(self, node):
+        gens = []
+        for gen in node.generators:
+            gens.append(self.comp(gen))
+        return "{%s %s}" % (self.comp(node.expr), " ".join(gens))
+
     def node_comprehension(self, node):
         conds = [""]
         for cond in node.conds:
@@ -56,23 +56,23 @@ function iterate(obj, func) {
         };
     } else {
         var seq = iter(obj);
-        while (true) {
-            try {
-                func(seq.PY$next(seq));
-            } catch (exc) {
-                if (exc === $PY.c_stopiter || $PY.isinstance(exc, __builtins__.PY$StopIteration)) {
-                    break;
-                } else {
-                    throw exc;
-                }
-            }
+        for (var item; (item = $PY.next(seq)) !== null; ) {
+            func(item);
         }
     }
 }
 
+/*
+  True if [arg] is the cooked argument object passed last by calls with
+  keyword arguments, *args or **kwargs.
+*/
+$PY.iscooked = function(arg) {
+    return (typeof arg === 'object') && (arg !== null) && (arg.varargs !== undefined);
+};
+
 var __uncook = function(args) {
     var last = args.length-1;
-    if (args.length && (typeof args[last] === 'object') && (args[last].varargs !== undefined)) {
+    if (args.length && $PY.iscooked(args[last])) {
         var res = args[last];
         var posargs = Array.prototype.slice.call(args, 0, last);
         if (res.varargs.PY$__class__ === tuple || res.varargs.PY$__class__ === list) {
@@ -84,11 +84,10 @@ var __uncook = function(args) {
             res.kw = [];
         }
         if (res.kwargs !== undefined) {
-            var items = res.kwargs.items;
-            for (var hash in items) {
-                var item = items[hash];
-                res.kw[js(item[0])] = item[1];
-            }
+            var kw = res.kw;
+            res.kwargs.table.each(function(key, value) {
+                kw[js(key)] = value;
+            });
         }
         return res;
     } else {
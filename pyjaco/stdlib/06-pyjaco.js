@@ -98,10 +98,19 @@ $PY.dump = function(obj) {
     return "<" + (typeof obj) + " with " + res.length + " properties> {" + res.join(", ") + "}";
 };
 
+/*
+  Returns len(obj) as a javascript number.
+*/
 $PY.len = function(obj) {
     var c = obj.PY$__class__;
-    if (c === list || c === tuple || c === str || c === basestring || c === unicode) {
+    if (c === str || c === unicode) {
         return obj.obj.length;
+    } else if (c === tuple) {
+        return obj.items.length;
+    } else if (c === list) {
+        return obj.$buf === undefined ? obj.items.length : obj.$buf.length - obj.$head;
+    } else if (c === dict || c === set) {
+        return obj.table.size;
     } else if (obj.PY$__len__ !== undefined) {
         return obj.PY$__len__(obj)._js_();
     } else {
@@ -109,9 +118,56 @@ $PY.len = function(obj) {
     }
 };
 
+/*
+  Returns the items of [seq] as a javascript array, checking that there
+  are [n] of them, for unpacking into [n] targets. Lists and tuples
+  give their own array, which must not be changed.
+*/
+$PY.unpack = function(seq, n) {
+    var cls = seq.PY$__class__;
+    var items;
+    if (cls === tuple) {
+        items = seq.items;
+    } else if (cls === list) {
+        items = seq.$buf === undefined ? seq.items : seq.$buf.slice(seq.$head);
+    } else {
+        items = [];
+        iterate(seq, function(item) {
+            items.push(item);
+        });
+    }
+    if (items.length > n) {
+        throw __builtins__.PY$ValueError("too many values to unpack");
+    } else if (items.length < n) {
+        throw __builtins__.PY$ValueError("need more than " + items.length + (items.length === 1 ? " value" : " values") + " to unpack");
+    }
+    return items;
+};
+
+/*
+  Built-in iterators implement __pyjaco_next__, which returns the next
+  value, or null when the iterator is exhausted, instead of throwing
+  StopIteration. $PY.nextable ties it to the PY$next of the class, so
+  the sentinel path is only taken as long as PY$next is not overridden.
+*/
+$PY.nextable = function(cls) {
+    var step = cls.__pyjaco_next__;
+    if (cls.PY$next === undefined) {
+        cls.PY$next = function(self) {
+            var res = step.call(self);
+            if (res === null) {
+                throw $PY.c_stopiter;
+            }
+            return res;
+        };
+    }
+    step.PY$next = cls.PY$next;
+};
+
 $PY.next = function(obj) {
-    if (obj.PY$__class__ === iter) {
-        return obj.next();
+    var step = obj.__pyjaco_next__;
+    if (step !== undefined && obj.PY$next === step.PY$next) {
+        return step.call(obj);
     } else {
         try {
             return obj.PY$next(obj);
@@ -125,6 +181,31 @@ $PY.next = function(obj) {
     }
 };
 
+/*
+  Returns an object whose advance() method moves to the next item of
+  [seq], unpacked into [key] and [value], as used by compiled
+  "for a, b in seq" loops. Iterators of pairs, like enumerate(), are
+  used directly, so no tuples are made.
+*/
+$PY.pairs = function(seq) {
+    var it = iter(seq);
+    if (it.paired === true && it.PY$next === it.__pyjaco_next__.PY$next) {
+        return it;
+    }
+    return {
+        advance: function() {
+            var item = $PY.next(it);
+            if (item === null) {
+                return false;
+            }
+            var pair = $PY.unpack(item, 2);
+            this.key = pair[0];
+            this.value = pair[1];
+            return true;
+        }
+    };
+};
+
 $PY.indices = function(start, stop, step, length) {
 
     if (step === null) {
@@ -188,13 +269,38 @@ $PY.indices = function(start, stop, step, length) {
 };
 
 $PY.__not__ = function(obj) {
-   if (obj.PY$__nonzero__ !== undefined) {
-       return js(obj.PY$__nonzero__(obj)) ? False : True;
-   } else if (obj.PY$__len__ !== undefined) {
-       return js(obj.PY$__len__(obj)) === 0 ? True : False;
-   } else {
-       return js(obj) ? False : True;
-   }
+    return $PY.truthy(obj) ? False : True;
+};
+
+/*
+  Returns the truth value of [obj] as a javascript boolean. This is what
+  compiled conditions test, so the common types are checked before
+  looking up __nonzero__ or __len__.
+*/
+$PY.truthy = function(obj) {
+    if (obj === True) {
+        return true;
+    } else if (obj === False || obj === None || obj === null || obj === undefined) {
+        return false;
+    }
+    var cls = obj.PY$__class__;
+    if (cls === int || cls === float) {
+        return obj.obj !== 0;
+    } else if (cls === str || cls === unicode) {
+        return obj.obj.length !== 0;
+    } else if (cls === list) {
+        return obj.$buf === undefined ? obj.items.length !== 0 : obj.$buf.length !== obj.$head;
+    } else if (cls === tuple) {
+        return obj.items.length !== 0;
+    } else if (cls === dict || cls === set) {
+        return obj.table.size !== 0;
+    } else if (obj.PY$__nonzero__ !== undefined) {
+        return !!js(obj.PY$__nonzero__(obj));
+    } else if (obj.PY$__len__ !== undefined) {
+        return js(obj.PY$__len__(obj)) !== 0;
+    } else {
+        return !!js(obj);
+    }
 };
 
 $PY.__is__ = function(a, b) {
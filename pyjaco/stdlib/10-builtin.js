@@ -49,6 +49,18 @@ __builtins__.js_setattr = function(obj, name, value) {
  * Python __builtins__
  */
 
+__builtins__.PY$__import__ = function(name, globals, locals, fromlist) {
+    name = js(name);
+    var mod = $PY.modules[name];
+    if (mod === undefined) {
+        throw __builtins__.PY$ImportError("No module named " + name);
+    } else if (fromlist === undefined || js(fromlist).length === 0) {
+        return $PY.modules[name.split(".")[0]];
+    } else {
+        return mod;
+    }
+};
+
 __builtins__.PY$abs = function(obj) {
     if (obj === undefined) {
         throw __builtins__.PY$TypeError("abs() takes exactly one argument (" + arguments.length + " given)");
@@ -172,7 +184,7 @@ __builtins__.PY$complex = $PY.c_nif;
 __builtins__.PY$delattr = function(obj, name) {
     name = js(name);
     if (obj["PY$" + name] !== undefined) {
-        delete obj["PY$" + name];
+        $PY.delattr(obj, name);
     } else {
         throw __builtins__.PY$AttributeError("Object " + js(str(obj)) + " does not have attribute " + name);
     }
@@ -191,35 +203,33 @@ __builtins__.PY$dir = function(obj) {
 
 __builtins__.PY$divmod = $PY.c_nif;
 
-__builtins__.PY$enumerate = function(obj) {
-    if (arguments.length != 1) {
-        throw __builtins__.PY$NotImplementedError("enumerate() only supports 1 argument");
-    }
-    var items = list();
-    var count = 0;
-    iterate(obj, function(elm) {
-                items.PY$append(items, tuple([count++, elm]));
-            });
-    return items;
-};
-
 __builtins__.PY$eval = $PY.c_nif;
 __builtins__.PY$execfile = $PY.c_nif;
 __builtins__.PY$exit = $PY.c_nif;
 __builtins__.PY$file = $PY.c_nif;
 
-__builtins__.PY$filter = function(f, l) {
-   var res = list();
-   iterate(l, function(item) {
-     if (f(item) === True) {
-       res.PY$append(res, item);
-     }
-   });
-   return res;
+__builtins__.PY$filter = function(func, seq) {
+    if (__builtins__.PY$__python3__) {
+        return $PY.ifilter(func, seq);
+    }
+
+    var items = [];
+    iterate(seq, function(item) {
+        if ($PY.truthy(func === None ? item : func(item))) {
+            items.push(item);
+        }
+    });
+
+    if (seq.PY$__class__ === tuple) {
+        return tuple(items);
+    } else if ($PY.isinstance(seq, basestring)) {
+        return ($PY.isinstance(seq, unicode) ? unicode : str)(items.map(js).join(""));
+    } else {
+        return list(items);
+    }
 };
 
 __builtins__.PY$format = $PY.c_nif;
-__builtins__.PY$frozenset = $PY.c_nif;
 
 __builtins__.PY$getattr = function(obj, name, value) {
     name = js(name);
@@ -250,7 +260,7 @@ __builtins__.PY$hash = function(obj) {
     } else if (typeof(obj) === 'number') {
         return obj === -1 ? -2 : obj;
     } else {
-        throw __builtins__.PY$AttributeError('__hash__');
+        return int($PY.id(obj));
     }
 };
 
@@ -268,16 +278,16 @@ __builtins__.PY$hex = function(num) {
 };
 
 __builtins__.PY$id = function(obj) {
-    return __builtins__.PY$int(obj.id);
+    return __builtins__.PY$int($PY.id(obj));
 }
 
 __builtins__.PY$input = $PY.c_nif;
 
 __builtins__.PY$intern = function(x) {
-    if ($PY.isinstance(x, __builtins__.PY$basestring)) {
-        // pass
+    if (x.PY$__class__ === str) {
+        return $PY.intern(x.obj);
     } else {
-        throw __builtins__.PY$TypeError("must be string, not " + x.PY$__class__.PY$__name__);
+        throw __builtins__.PY$TypeError("intern() argument 1 must be string, not " + x.PY$__class__.PY$__name__);
     }
 };
 
@@ -345,26 +355,48 @@ __builtins__.PY$locals = $PY.c_nif;
 
 __builtins__.PY$long = $PY.c_nif;
 
-__builtins__.PY$map = function() {
+__builtins__.PY$map = function(func) {
     if (arguments.length < 2) {
-        throw __builtins__.PY$TypeError("__builtins__.PY$map() requires at least two args");
+        throw __builtins__.PY$TypeError("map() requires at least two args");
     }
 
-    if (arguments.length > 2) {
-        throw __builtins__.PY$NotImplementedError("only one sequence allowed in __builtins__.PY$map()");
+    if (__builtins__.PY$__python3__) {
+        return $PY.imap.apply(null, arguments);
     }
 
-    var func = arguments[0];
-    var items = list();
-
-    iterate(arguments[1], function(item) {
-        items.PY$append(items, func(item));
-    });
+    var items = [];
+    if (arguments.length === 2) {
+        iterate(arguments[1], function(item) {
+            items.push(func === None ? item : func(item));
+        });
+        return list(items);
+    }
 
-    if (__builtins__.PY$__python3__)
-        return iter(items);
-    else
-        return items;
+    /*
+      With several sequences, the shorter ones are padded with None.
+    */
+    var iters = [];
+    for (var i = 1; i < arguments.length; i++) {
+        iters.push(iter(arguments[i]));
+    }
+    while (true) {
+        var args = [];
+        var done = true;
+        for (i = 0; i < iters.length; i++) {
+            var value = iters[i] === null ? null : $PY.next(iters[i]);
+            if (value === null) {
+                iters[i] = null;
+                args.push(None);
+            } else {
+                done = false;
+                args.push(value);
+            }
+        }
+        if (done) {
+            return list(items);
+        }
+        items.push(func === None ? tuple(args) : func.apply(null, args));
+    }
 };
 
 __builtins__.PY$max = function(list) {
@@ -422,6 +454,8 @@ __builtins__.PY$ord = function(ord) {
     var s = ord._js_();
     if (s.length === 1) {
         return __builtins__.PY$int(s.charCodeAt(0));
+    } else if (s.length === 2 && /^[\uD800-\uDBFF][\uDC00-\uDFFF]$/.test(s)) {
+        return __builtins__.PY$int(s.codePointAt(0));
     } else {
         throw __builtins__.PY$TypeError("ord() expected a character, but string of length " + s.length + " found");
     }
@@ -502,10 +536,18 @@ __builtins__.PY$range = function(start, end, step) {
         step = js(step);
     }
 
+    $PY.rangestep(step);
+
     var seq = [];
 
-    for (var i = start; i < end; i += step) {
-        seq.push(i);
+    if (step > 0) {
+        for (var i = start; i < end; i += step) {
+            seq.push(i);
+        }
+    } else {
+        for (var i = start; i > end; i += step) {
+            seq.push(i);
+        }
     }
 
     if (__builtins__.PY$__python3__)
@@ -556,12 +598,6 @@ __builtins__.PY$repr = function(obj) {
     }
 };
 
-__builtins__.PY$reversed = function(iterable) {
-    var l = list(iterable);
-    l.PY$reverse(l);
-    return l;
-}
-
 __builtins__.PY$round = function(num) {
     if (num.PY$__class__ === __builtins__.PY$float) {
         var n = num.obj;
@@ -577,16 +613,15 @@ __builtins__.PY$round = function(num) {
     }
 };
 
-__builtins__.PY$set = $PY.c_nif;
-
 __builtins__.PY$setattr = function(obj, name, value) {
-    name = js(name);
-    obj["PY$" + name] = value;
+    $PY.setattr(obj, js(name), value);
 };
 
 __builtins__.PY$sorted = function(iterable) {
     var l = list(iterable);
-    l.PY$sort(l);
+    var args = Array.prototype.slice.call(arguments);
+    args[0] = l;
+    l.PY$sort.apply(null, args);
     return l;
 };
 
@@ -614,7 +649,8 @@ __builtins__.PY$type = function(obj) {
 };
 
 __builtins__.PY$unichr = function(unichr) {
-    var s = String.fromCharCode(unichr._js_());
+    var code = unichr._js_();
+    var s = code > 0xFFFF ? String.fromCodePoint(code) : String.fromCharCode(code);
     if (s === "\0") {
         throw __builtins__.PY$TypeError("an integer is required");
     } else {
@@ -624,43 +660,21 @@ __builtins__.PY$unichr = function(unichr) {
 
 __builtins__.PY$vars = $PY.c_nif;
 
+$PY.rangestep = function(step) {
+    if (step === 0)
+        throw __builtins__.PY$ValueError("range() step argument must not be zero");
+    return step;
+};
+
 __builtins__.PY$xrange = function(start, end, step) {
     return iter(__builtins__.PY$range(start, end, step));
 };
 
 __builtins__.PY$zip = function() {
-    if (!arguments.length) {
-        return list();
-    }
-
-    var iters = list();
-    var i;
-
-    for (i = 0; i < arguments.length; i++) {
-        iters.PY$append(iters, iter(arguments[i]));
-    }
-
-    var items = list();
-
-    while (true) {
-        var item = list();
-
-        for (i = 0; i < arguments.length; i++) {
-            try {
-                var elm = iters.PY$__getitem__(iters, i);
-                var value = elm.PY$next(elm);
-            } catch (exc) {
-                if (exc === $PY.c_stopiter || $PY.isinstance(exc, __builtins__.PY$StopIteration)) {
-                    return items;
-                } else {
-                    throw exc;
-                }
-            }
-
-            item.PY$append(item, value);
-        }
-
-        items.PY$append(items, tuple(item));
+    var res = $PY.izip.apply(null, arguments);
+    if (__builtins__.PY$__python3__) {
+        return res;
+    } else {
+        return list(res);
     }
-    return None;
 };
@@ -23,6 +23,16 @@
   OTHER DEALINGS IN THE SOFTWARE.
 **/
 
+/*
+  Classes are javascript functions, which create instances when called.
+  The attributes of the base class are copied to the new class.
+
+  Instances are plain objects, made with [new] from the per-class
+  constructor [__ctor]. They inherit from [__instance], an object shared
+  by all instances of the class, which in turn inherits the attributes
+  of the class, so the shape of new instances never changes. Only
+  instances of classes with a __call__ method are made as functions.
+*/
 var __inherit = function(cls, name) {
 
     if (name === undefined) {
@@ -30,12 +40,16 @@ var __inherit = function(cls, name) {
     }
 
     var res = function() {
-        var x = res.PY$__create__;
-        if (x !== undefined) {
-            return res.PY$__create__.apply(null, [res].concat(Array.prototype.slice.call(arguments)));
-        } else {
+        var create = res.PY$__create__;
+        if (create === undefined) {
             throw __builtins__.PY$AttributeError("Class " + name + " does not have __create__ method");
         }
+        switch (arguments.length) {
+        case 0: return create(res);
+        case 1: return create(res, arguments[0]);
+        case 2: return create(res, arguments[0], arguments[1]);
+        default: return create.apply(null, [res].concat(Array.prototype.slice.call(arguments)));
+        }
     };
 
     for (var o in cls) {
@@ -46,9 +60,33 @@ var __inherit = function(cls, name) {
     res.PY$__super__ = cls;
     res.__isclass = true;
     res.__isinstance = false;
+    res.id = undefined;
+
+    var shared = function() {};
+    shared.prototype = res;
+    res.__instance = new shared();
+    res.__instance.PY$__class__ = res;
+    res.__instance.PY$__super__ = undefined;
+    res.__instance.__isclass = false;
+    res.__instance.__isinstance = true;
+    res.__instance.id = undefined;
+
+    res.__ctor = function() {};
+    res.__ctor.prototype = res.__instance;
     return res;
 };
 
+/*
+  Returns the identity of [obj], as used by id() and for hashing objects
+  without __hash__. It is only assigned when first needed.
+*/
+$PY.id = function(obj) {
+    if (obj.id === undefined) {
+        obj.id = prng();
+    }
+    return obj.id;
+};
+
 var object = __inherit(null, "object");
 
 __builtins__.PY$object = object;
@@ -57,51 +95,71 @@ object.PY$__init__ = function(self) {
 };
 
 object.PY$__create__ = function(cls) {
-    var args = Array.prototype.slice.call(arguments, 1);
+    var obj;
+    if (cls.PY$__call__ !== undefined) {
+        obj = $PY.callable(cls);
+    } else {
+        obj = new cls.__ctor();
+    }
+    switch (arguments.length) {
+    case 1: obj.PY$__init__(obj); break;
+    case 2: obj.PY$__init__(obj, arguments[1]); break;
+    case 3: obj.PY$__init__(obj, arguments[1], arguments[2]); break;
+    default: obj.PY$__init__.apply(null, [obj].concat(Array.prototype.slice.call(arguments, 1)));
+    }
+    return obj;
+};
+
+/*
+  Makes an instance of [cls] which can be called as a function.
+*/
+$PY.callable = function(cls) {
     var obj = function() {
-        var x = cls.PY$__call__;
-        if (x !== undefined) {
-            return cls.PY$__call__.apply(null, [obj].concat(Array.prototype.slice.call(arguments)));
-        } else {
-            throw __builtins__.PY$AttributeError("Object " + js(cls.PY$__name__) + " does not have __call__ method");
-        }
+        return cls.PY$__call__.apply(null, [obj].concat(Array.prototype.slice.call(arguments)));
     };
 
     if (obj.__proto__ === undefined) {
-        var x = function() {};
-        x.prototype = cls;
-        obj = new x();
-    } else {
-        obj.__proto__ = cls;
-    };
-
-    obj.PY$__class__ = cls;
-    obj.PY$__super__ = undefined;
-    obj.id = prng();
-    obj.__isinstance = true;
-    obj.__isclass = false;
-    obj.PY$__init__.apply({}, [obj].concat(args));
+        return new cls.__ctor();
+    }
+    obj.__proto__ = cls.__instance;
     return obj;
 };
 
 $PY.setattr = function(obj, k, v) {
     obj["PY$" + k] = v;
+    if (k === "__getattribute__") {
+        $PY.attrflush();
+    }
 };
 
 $PY.getattr = function(obj, k) {
-    var name = "PY$" + k;
-    var res;
-    var pyclass;
     if ("PY$__getattribute__" in obj) {
         return obj.PY$__getattribute__(obj, k);
-    } else if ((res = obj[name]) !== undefined) {
-        if (res.PY$__get__ !== undefined) {
-            pyclass = obj.PY$__class__;
+    }
+    return $PY.lookup(obj, k, "PY$" + k);
+};
+
+/*
+  Finds the attribute [k], mangled as [name], of an object without
+  __getattribute__.
+*/
+$PY.lookup = function(obj, k, name) {
+    var res;
+    var pyclass;
+    if ((res = obj[name]) !== undefined) {
+        pyclass = obj.PY$__class__;
+        if (res.PY$__get__ !== undefined && (!pyclass || pyclass[name] === res)) {
+            /*
+             * Only descriptors found on the class are bound. A function
+             * stored on an instance is returned as it is.
+             */
             if (pyclass) {
                 return res.PY$__get__(res, obj, pyclass);
             } else {
                 return res.PY$__get__(res, None, obj);
             }
+        } else if (pyclass && res.PY$__get__ !== undefined) {
+            return res;
         } else if (typeof res === 'function' && !(res.__isclass || res.__isinstance)) {
             return function() { return res.apply(null, [obj].concat(Array.prototype.slice.call(arguments))); };
         } else {
@@ -125,13 +183,55 @@ $PY.getattr = function(obj, k) {
     throw __builtins__.PY$AttributeError(js(obj.PY$__repr__(obj)) + " does not have attribute '" + js(k) + "'");
 };
 
+/*
+  Compiled code reads attributes through a cache per attribute name,
+  made by [$PY.attrcache]. It remembers the last class seen whose
+  instances have no __getattribute__, so plain values stored on those
+  instances are read with a single property load. The table has no
+  prototype, so names like "constructor" or "__proto__" are plain keys.
+*/
+$PY.c_attrcache = Object.create(null);
+
+$PY.attrcache = function(k) {
+    var ic = $PY.c_attrcache[k];
+    if (ic === undefined) {
+        ic = $PY.c_attrcache[k] = {key: k, name: "PY$" + k, cls: null};
+    }
+    return ic;
+};
+
+$PY.attrflush = function() {
+    for (var k in $PY.c_attrcache) {
+        $PY.c_attrcache[k].cls = null;
+    }
+};
+
+$PY.attr = function(obj, ic) {
+    var res;
+    var cls = obj.PY$__class__;
+    if (cls === ic.cls) {
+        res = obj[ic.name];
+        if (res !== undefined && res.PY$__get__ === undefined && typeof res !== 'function') {
+            return res;
+        }
+    } else if ("PY$__getattribute__" in obj) {
+        return obj.PY$__getattribute__(obj, ic.key);
+    } else if (cls !== undefined && ic.key !== '__name__') {
+        ic.cls = cls;
+    }
+    return $PY.lookup(obj, ic.key, ic.name);
+};
+
 $PY.delattr = function(obj, k) {
     delete obj["PY$" + k];
+    if (k === "__getattribute__") {
+        $PY.attrflush();
+    }
 };
 
 object.PY$__repr__ = function(self) {
     if (self.PY$__class__) {
-        return str("<instance of " + self.PY$__class__.PY$__name__ + " at 0x" + self.id.toString(16) + ">");
+        return str("<instance of " + self.PY$__class__.PY$__name__ + " at 0x" + $PY.id(self).toString(16) + ">");
     } else if (self.PY$__name__) {
         return str("<type '" + self.PY$__name__ + "'>");
     } else {
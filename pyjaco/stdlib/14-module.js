@@ -36,10 +36,14 @@ module.PY$__init__ = function(self, modname, filename, objects) {
     }
 };
 
-module.PY$__getattr__ = function(self, k) {
+/*
+  Module attributes are returned as they are, so functions exported by
+  runtime modules are not bound to the module.
+*/
+module.PY$__getattribute__ = function(self, k) {
     var q = self["PY$" + k];
     if (q === undefined) {
-        throw __builtins__.PY$AttributeError(js(self.PY$__repr__()) + " does not have attribute '" + js(k) + "'");
+        throw __builtins__.PY$AttributeError(js(self.PY$__repr__(self)) + " does not have attribute '" + js(k) + "'");
     } else {
         return q;
     }
@@ -50,3 +54,15 @@ module.PY$__repr__ = function(self) {
 };
 
 module.PY$__str__ = module.PY$__repr__;
+
+/*
+  Modules provided by the runtime, by name, for import. They are made
+  with $PY.module, from the objects they export.
+*/
+$PY.modules = {};
+
+$PY.module = function(name, objects) {
+    var mod = module(name, "(built-in)", objects);
+    $PY.modules[name] = mod;
+    return mod;
+};
@@ -31,24 +31,112 @@ $function.PY$__init__ = function(self, code) {
     self.PY$func_code = code;
 };
 
+/*
+  Compiled functions are made into instances of function in place, so
+  positional calls to them are plain javascript calls.
+*/
+$function.PY$__create__ = function(cls, code) {
+    if (cls === $function && typeof code === 'function' && code.PY$__class__ === undefined && code.__proto__ !== undefined) {
+        code.__proto__ = cls.__instance;
+        code.PY$func_code = code;
+        return code;
+    }
+    return object.PY$__create__.apply(null, arguments);
+};
+
 $function.PY$__get__ = function(self, obj, type) {
-    if (bool(obj) === True && !self.PY$func_code.__static) {
-        return function() {
-            return self.PY$func_code.apply(null, [obj].concat(Array.prototype.slice.call(arguments)));
-        };
+    var code = self.PY$func_code;
+    if (obj !== None && obj !== undefined && !code.__static) {
+        /*
+         * Bound methods are only made when a method is used as a value,
+         * and are kept on the instance, so reading the same method
+         * again returns the same object.
+         */
+        var bound = obj.__bound;
+        if (bound === undefined) {
+            bound = obj.__bound = {};
+        }
+        var id = $PY.id(self);
+        var res = bound[id];
+        if (res === undefined) {
+            res = bound[id] = function() {
+                switch (arguments.length) {
+                case 0: return code(obj);
+                case 1: return code(obj, arguments[0]);
+                case 2: return code(obj, arguments[0], arguments[1]);
+                default: return code.apply(null, [obj].concat(Array.prototype.slice.call(arguments)));
+                }
+            };
+        }
+        return res;
     } else {
         return function() {
-            return self.PY$func_code.apply(null, arguments);
+            return code.apply(null, arguments);
         };
     }
 };
 
+/*
+  Returns the function to call, with [obj] as the first argument, for
+  the method call obj.k(...), where [ic] is the attribute cache of
+  k. Returns undefined when the attribute is not a plain method, and
+  must be looked up as a value.
+*/
+$PY.method = function(obj, ic) {
+    var cls = obj.PY$__class__;
+    var f;
+    if (cls !== ic.cls) {
+        if (cls === undefined || ic.key === '__name__' || "PY$__getattribute__" in obj) {
+            return undefined;
+        }
+        ic.cls = cls;
+    }
+    f = obj[ic.name];
+    if (typeof f === 'function') {
+        if (f.PY$__get__ === $function.PY$__get__) {
+            if (!f.PY$func_code.__static && cls[ic.name] === f) {
+                return f.PY$func_code;
+            }
+        } else if (f.PY$__get__ === undefined && !(f.__isclass || f.__isinstance)) {
+            return f;
+        }
+    }
+    return undefined;
+};
+
+/*
+  Compiled code for obj.k(...). Plain methods are called directly,
+  without making a bound method.
+*/
+$PY.callmethod = function(obj, ic) {
+    var f = $PY.method(obj, ic);
+    var args;
+    if (f !== undefined) {
+        switch (arguments.length) {
+        case 2: return f(obj);
+        case 3: return f(obj, arguments[2]);
+        case 4: return f(obj, arguments[2], arguments[3]);
+        case 5: return f(obj, arguments[2], arguments[3], arguments[4]);
+        }
+        args = Array.prototype.slice.call(arguments, 1);
+        args[0] = obj;
+        return f.apply(null, args);
+    }
+    f = $PY.attr(obj, ic);
+    switch (arguments.length) {
+    case 2: return f();
+    case 3: return f(arguments[2]);
+    case 4: return f(arguments[2], arguments[3]);
+    }
+    return f.apply(null, Array.prototype.slice.call(arguments, 2));
+};
+
 $function.PY$__getattribute__ = function(self, key) {
 
 };
 
 $function.PY$__repr__ = function(self) {
-    return str("<function " + this.PY$func_code.name + " at 0x" + this.id.toString(16) + ">");
+    return str("<function " + this.PY$func_code.name + " at 0x" + $PY.id(this).toString(16) + ">");
 };
 
 $function.PY$__str__ = $function.PY$__repr__;
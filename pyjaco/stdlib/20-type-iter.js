@@ -33,11 +33,6 @@ iter.PY$__init__ = function(self, obj) {
         throw __builtins__.PY$TypeError("iter() expects at least 1 argument");
     } else if (obj instanceof Array) {
         self.seq = obj;
-    } else if (typeof obj === "string") {
-        self.seq = obj.split("");
-        for (var i = 0; i < self.seq.length; i++) {
-            self.seq[i] = str(self.seq[i]);
-        }
     } else {
         throw __builtins__.PY$TypeError("object is not iterable");
     }
@@ -48,6 +43,8 @@ var __iter_real__ = iter.PY$__create__;
 iter.PY$__create__ = function(cls, obj) {
     if (obj.PY$__class__ === iter) {
        return obj;
+    } else if (typeof obj === "string") {
+        return $PY.striter(obj, str);
     } else if (obj.PY$__iter__ !== undefined) {
         return obj.PY$__iter__(obj);
     } else {
@@ -73,10 +70,230 @@ iter.PY$next = function(self) {
     }
 };
 
-iter.next = function() {
+iter.__pyjaco_next__ = function() {
     if (this.index >= this.seq.length) {
         return null;
     } else {
         return this.seq[this.index++];
     }
 };
+
+$PY.nextable(iter);
+
+/*
+  Lazy iterators, as returned by enumerate() and reversed(), and by
+  zip(), map() and filter() under python 3 semantics. Iterators of pairs
+  also have advance(), which moves to the next pair and sets [key] and
+  [value] without making a tuple. They are marked [paired], and used
+  that way by $PY.pairs.
+*/
+var enumerate = __inherit(object, "enumerate");
+
+__builtins__.PY$enumerate = enumerate;
+
+enumerate.PY$__init__ = function(self, seq, start) {
+    if ($PY.iscooked(seq) || (start !== undefined && $PY.iscooked(start))) {
+        var args = __uncook(Array.prototype.slice.call(arguments, 1));
+        seq = args.varargs[0];
+        start = args.varargs.length > 1 ? args.varargs[1] : args.kw.start;
+    }
+    if (seq === undefined) {
+        throw __builtins__.PY$TypeError("enumerate() requires an iterable argument");
+    }
+    self.it = iter(seq);
+    self.count = start === undefined ? 0 : js(start);
+    self.paired = true;
+};
+
+enumerate.PY$__iter__ = function(self) {
+    return self;
+};
+
+enumerate.advance = function() {
+    var value = $PY.next(this.it);
+    if (value === null) {
+        return false;
+    }
+    this.key = int(this.count++);
+    this.value = value;
+    return true;
+};
+
+enumerate.__pyjaco_next__ = function() {
+    return this.advance() ? tuple([this.key, this.value]) : null;
+};
+
+$PY.nextable(enumerate);
+
+var izip = __inherit(object, "izip");
+
+izip.PY$__init__ = function(self) {
+    self.iters = [];
+    for (var i = 1; i < arguments.length; i++) {
+        self.iters.push(iter(arguments[i]));
+    }
+    self.paired = self.iters.length === 2;
+};
+
+izip.PY$__iter__ = function(self) {
+    return self;
+};
+
+izip.advance = function() {
+    var key = $PY.next(this.iters[0]);
+    if (key === null) {
+        return false;
+    }
+    var value = $PY.next(this.iters[1]);
+    if (value === null) {
+        return false;
+    }
+    this.key = key;
+    this.value = value;
+    return true;
+};
+
+izip.__pyjaco_next__ = function() {
+    var iters = this.iters;
+    if (iters.length === 0) {
+        return null;
+    }
+    var items = new Array(iters.length);
+    for (var i = 0; i < iters.length; i++) {
+        var value = $PY.next(iters[i]);
+        if (value === null) {
+            return null;
+        }
+        items[i] = value;
+    }
+    return tuple(items);
+};
+
+$PY.nextable(izip);
+
+$PY.izip = izip;
+
+var imap = __inherit(object, "imap");
+
+imap.PY$__init__ = function(self, func) {
+    if (arguments.length < 3) {
+        throw __builtins__.PY$TypeError("imap() must have at least two arguments");
+    }
+    self.func = func;
+    self.iters = [];
+    for (var i = 2; i < arguments.length; i++) {
+        self.iters.push(iter(arguments[i]));
+    }
+};
+
+imap.PY$__iter__ = function(self) {
+    return self;
+};
+
+imap.__pyjaco_next__ = function() {
+    var iters = this.iters;
+    if (iters.length === 1) {
+        var value = $PY.next(iters[0]);
+        if (value === null) {
+            return null;
+        }
+        return this.func === None ? value : this.func(value);
+    }
+    var args = new Array(iters.length);
+    for (var i = 0; i < iters.length; i++) {
+        args[i] = $PY.next(iters[i]);
+        if (args[i] === null) {
+            return null;
+        }
+    }
+    return this.func === None ? tuple(args) : this.func.apply(null, args);
+};
+
+$PY.nextable(imap);
+
+$PY.imap = imap;
+
+var ifilter = __inherit(object, "ifilter");
+
+ifilter.PY$__init__ = function(self, func, seq) {
+    self.func = func;
+    self.it = iter(seq);
+};
+
+ifilter.PY$__iter__ = function(self) {
+    return self;
+};
+
+ifilter.__pyjaco_next__ = function() {
+    var func = this.func;
+    var value;
+    while ((value = $PY.next(this.it)) !== null) {
+        if ($PY.truthy(func === None ? value : func(value))) {
+            return value;
+        }
+    }
+    return null;
+};
+
+$PY.nextable(ifilter);
+
+$PY.ifilter = ifilter;
+
+/*
+  Walks a sequence backwards by index, or returns the iterator made by
+  its __reversed__ method.
+*/
+var reversed = __inherit(object, "reversed");
+
+__builtins__.PY$reversed = reversed;
+
+var __reversed_real__ = reversed.PY$__create__;
+
+reversed.PY$__create__ = function(cls, seq) {
+    if (seq !== undefined && seq.PY$__reversed__ !== undefined) {
+        return seq.PY$__reversed__(seq);
+    } else if (seq !== undefined && seq.PY$__class__ === iter) {
+        /*
+          xrange() returns an iter, which python can reverse.
+        */
+        return iter(seq.seq.slice(seq.index).reverse());
+    } else {
+        return __reversed_real__(cls, seq);
+    }
+};
+
+reversed.PY$__init__ = function(self, seq) {
+    if (seq === undefined || seq.PY$__len__ === undefined || seq.PY$__getitem__ === undefined || $PY.isinstance(seq, dict)) {
+        throw __builtins__.PY$TypeError("argument to reversed() must be a sequence");
+    }
+    self.seq = seq;
+    self.index = $PY.len(seq) - 1;
+};
+
+reversed.PY$__iter__ = function(self) {
+    return self;
+};
+
+reversed.__pyjaco_next__ = function() {
+    var seq = this.seq;
+    var i = this.index;
+    if (i < 0) {
+        return null;
+    }
+    this.index = i - 1;
+    var cls = seq.PY$__class__;
+    if (cls === list || cls === tuple) {
+        var items = seq.items;
+        if (i >= items.length) {
+            this.index = -1;
+            return null;
+        }
+        return items[i];
+    } else if (cls === str || cls === unicode) {
+        return $PY.char(seq.obj.charAt(i), cls);
+    } else {
+        return seq.PY$__getitem__(seq, int(i));
+    }
+};
+
+$PY.nextable(reversed);
@@ -110,14 +110,9 @@ tuple.PY$__cmp__ = function(self, other) {
         }
 
         while (true) {
-            try {
-                var elm = it.PY$next(it);
-            } catch (exc) {
-                if (exc === $PY.c_stopiter || $PY.isinstance(exc, __builtins__.PY$StopIteration)) {
-                    break;
-                } else {
-                    throw exc;
-                }
+            var elm = $PY.next(it);
+            if (elm === null) {
+                break;
             }
             if (count >= self.items.length) {
                 res = $cn1;
@@ -203,6 +198,10 @@ tuple._js_ = function() {
 };
 
 tuple.PY$__hash__ = function (self) {
+    return int(tuple.PY$__hash__.raw(self));
+};
+
+tuple.PY$__hash__.raw = function (self) {
     /*
      * This hash implementation is based on the CPython
      * implementation, except that it doesn't special-case -1 -> -2.
@@ -217,13 +216,13 @@ tuple.PY$__hash__ = function (self) {
     var length = self.items.length;
 
     while (length--) {
-        var y = __builtins__.PY$hash(self.items[length]);
+        var y = $PY.rawhash(self.items[length]);
         hash = (hash ^ y) * mult;
         mult += (82520 + length + length);
     }
     hash += 97531;
 
-    return int(hash);
+    return hash;
 };
 
 tuple.PY$__len__ = function(self) {
@@ -29,6 +29,52 @@ __builtins__.PY$list = list;
 
 list.PY$__init__ = tuple.PY$__init__;
 
+/*
+  Lists used as queues, with pop(0), leave the popped items at the front
+  of their array, and only drop them when they make up half of it, which
+  makes pop(0) amortised O(1). Such a list keeps the array in [$buf],
+  with [$head] dead items in front, and [items] becomes an accessor that
+  drops them first, so code outside of the list methods below still sees
+  a plain array.
+*/
+list.$buf = undefined;
+
+$PY.c_queuemin = 32;
+
+$PY.c_queueitems = {
+    get: function() {
+        if (this.$head !== 0) {
+            this.$buf.splice(0, this.$head);
+            this.$head = 0;
+        }
+        return this.$buf;
+    },
+    set: function(value) {
+        this.$buf = value;
+        this.$head = 0;
+    },
+    enumerable: true,
+    configurable: true
+};
+
+$PY.listqueue = function(self) {
+    self.$buf = self.items;
+    self.$head = 0;
+    Object.defineProperty(self, "items", $PY.c_queueitems);
+};
+
+/*
+  Returns the array of [self] and the number of dead items in front of
+  it, without dropping them.
+*/
+$PY.listbuf = function(self) {
+    return self.$buf === undefined ? self.items : self.$buf;
+};
+
+$PY.listhead = function(self) {
+    return self.$buf === undefined ? 0 : self.$head;
+};
+
 list.PY$__str__ = function(self) {
     if (self.items.length === 0) {
         return str("[]");
@@ -57,22 +103,49 @@ list.PY$__repr__ = list.PY$__str__;
 
 list._js_ = tuple._js_;
 
-list.PY$__len__ = tuple.PY$__len__;
+list.PY$__hash__ = function(self) {
+    throw __builtins__.PY$TypeError("unhashable type: 'list'");
+};
+
+list.PY$__len__ = function(self) {
+    if (self.$buf === undefined) {
+        return int(self.items.length);
+    } else {
+        return int(self.$buf.length - self.$head);
+    }
+};
 
 list.PY$__iter__ = tuple.PY$__iter__;
 
 list.PY$__contains__ = tuple.PY$__contains__;
 
-list.PY$__getitem__ = tuple.PY$__getitem__;
+list.PY$__getitem__ = function(self, index) {
+    if (self.$buf === undefined || $PY.isinstance(index, slice)) {
+        return tuple.PY$__getitem__(self, index);
+    }
+    index = js(int(index));
+
+    var head = self.$head;
+    var len = self.$buf.length - head;
+    if (index >= 0 && index < len) {
+        return self.$buf[index + head];
+    } else if (index < 0 && index >= -len) {
+        return self.$buf[index + len + head];
+    } else {
+        throw __builtins__.PY$IndexError("list index out of range");
+    }
+};
 
 list.PY$__setitem__ = function(self, index, value) {
     index = js(int(index));
 
-    var len = self.items.length;
+    var items = $PY.listbuf(self);
+    var head = $PY.listhead(self);
+    var len = items.length - head;
     if (index >= 0 && index < len) {
-        self.items[index] = value;
+        items[index + head] = value;
     } else if (index < 0 && index >= -len) {
-        self.items[index + len] = value;
+        items[index + len + head] = value;
     } else {
         throw __builtins__.PY$IndexError("list index out of range");
     }
@@ -87,7 +160,19 @@ list.PY$__setslice__ = function(self, _start, _stop, _step, value) {
     var slen  = ind[3];
 
     if (step === 1) {
-        self.items = self.items.slice(0, start).concat(it).concat(self.items.slice(stop));
+        var items = self.items;
+        if (stop < start) {
+            stop = start;
+        }
+        if (it.length === stop - start) {
+            for (var i = 0; i < it.length; i++) {
+                items[start + i] = it[i];
+            }
+        } else if (it.length < 8192) {
+            Array.prototype.splice.apply(items, [start, stop - start].concat(it));
+        } else {
+            self.items = items.slice(0, start).concat(it, items.slice(stop));
+        }
     } else {
         var items  = self.items;
         var c = 0;
@@ -112,23 +197,41 @@ list.PY$__setslice__ = function(self, _start, _stop, _step, value) {
 list.PY$__delitem__ = function(self, index) {
     if (typeof(index) !== 'number') index = js(index);
 
-    if ((index >= 0) && (index < self.items.length)) {
-        var a = self.items.slice(0, index);
-        var b = self.items.slice(index+1, self.items.length);
-        self.items = a.concat(b);
+    var items = self.items;
+    if (index < 0) {
+        index += items.length;
+    }
+    if ((index >= 0) && (index < items.length)) {
+        items.splice(index, 1);
     } else
         throw __builtins__.PY$IndexError("list assignment index out of range");
 };
 
-list.PY$__delslice__ = function(self, x, y) {
-    x = js(x);
-    y = js(y);
-    if ((x >= 0) && (y < self.items.length)) {
-        var a = self.items.slice(0, x);
-        var b = self.items.slice(y);
-        self.items = a.concat(b);
-    } else
-        throw __builtins__.PY$IndexError("list assignment index out of range");
+list.PY$__delslice__ = function(self, _start, _stop, _step) {
+    var items = self.items;
+    var ind = $PY.indices(js(_start), js(_stop), _step === undefined ? null : js(_step), items.length);
+    var start = ind[0];
+    var step  = ind[2];
+    var slen  = ind[3];
+
+    if (slen <= 0) {
+        return;
+    } else if (step === 1) {
+        items.splice(start, slen);
+    } else {
+        if (step < 0) {
+            start += (slen - 1) * step;
+            step = -step;
+        }
+        var end = start + slen * step;
+        var w = start;
+        for (var r = start; r < items.length; r++) {
+            if (r >= end || (r - start) % step !== 0) {
+                items[w++] = items[r];
+            }
+        }
+        items.length = w;
+    }
 };
 
 list.PY$count = tuple.PY$count;
@@ -136,78 +239,167 @@ list.PY$count = tuple.PY$count;
 list.PY$index = tuple.PY$index;
 
 list.PY$remove = function(self, value) {
-    self.PY$__delitem__(self, self.PY$index(self, value));
+    self.items.splice(js(self.PY$index(self, value)), 1);
 };
 
 list.PY$append = function(self, value) {
+    var items = $PY.listbuf(self);
     if (typeof(value) === 'string') {
-        self.items.push(str(value));
+        items.push(str(value));
     } else if (typeof(value) === 'number') {
-        self.items.push(int(value));
+        items.push(int(value));
     } else {
-        self.items.push(value);
+        items.push(value);
     }
 };
 
 list.PY$extend = function(self, l) {
     var items;
-    items = self.items;
+    items = $PY.listbuf(self);
     iterate(l, function(item) {
         items.push(item);
     });
 };
 
 list.PY$pop = function(self, index) {
-    if (self.items.length > 0) {
-        var idx;
-        var res;
+    var items = $PY.listbuf(self);
+    var head = $PY.listhead(self);
+    var len = items.length - head;
+    if (len === 0) {
+        throw __builtins__.PY$IndexError("pop from empty list");
+    }
 
-        if (index === undefined) {
-            idx = self.items.length - 1;
-        } else {
-            idx = index._js_();
+    var idx = len - 1;
+    if (index !== undefined) {
+        idx = js(int(index));
+        if (idx < 0) {
+            idx += len;
         }
+    }
 
-        if (idx === self.items.length - 1) {
-            return self.items.pop();
-        } else if (idx < 0 || idx >= self.items.length) {
-            throw __builtins__.PY$IndexError("pop index out of range");
-        } else if (idx == 0) {
-            res = self.items[0];
-            self.items = self.items.slice(1);
-            return res;
-        } else {
-            res = self.items[idx];
-            self.items = Array.prototype.concat(self.items.slice(0, idx), self.items.slice(idx + 1));
-            return res;
+    if (idx === len - 1) {
+        return items.pop();
+    } else if (idx < 0 || idx >= len) {
+        throw __builtins__.PY$IndexError("pop index out of range");
+    } else if (idx === 0 && (head !== 0 || len >= $PY.c_queuemin)) {
+        if (self.$buf === undefined) {
+            $PY.listqueue(self);
         }
-
+        var res = items[head];
+        items[head] = undefined;
+        head += 1;
+        if (head * 2 >= items.length) {
+            items.splice(0, head);
+            head = 0;
+        }
+        self.$head = head;
+        return res;
     } else {
-        throw __builtins__.PY$IndexError("pop from empty list");
+        return items.splice(idx + head, 1)[0];
+    }
+};
+
+/*
+  Returns "number" if all of [keys] are ints or floats, "string" if they
+  are all str, and undefined otherwise. Sorts of such keys compare the
+  javascript values directly, instead of calling __cmp__.
+*/
+$PY.sortkind = function(keys) {
+    var kind;
+    for (var i = 0; i < keys.length; i++) {
+        var k = keys[i];
+        var cls = k.PY$__class__;
+        var t;
+        if (typeof k === 'number' || cls === int || cls === float || cls === bool) {
+            t = "number";
+        } else if (cls === str) {
+            t = "string";
+        } else {
+            return undefined;
+        }
+        if (kind === undefined) {
+            kind = t;
+        } else if (kind !== t) {
+            return undefined;
+        }
     }
+    return kind;
 };
 
 list.PY$sort = function(self) {
     var pyargs = __uncook(arguments);
     var cmp = pyargs.varargs[1];
-    if (cmp === undefined) { cmp = pyargs.kw.cmp === undefined ? function(a, b) { return js(a.PY$__cmp__(a, b));} : pyargs.kw.cmp; };
+    if (cmp === undefined) { cmp = pyargs.kw.cmp; };
 
     var key = pyargs.varargs[2];
-    if (key === undefined) { key = pyargs.kw.key === undefined ? function(x) { return x; } : pyargs.kw.key; };
+    if (key === undefined) { key = pyargs.kw.key; };
 
     var reverse = pyargs.varargs[3];
-    if (reverse === undefined) { reverse = pyargs.kw.reverse === undefined ? False : pyargs.kw.reverse; };
+    if (reverse === undefined) { reverse = pyargs.kw.reverse; };
+
+    var items = self.items;
+    var n = items.length;
+    var keys = items;
+    if (key !== undefined && key !== None) {
+        keys = new Array(n);
+        for (var i = 0; i < n; i++) {
+            keys[i] = key(items[i]);
+        }
+    }
 
-    var direction = reverse === True ? -1 : 1;
+    var compare;
+    var kind = (cmp === undefined || cmp === None) ? $PY.sortkind(keys) : undefined;
+    if (kind === undefined) {
+        if (cmp === undefined || cmp === None) {
+            compare = function(i, j) { var a = keys[i]; return js(a.PY$__cmp__(a, keys[j])); };
+        } else {
+            compare = function(i, j) { return js(cmp(keys[i], keys[j])); };
+        }
+    } else {
+        var vals = new Array(n);
+        for (var i = 0; i < n; i++) {
+            vals[i] = typeof keys[i] === 'number' ? keys[i] : keys[i].obj;
+        }
+        if (kind === "number") {
+            compare = function(i, j) { return vals[i] - vals[j]; };
+        } else {
+            compare = function(i, j) { return vals[i] < vals[j] ? -1 : (vals[i] > vals[j] ? 1 : 0); };
+        }
+    }
+
+    /*
+      The indexes are sorted, and ties are broken by index, which keeps
+      the sort stable in both directions.
+    */
+    var order = new Array(n);
+    for (var i = 0; i < n; i++) {
+        order[i] = i;
+    }
+    if (reverse !== undefined && bool(reverse) === True) {
+        order.sort(function(i, j) { return compare(j, i) || i - j; });
+    } else {
+        order.sort(function(i, j) { return compare(i, j) || i - j; });
+    }
 
-    self.items.sort(function(a, b) {return js(cmp(key(a), key(b))) * direction;});
+    var res = new Array(n);
+    for (var i = 0; i < n; i++) {
+        res[i] = items[order[i]];
+    }
+    for (var i = 0; i < n; i++) {
+        items[i] = res[i];
+    }
+    return None;
 };
 
 list.PY$insert = function(self, index, x) {
-    var i = js(index);
-    var a = self.items.slice(0, i);
-    var b = self.items.slice(i);
-    self.items = a.concat([x], b);
+    var items = self.items;
+    var i = js(int(index));
+    if (i < 0) {
+        i = Math.max(0, i + items.length);
+    } else if (i > items.length) {
+        i = items.length;
+    }
+    items.splice(i, 0, x);
 };
 
 list.PY$reverse = function(self) {
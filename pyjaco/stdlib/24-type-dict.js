@@ -23,63 +23,295 @@
   OTHER DEALINGS IN THE SOFTWARE.
 **/
 
+/*
+  Hash tables, as used by dict (and set).
+
+  Entries are kept in insertion order, in the parallel arrays [keys] and
+  [values]. Deleted entries leave a hole ($PY.c_deleted) which is
+  compacted away once there are more holes than entries.
+
+  Keys of the builtin str, unicode, int, float and bool types (and raw
+  javascript strings and numbers) are looked up directly in a javascript
+  Map, keyed by their javascript value, so they never call __hash__ or
+  __eq__. Since 1 == 1.0 == True in python, all numbers share the same
+  key space. Other keys go into [buckets], a Map from their (raw) hash
+  to the list of slots with that hash, and are compared with __eq__.
+*/
+
+$PY.c_deleted = {};
+
+$PY.HashTable = function() {
+    this.clear();
+};
+
+$PY.HashTable.prototype.clear = function() {
+    this.keys = [];
+    this.values = [];
+    this.hashes = [];
+    this.index = new Map();
+    this.buckets = null;
+    this.size = 0;
+    this.holes = 0;
+};
+
+$PY.HashTable.prototype.copy = function() {
+    var res = new $PY.HashTable();
+    var keys = this.keys;
+    for (var i = 0; i < keys.length; i++) {
+        if (keys[i] !== $PY.c_deleted) {
+            res.set(keys[i], this.values[i]);
+        }
+    }
+    return res;
+};
+
+/*
+  Returns the javascript value used to index [key] in the fast Map, or
+  undefined if [key] must be hashed.
+*/
+$PY.primkey = function(key) {
+    var type = typeof key;
+    if (type === 'string' || type === 'number') {
+        return key;
+    }
+    var cls = key.PY$__class__;
+    if (cls === str || cls === basestring || cls === int || cls === float || cls === bool || cls === unicode) {
+        return key.obj;
+    }
+    return undefined;
+};
+
+/*
+  Returns the hash of [key] as a javascript number. Objects without a
+  __hash__ method (and classes) are hashed by identity. The __hash__
+  methods of builtin types have a [raw] version, which returns the hash
+  without boxing it.
+*/
+$PY.rawhash = function(key) {
+    var type = typeof key;
+    if (type === 'number') {
+        return key;
+    } else if (type === 'string') {
+        return $PY.strhash(key);
+    }
+    var hash = key.PY$__hash__;
+    if (hash === undefined || key.PY$__class__ === undefined) {
+        return $PY.id(key);
+    } else if (hash.raw !== undefined) {
+        return hash.raw(key);
+    }
+    hash = hash(key);
+    return typeof hash === 'number' ? hash : hash.obj;
+};
+
+$PY.eqtrue = function(res) {
+    return res === True || (res !== False && bool(res) === True);
+};
+
+$PY.keyeq = function(a, b) {
+    return a === b || $PY.eqtrue(a.PY$__eq__(a, b)) || (b.PY$__eq__ !== undefined && $PY.eqtrue(b.PY$__eq__(b, a)));
+};
+
+/*
+  Returns the slot of [key] among the hashed keys with hash [hash]. A
+  builtin number can be equal to a hashed key with the same hash, so
+  numbers are checked both ways.
+*/
+$PY.HashTable.prototype.probe = function(key, hash) {
+    var keys = this.keys;
+    var slot;
+    if (this.buckets !== null) {
+        var chain = this.buckets.get(hash);
+        if (chain !== undefined) {
+            for (var i = 0; i < chain.length; i++) {
+                slot = chain[i];
+                if ($PY.keyeq(keys[slot], key)) {
+                    return slot;
+                }
+            }
+        }
+    }
+    slot = this.index.get(hash);
+    if (slot !== undefined && $PY.keyeq(keys[slot], key)) {
+        return slot;
+    }
+    return -1;
+};
+
+$PY.HashTable.prototype.find = function(key) {
+    var prim = $PY.primkey(key);
+    if (prim !== undefined) {
+        var slot = this.index.get(prim);
+        if (slot !== undefined) {
+            return slot;
+        } else if (this.buckets !== null && typeof prim === 'number') {
+            return this.probe(key, prim);
+        } else {
+            return -1;
+        }
+    }
+    return this.probe(key, $PY.rawhash(key));
+};
+
+$PY.HashTable.prototype.has = function(key) {
+    return this.find(key) !== -1;
+};
+
+$PY.HashTable.prototype.get = function(key, value) {
+    var slot = this.find(key);
+    return slot === -1 ? value : this.values[slot];
+};
+
+$PY.HashTable.prototype.set = function(key, value) {
+    var prim = $PY.primkey(key);
+    var slot;
+    var hash;
+    if (prim !== undefined) {
+        slot = this.index.get(prim);
+        if (slot === undefined && this.buckets !== null && typeof prim === 'number') {
+            slot = this.probe(key, prim);
+        }
+    } else {
+        hash = $PY.rawhash(key);
+        slot = this.probe(key, hash);
+    }
+    if (slot !== undefined && slot !== -1) {
+        this.values[slot] = value;
+        return;
+    }
+    slot = this.keys.length;
+    this.keys.push(key);
+    this.values.push(value);
+    if (prim !== undefined) {
+        this.hashes.push(undefined);
+        this.index.set(prim, slot);
+    } else {
+        this.hashes.push(hash);
+        this.chain(hash).push(slot);
+    }
+    this.size++;
+};
+
+$PY.HashTable.prototype.chain = function(hash) {
+    if (this.buckets === null) {
+        this.buckets = new Map();
+    }
+    var chain = this.buckets.get(hash);
+    if (chain === undefined) {
+        chain = [];
+        this.buckets.set(hash, chain);
+    }
+    return chain;
+};
+
+/*
+  Removes the entry in [slot], which must be in use.
+*/
+$PY.HashTable.prototype.drop = function(slot) {
+    var keys = this.keys;
+    var hash = this.hashes[slot];
+    if (hash === undefined) {
+        this.index["delete"]($PY.primkey(keys[slot]));
+    } else {
+        var chain = this.buckets.get(hash);
+        if (chain.length === 1) {
+            this.buckets["delete"](hash);
+        } else {
+            chain.splice(chain.indexOf(slot), 1);
+        }
+    }
+    keys[slot] = $PY.c_deleted;
+    this.values[slot] = undefined;
+    this.hashes[slot] = undefined;
+    this.size--;
+    this.holes++;
+
+    while (keys.length > 0 && keys[keys.length - 1] === $PY.c_deleted) {
+        keys.pop();
+        this.values.pop();
+        this.hashes.pop();
+        this.holes--;
+    }
+    if (this.holes > 8 && this.holes > this.size) {
+        this.compact();
+    }
+};
+
+$PY.HashTable.prototype.remove = function(key) {
+    var slot = this.find(key);
+    if (slot !== -1) {
+        this.drop(slot);
+    }
+    return slot !== -1;
+};
+
+$PY.HashTable.prototype.compact = function() {
+    var keys = this.keys;
+    var values = this.values;
+    var hashes = this.hashes;
+    this.clear();
+    for (var i = 0; i < keys.length; i++) {
+        if (keys[i] !== $PY.c_deleted) {
+            var slot = this.keys.length;
+            this.keys.push(keys[i]);
+            this.values.push(values[i]);
+            this.hashes.push(hashes[i]);
+            if (hashes[i] === undefined) {
+                this.index.set($PY.primkey(keys[i]), slot);
+            } else {
+                this.chain(hashes[i]).push(slot);
+            }
+            this.size++;
+        }
+    }
+};
+
+/*
+  Returns the slot of the most recently inserted entry, or -1.
+*/
+$PY.HashTable.prototype.last = function() {
+    return this.keys.length - 1;
+};
+
+$PY.HashTable.prototype.each = function(func) {
+    var keys = this.keys;
+    for (var i = 0; i < keys.length; i++) {
+        if (keys[i] !== $PY.c_deleted) {
+            func(keys[i], this.values[i]);
+        }
+    }
+};
+
 var dict = __inherit(object, "dict");
 
 __builtins__.PY$dict = dict;
 
 dict.PY$__init__ = function(self) {
-    var items;
-    var key;
-    var value;
-    var hash;
-    var count = 0;
-
     var pyargs = __uncook(arguments);
     var args = pyargs.varargs[1];
+    var table;
     if (args !== undefined) {
         if (args.PY$__class__ === dict) {
-            items = {};
-            for (hash in args.items) {
-                value = args.items[hash];
-                items[hash] = [value[0], value[1]];
-                count++;
-            }
+            table = args.table.copy();
         } else if (args.PY$__iter__ !== undefined) {
-            items = {};
+            table = new $PY.HashTable();
             iterate(args, function(item) {
-                        var key = item.PY$__getitem__(item, $c0);
-                        var hash = __builtins__.PY$hash(key);
-                        if (!(hash in items)) {
-                            count++;
-                        }
-                        items[hash] = [key, item.PY$__getitem__(item, $c1)];
+                        table.set(item.PY$__getitem__(item, $c0), item.PY$__getitem__(item, $c1));
             });
         } else if (args.length === undefined) {
-            items = {};
+            table = new $PY.HashTable();
             for (var item in args) {
-                key = str(item);
-                hash = __builtins__.PY$hash(key);
-                if (!(hash in items)) {
-                    count++;
-                }
-                items[hash] = [key, args[item]];
+                table.set(str(item), args[item]);
             };
         } else {
-            items = {};
-            for (var i = 0; i < args.length; i += 2)
-            {
-                hash = __builtins__.PY$hash(args[i]);
-                if (!(hash in items)) {
-                    count++;
-                }
-                items[hash] = [args[i], args[i+1]];
+            table = new $PY.HashTable();
+            for (var i = 0; i < args.length; i += 2) {
+                table.set(args[i], args[i+1]);
             }
         }
-        self.items = items;
-        self.count = count;
+        self.table = table;
     } else {
-        self.items = {};
-        self.count = 0;
+        self.table = new $PY.HashTable();
     }
     if (pyargs.kwargs !== undefined) {
         self.PY$update(self, pyargs.kwargs);
@@ -91,11 +323,10 @@ dict.PY$__init__ = function(self) {
 
 dict.PY$__str__ = function(self) {
     var strings = [];
-    var items = self.items;
 
-    for (var hash in items) {
-        strings.push($PY.repr(items[hash][0]) + ": " + $PY.repr(items[hash][1]));
-    }
+    self.table.each(function(key, value) {
+        strings.push($PY.repr(key) + ": " + $PY.repr(value));
+    });
 
     return str("{" + js(strings.join(", ")) + "}");
 };
@@ -105,9 +336,9 @@ dict.PY$__repr__ = dict.PY$__str__;
 dict._js_ = function() {
     var items = {};
 
-    for (var hash in this.items) {
-        items[str(this.items[hash][0])] = js(this.items[hash][1]);
-    }
+    this.table.each(function(key, value) {
+        items[str(key)] = js(value);
+    });
 
     return items;
 };
@@ -117,58 +348,43 @@ dict.PY$__hash__ = function(self) {
 };
 
 dict.PY$__len__ = function(self) {
-    return int(self.count);
+    return int(self.table.size);
 };
 
 dict.PY$__iter__ = function(self) {
-    return iter(self.PY$keys(self));
+    return $PY.dictiter(self.table, 0);
 };
 
 dict.PY$__contains__ = function(self, key) {
-    var items = self.items;
-    var hash = __builtins__.PY$hash(key);
-    return hash in items ? True : False;
+    return self.table.find(key) !== -1 ? True : False;
 };
 
 dict.PY$__getitem__ = function(self, key) {
-    var items = self.items;
-    var hash = __builtins__.PY$hash(key);
-    if (hash in items) {
-        return items[hash][1];
+    var table = self.table;
+    var slot = table.find(key);
+    if (slot !== -1) {
+        return table.values[slot];
     } else {
         throw __builtins__.PY$KeyError(str(key));
     }
-    return None;
 };
 
 dict.PY$__setitem__ = function(self, key, value) {
-    var items = self.items;
-    var hash = __builtins__.PY$hash(key);
-    if (hash in items) {
-        items[hash][1] = value;
-    } else {
-        items[hash] = [key, value];
-        self.count++;
-    }
+    self.table.set(key, value);
     return None;
 };
 
 dict.PY$__delitem__ = function(self, key) {
-    var items = self.items;
-    var hash = __builtins__.PY$hash(key);
-    if (hash in items) {
-        delete items[hash];
-        self.count--;
-    } else {
+    if (!self.table.remove(key)) {
         throw __builtins__.PY$KeyError(str(key));
     }
 };
 
 dict.PY$get = function(self, key, value) {
-    var items = self.items;
-    var hash = __builtins__.PY$hash(key);
-    if (hash in items) {
-        return items[hash][1];
+    var table = self.table;
+    var slot = table.find(key);
+    if (slot !== -1) {
+        return table.values[slot];
     } else if (value !== undefined) {
         return value;
     } else {
@@ -177,59 +393,97 @@ dict.PY$get = function(self, key, value) {
 };
 
 dict.PY$items = function(self) {
+    if (__builtins__.PY$__python3__) {
+        return $PY.dict_items(self);
+    }
+
     var res = [];
-    var items = self.items;
 
-    for (var hash in items) {
-        res.push(tuple(items[hash]));
-    }
+    self.table.each(function(key, value) {
+        res.push(tuple([key, value]));
+    });
 
     return list(res);
 };
 
 dict.PY$keys = function(self) {
+    if (__builtins__.PY$__python3__) {
+        return $PY.dict_keys(self);
+    }
+
     var res = [];
-    var items = self.items;
 
-    for (var hash in items) {
-        res.push(items[hash][0]);
-    }
+    self.table.each(function(key, value) {
+        res.push(key);
+    });
 
     return list(res);
 };
 
 dict.PY$values = function(self) {
+    if (__builtins__.PY$__python3__) {
+        return $PY.dict_values(self);
+    }
+
     var res = [];
-    var items = self.items;
 
-    for (var hash in items) {
-        res.push(items[hash][1]);
-    }
+    self.table.each(function(key, value) {
+        res.push(value);
+    });
 
     return list(res);
 };
 
+dict.PY$iterkeys = function(self) {
+    return $PY.dictiter(self.table, 0);
+};
+
+dict.PY$itervalues = function(self) {
+    return $PY.dictiter(self.table, 1);
+};
+
+dict.PY$iteritems = function(self) {
+    return $PY.dictiter(self.table, 2);
+};
+
+dict.PY$viewkeys = function(self) {
+    return $PY.dict_keys(self);
+};
+
+dict.PY$viewvalues = function(self) {
+    return $PY.dict_values(self);
+};
+
+dict.PY$viewitems = function(self) {
+    return $PY.dict_items(self);
+};
+
 dict.PY$update = function(self, other) {
-   iterate(other,
-     function(key) {
-         self.PY$__setitem__(self, key, other.PY$__getitem__(other, key));
-     }
-   );
+    if (other.PY$__class__ === dict) {
+        var table = self.table;
+        other.table.each(function(key, value) {
+            table.set(key, value);
+        });
+    } else {
+        iterate(other,
+          function(key) {
+              self.PY$__setitem__(self, key, other.PY$__getitem__(other, key));
+          }
+        );
+    }
 };
 
 dict.PY$clear = function(self) {
-    self.items = [];
+    self.table.clear();
 };
 
 dict.PY$pop = function(self, key, value) {
-    var items = self.items;
-    var res = null;
-    var hash = __builtins__.PY$hash(key);
-    if (hash in items) {
-        res = items[hash];
-        delete items[hash];
-        self.count--;
-        return res[1];
+    var table = self.table;
+    var slot = table.find(key);
+    if (slot !== -1) {
+        var res = table.values[slot];
+        table.drop(slot);
+        return res;
     } else if (value !== undefined) {
         return value;
     } else {
@@ -238,12 +492,154 @@ dict.PY$pop = function(self, key, value) {
 };
 
 dict.PY$popitem = function(self) {
-    var items = self.items;
-    for (var hash in items) {
-        var res = tuple(items[hash]);
-        delete items[hash];
-        self.count--;
-        return res;
+    var table = self.table;
+    var slot = table.last();
+    if (slot === -1) {
+        throw __builtins__.PY$KeyError("popitem(): dictionary is empty");
     }
-    throw __builtins__.PY$KeyError("popitem(): dictionary is empty");
+    var res = tuple([table.keys[slot], table.values[slot]]);
+    table.drop(slot);
+    return res;
+};
+
+/*
+  Iterates the keys (kind 0), values (kind 1) or items (kind 2) of a
+  hash table, walking its slots in place. Like python, it raises
+  RuntimeError if the size of the table changes while iterating.
+*/
+var dictiter = __inherit(object, "dictionary-iterator");
+
+dictiter.PY$__init__ = function(self, table, kind) {
+    self.table = table;
+    self.kind = kind;
+    self.paired = kind === 2;
+    self.index = 0;
+    self.used = table.size;
+    self.key = undefined;
+    self.value = undefined;
 };
+
+dictiter.PY$__iter__ = function(self) {
+    return self;
+};
+
+dictiter.PY$__str__ = function(self) {
+    return str("<dictionary-iterator object>");
+};
+
+dictiter.PY$__repr__ = dictiter.PY$__str__;
+
+/*
+  Moves to the next entry, setting [key] and [value]. Returns false when
+  the table is exhausted.
+*/
+dictiter.advance = function() {
+    var table = this.table;
+    if (table.size !== this.used) {
+        this.used = -1;
+        throw __builtins__.PY$RuntimeError("dictionary changed size during iteration");
+    }
+    var keys = table.keys;
+    while (this.index < keys.length) {
+        var i = this.index++;
+        if (keys[i] !== $PY.c_deleted) {
+            this.key = keys[i];
+            this.value = table.values[i];
+            return true;
+        }
+    }
+    return false;
+};
+
+dictiter.__pyjaco_next__ = function() {
+    if (!this.advance()) {
+        return null;
+    } else if (this.kind === 0) {
+        return this.key;
+    } else if (this.kind === 1) {
+        return this.value;
+    } else {
+        return tuple([this.key, this.value]);
+    }
+};
+
+$PY.nextable(dictiter);
+
+$PY.dictiter = dictiter;
+
+/*
+  Like $PY.pairs, for obj.items() (or obj.iteritems(), if [live]). The
+  pairs of a dict are read from its table without making tuples;
+  items() walks a copy of the slots, since the loop may change the dict.
+*/
+$PY.dictpairs = function(obj, live) {
+    if (obj.PY$__class__ === dict) {
+        var table = obj.table;
+        if (!live) {
+            table = {keys: table.keys.slice(), values: table.values.slice(), size: table.size};
+        }
+        return $PY.dictiter(table, 2);
+    }
+    return $PY.pairs($PY.callmethod(obj, $PY.attrcache(live ? "iteritems" : "items")));
+};
+
+/*
+  Views of the keys, values and items of a dict, as returned by
+  viewkeys(), viewvalues() and viewitems(), and by keys(), values() and
+  items() under python 3 semantics.
+*/
+var dictview = __inherit(object, "dictview");
+
+dictview.PY$__init__ = function(self, d) {
+    self.dict = d;
+};
+
+dictview.PY$__iter__ = function(self) {
+    return $PY.dictiter(self.dict.table, self.kind);
+};
+
+dictview.PY$__len__ = function(self) {
+    return int(self.dict.table.size);
+};
+
+dictview.PY$__contains__ = function(self, item) {
+    var table = self.dict.table;
+    if (self.kind === 0) {
+        return table.find(item) !== -1 ? True : False;
+    } else if (self.kind === 2) {
+        if (item.PY$__class__ !== tuple || item.items.length !== 2) {
+            return False;
+        }
+        var slot = table.find(item.items[0]);
+        return slot !== -1 && $PY.keyeq(table.values[slot], item.items[1]) ? True : False;
+    }
+    var values = table.values;
+    for (var i = 0; i < values.length; i++) {
+        if (table.keys[i] !== $PY.c_deleted && $PY.keyeq(values[i], item)) {
+            return True;
+        }
+    }
+    return False;
+};
+
+dictview.PY$__str__ = function(self) {
+    var items = list();
+    iterate(self, function(item) {
+        items.PY$append(items, item);
+    });
+    return str(self.PY$__class__.PY$__name__ + "(" + js($PY.repr(items)) + ")");
+};
+
+dictview.PY$__repr__ = dictview.PY$__str__;
+
+var dict_keys = __inherit(dictview, "dict_keys");
+var dict_values = __inherit(dictview, "dict_values");
+var dict_items = __inherit(dictview, "dict_items");
+
+dict_keys.kind = 0;
+dict_values.kind = 1;
+dict_items.kind = 2;
+
+$PY.dict_keys = dict_keys;
+$PY.dict_values = dict_values;
+$PY.dict_items = dict_items;
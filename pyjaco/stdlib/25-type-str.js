@@ -41,8 +41,27 @@ basestring.PY$__init__ = function(self, s) {
 
 var __basestring_real__ = basestring.PY$__create__;
 
+/*
+  Short strings made from javascript strings are interned, so the same
+  str object is returned every time. The table is bounded.
+*/
+$PY.c_interned = new Map();
+
+$PY.intern = function(s) {
+    var res = $PY.c_interned.get(s);
+    if (res === undefined) {
+        res = __basestring_real__(str, s);
+        if ($PY.c_interned.size < 65536) {
+            $PY.c_interned.set(s, res);
+        }
+    }
+    return res;
+};
+
 basestring.PY$__create__ = function(cls, obj) {
-    if ($PY.isinstance(obj, basestring)) {
+    if (typeof obj === 'string' && cls === str && obj.length <= 64) {
+        return $PY.intern(obj);
+    } else if ($PY.isinstance(obj, basestring)) {
         return obj;
     } else if (obj.PY$__class__ === undefined && obj.PY$__super__ !== undefined) {
         return object.PY$__repr__(obj);
@@ -73,7 +92,7 @@ basestring._js_ = function() {
     return this.obj;
 };
 
-basestring.PY$__hash__ = function (self) {
+$PY.strhash = function(s) {
     /*
      * This hash implementation is based on the CPython
      * implementation, except that it cannot produce the same results
@@ -85,25 +104,37 @@ basestring.PY$__hash__ = function (self) {
      * We might support true hashes in the future, with a proper
      * implementation of the long-type.
      */
-    if (self.obj === "") {
-        return $c0;
+    if (s === "") {
+        return 0;
     }
-    var len = this.obj.length;
+    var len = s.length;
 
-    var hash = this.obj.charCodeAt(0) << 7;
+    var hash = s.charCodeAt(0) << 7;
     for (var i = 0; i < len; i++) {
-        hash = (1000003 * hash) ^ this.obj.charCodeAt(i);
+        hash = (1000003 * hash) ^ s.charCodeAt(i);
     }
     hash ^= len;
-    return int(hash);
+    return hash;
 };
 
-basestring.PY$__len__ = function(self) {
-    return int(self.obj.length);
+basestring.PY$__hash__ = function (self) {
+    return int(basestring.PY$__hash__.raw(self));
 };
 
-basestring.PY$__iter__ = function(self) {
-    return iter(self.obj);
+/*
+  Strings are immutable, so the hash is computed once, and kept on the
+  string object.
+*/
+basestring.PY$__hash__.raw = function(self) {
+    var hash = self.hash;
+    if (hash === undefined) {
+        hash = self.hash = $PY.strhash(self.obj);
+    }
+    return hash;
+};
+
+basestring.PY$__len__ = function(self) {
+    return int(self.obj.length);
 };
 
 basestring.PY$__mod__ = function(self, args) {
@@ -148,13 +179,13 @@ basestring.PY$__lt__ = function(self, s) {
 };
 
 basestring.PY$__contains__ = function(self, item) {
-    for (var index in self.obj) {
-        if (item === self.obj[index]) {
-            return True;
+    if (typeof item !== 'string') {
+        if (!$PY.isinstance(item, __builtins__.PY$basestring)) {
+            throw __builtins__.PY$TypeError("'in <string>' requires string as left operand");
         }
+        item = item.obj;
     }
-
-    return False;
+    return self.obj.indexOf(item) !== -1 ? True : False;
 };
 
 basestring.PY$__getitem__ = function(self, index) {
@@ -264,7 +295,14 @@ basestring.PY$rfind = function(self, s) {
 };
 
 basestring.PY$join = function(self, s) {
-    return self.PY$__class__(js(s).join(js(self)));
+    if (s.PY$__class__ === list || s.PY$__class__ === tuple) {
+        return self.PY$__class__(js(s).join(js(self)));
+    }
+    var items = [];
+    iterate(s, function(item) {
+        items.push(js(item));
+    });
+    return self.PY$__class__(items.join(js(self)));
 };
 
 basestring.PY$replace = function(self, s, r, count) {
@@ -383,6 +421,65 @@ basestring.PY$endswith = function(self, other) {
     return (i !== -1 && i === (self.obj.length - x.length)) ? True : False;
 };
 
+/*
+  Single characters produced by iteration are boxed through a shared
+  table, one for str and one for unicode, so iterating a string does not
+  create a new object per character.
+*/
+$PY.c_chars = [];
+$PY.c_uchars = [];
+
+$PY.char = function(c, cls) {
+    var code = c.charCodeAt(0);
+    var table = cls === str ? $PY.c_chars : $PY.c_uchars;
+    var res = table[code];
+    if (res === undefined) {
+        res = table[code] = cls === str ? $PY.intern(c) : __basestring_real__(cls, c);
+    }
+    return res;
+};
+
+/*
+  Iterates a string one character at a time. Like len() and indexing,
+  it counts UTF-16 code units, so a surrogate pair is read as two
+  characters, as on a narrow Python build.
+*/
+var striter = __inherit(object, "striterator");
+
+striter.PY$__init__ = function(self, s, cls) {
+    self.s = s;
+    self.cls = cls || str;
+    self.index = 0;
+};
+
+striter.PY$__iter__ = function(self) {
+    return self;
+};
+
+striter.PY$__str__ = function(self) {
+    return str("<striterator object>");
+};
+
+striter.PY$__repr__ = striter.PY$__str__;
+
+striter.__pyjaco_next__ = function() {
+    var s = this.s;
+    var i = this.index;
+    if (i >= s.length) {
+        return null;
+    }
+    this.index = i + 1;
+    return $PY.char(s.charAt(i), this.cls);
+};
+
+$PY.nextable(striter);
+
+$PY.striter = striter;
+
+basestring.PY$__iter__ = function(self) {
+    return $PY.striter(self.obj, $PY.isinstance(self, unicode) ? unicode : str);
+};
+
 var str = __inherit(basestring, "str");
 var unicode = __inherit(basestring, "unicode");
 
@@ -148,3 +148,40 @@ number.PY$__iadd__      = number.PY$__add__;
 number.PY$__idiv__      = number.PY$__div__;
 number.PY$__isub__      = number.PY$__sub__;
 number.PY$__ipow__      = number.PY$__pow__;
+
+/*
+  Arithmetic on unboxed javascript numbers. The compiler emits calls to
+  these for the operators where javascript and python disagree.
+*/
+
+$PY.idiv = function(a, b) {
+    if (b === 0)
+        throw __builtins__.PY$ZeroDivisionError("integer division or modulo by zero");
+    return Math.floor(a / b);
+};
+
+$PY.imod = function(a, b) {
+    if (b === 0)
+        throw __builtins__.PY$ZeroDivisionError("integer division or modulo by zero");
+    var res = a % b;
+    return (res !== 0 && (res < 0) !== (b < 0)) ? res + b : res;
+};
+
+$PY.fdiv = function(a, b) {
+    if (b === 0)
+        throw __builtins__.PY$ZeroDivisionError("float division by zero");
+    return a / b;
+};
+
+$PY.ffloordiv = function(a, b) {
+    if (b === 0)
+        throw __builtins__.PY$ZeroDivisionError("float divmod()");
+    return Math.floor(a / b);
+};
+
+$PY.fmod = function(a, b) {
+    if (b === 0)
+        throw __builtins__.PY$ZeroDivisionError("float modulo");
+    var res = a % b;
+    return (res !== 0 && (res < 0) !== (b < 0)) ? res + b : res;
+};
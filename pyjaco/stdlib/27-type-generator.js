@@ -0,0 +1,164 @@
+/**
+  Copyright 2011-2013 Christian Iversen <chrivers@iversen-net.dk>
+
+  Permission is hereby granted, free of charge, to any person
+  obtaining a copy of this software and associated documentation
+  files (the "Software"), to deal in the Software without
+  restriction, including without limitation the rights to use,
+  copy, modify, merge, publish, distribute, sublicense, and/or sell
+  copies of the Software, and to permit persons to whom the
+  Software is furnished to do so, subject to the following
+  conditions:
+
+  The above copyright notice and this permission notice shall be
+  included in all copies or substantial portions of the Software.
+
+  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+  OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+  NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+  HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+  OTHER DEALINGS IN THE SOFTWARE.
+**/
+
+/*
+  Generator objects, as returned by calling a function containing yield,
+  or by a generator expression.
+
+  The compiler turns the function body into a resume function (a state
+  machine), which is called with the generator every time a value is
+  needed. It returns the next value, or $PY.c_stopgen when the body is
+  done. Alternatively, a native javascript generator can be wrapped.
+*/
+
+var generator = __inherit(object, "generator");
+
+__builtins__.PY$generator = generator;
+
+$PY.c_stopgen = {};
+
+generator.PY$__init__ = function(self, body) {
+    if (typeof body === 'function') {
+        self.resume = body;
+    } else {
+        self.gen = body;
+    }
+    self.running = false;
+    self.started = false;
+    self.finished = false;
+    self.sent = None;
+    self.thrown = undefined;
+};
+
+generator.PY$__iter__ = function(self) {
+    return self;
+};
+
+generator.PY$__str__ = function(self) {
+    return str("<generator object>");
+};
+
+generator.PY$__repr__ = generator.PY$__str__;
+
+/*
+  Run the generator until its next yield, returning the yielded value,
+  or null when it is exhausted. A StopIteration escaping the body ends
+  the generator, as in Python 2.
+*/
+generator.step = function(self, value, exc) {
+    if (self.finished) {
+        if (exc !== undefined)
+            throw exc;
+        return null;
+    }
+    if (self.running)
+        throw __builtins__.PY$ValueError("generator already executing");
+    self.running = true;
+    self.started = true;
+    self.sent = value;
+    self.thrown = exc;
+    try {
+        var res;
+        if (self.gen !== undefined) {
+            var r = exc === undefined ? self.gen.next(value) : self.gen["throw"](exc);
+            res = r.done ? $PY.c_stopgen : r.value;
+        } else {
+            res = self.resume(self);
+        }
+    } catch (e) {
+        self.finished = true;
+        if (e === $PY.c_stopiter || e === __builtins__.PY$StopIteration || $PY.isinstance(e, __builtins__.PY$StopIteration)) {
+            return null;
+        }
+        throw e;
+    } finally {
+        self.running = false;
+    }
+    if (res === $PY.c_stopgen) {
+        self.finished = true;
+        return null;
+    }
+    return res;
+};
+
+generator.__pyjaco_next__ = function() {
+    return generator.step(this, None);
+};
+
+$PY.nextable(generator);
+
+generator.PY$send = function(self, value) {
+    if (!self.started && value !== None)
+        throw __builtins__.PY$TypeError("can't send non-None value to a just-started generator");
+    var res = generator.step(self, value);
+    if (res === null)
+        throw $PY.c_stopiter;
+    return res;
+};
+
+generator.PY$throw = function(self, exc) {
+    if (exc.__isclass)
+        exc = exc();
+    if (!self.started) {
+        self.finished = true;
+        throw exc;
+    }
+    var res = generator.step(self, None, exc);
+    if (res === null)
+        throw $PY.c_stopiter;
+    return res;
+};
+
+generator.PY$close = function(self) {
+    if (self.finished || !self.started) {
+        self.finished = true;
+        return None;
+    }
+    try {
+        generator.step(self, None, __builtins__.PY$GeneratorExit());
+    } catch (e) {
+        if ($PY.isinstance(e, __builtins__.PY$GeneratorExit) || $PY.isinstance(e, __builtins__.PY$StopIteration)) {
+            return None;
+        }
+        throw e;
+    }
+    if (!self.finished)
+        throw __builtins__.PY$RuntimeError("generator ignored GeneratorExit");
+    return None;
+};
+
+/*
+  Called by the compiled state machine where it resumes after a yield:
+  raises the exception passed to throw(), or returns the value passed to
+  send().
+*/
+$PY.resume = function(gen) {
+    var exc = gen.thrown;
+    if (exc !== undefined) {
+        gen.thrown = undefined;
+        throw exc;
+    }
+    return gen.sent;
+};
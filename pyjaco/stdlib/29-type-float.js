@@ -31,6 +31,10 @@ float.numbertype = "PY$__float__";
 float.numberclass = float;
 
 float.PY$__init__ = function(self, value) {
+    if (typeof value === 'number') {
+        self.obj = value;
+        return;
+    }
     var s = str(value)._js_();
     if (s.match(/^[-+]?[0-9]+(\.[0-9]*)?(e[-+]?[0-9]+)?$/)) {
         self.obj = parseFloat(s);
@@ -73,7 +77,21 @@ float.PY$__str__ = function(self) {
 float.PY$__repr__ = float.PY$__str__;
 
 float.PY$__hash__ = function(self) {
-    return self.obj;
+    return int(float.PY$__hash__.raw(self));
+};
+
+float.PY$__hash__.raw = function(self) {
+    /*
+     * Integral floats hash like the equal int. Other values are
+     * scrambled into an integer.
+     */
+    var x = self.obj;
+    if (x % 1 === 0) {
+        return x;
+    } else if (!isFinite(x)) {
+        return x !== x ? 0 : x > 0 ? 314159 : -271828;
+    }
+    return ((x * 2654435761) ^ (x * 1000003)) | 0;
 };
 
 float.PY$__div__ = function(self, x) {
@@ -91,4 +109,11 @@ float.PY$__pow__ = function(self, x) {
 };
 
 float.PY$__floordiv__ = float.PY$__div__;
+
+float.PY$__mod__ = function(self, x) {
+    if (!x.numbertype)
+        throw __builtins__.PY$TypeError("Cannot find remainder of number and non-number");
+    return float($PY.fmod(self.obj, x.obj));
+};
+
 float.PY$__ifloordiv__ = float.PY$__div__;
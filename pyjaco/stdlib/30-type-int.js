@@ -31,8 +31,10 @@ int.numbertype = "PY$__int__";
 int.numberclass = int;
 
 int.PY$__init__ = function(self, value, radix) {
-    if (radix !== undefined) {
-        self.obj = parseInt(i, radix);
+    if (typeof value === 'number') {
+        self.obj = value < 0 ? Math.ceil(value) : Math.floor(value);
+    } else if (radix !== undefined) {
+        self.obj = parseInt(js(value), js(radix));
     } else {
         var s = js(str(value));
         if (s.match(/^[-+0-9]+$/)) {
@@ -45,11 +47,27 @@ int.PY$__init__ = function(self, value, radix) {
 
 var __int_real__ = int.PY$__create__;
 
+/*
+  Like CPython, the ints from -5 to 256 are shared, so the results of
+  arithmetic on small numbers do not need to be allocated.
+*/
+$PY.c_smallint = [];
+
 int.PY$__create__ = function(cls, obj) {
-    if (js($PY.isinstance(obj, object)) && (obj.PY$__int__ !== undefined)) {
+    if (typeof obj === 'number' && cls === int) {
+        var value = obj < 0 ? Math.ceil(obj) : Math.floor(obj);
+        if (value >= -5 && value <= 256 && $PY.c_smallint.length !== 0) {
+            return $PY.c_smallint[value + 5];
+        }
+        return __int_real__(cls, value);
+    } else if (js($PY.isinstance(obj, object)) && (obj.PY$__int__ !== undefined)) {
         return obj.PY$__int__(obj);
     } else {
-        return __int_real__(cls, obj);
+        var res = __int_real__.apply(null, arguments);
+        if (cls === int && res.obj >= -5 && res.obj <= 256 && $PY.c_smallint.length !== 0) {
+            return $PY.c_smallint[res.obj + 5];
+        }
+        return res;
     }
 };
 
@@ -75,6 +93,10 @@ int.PY$__hash__ = function(self) {
     return self;
 };
 
+int.PY$__hash__.raw = function(self) {
+    return self.obj;
+};
+
 int.PY$__invert__ = function(self) {
     return int(~self.obj);
 };
@@ -103,7 +125,11 @@ int.PY$__floordiv__ = function(self, x) {
 int.PY$__mod__ = function(self, x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot find remainder of int and non-int");
-    return int(self.obj % x.obj);
+    if (x.numbertype === "PY$__float__") {
+        return float($PY.fmod(self.obj, x.obj));
+    } else {
+        return int($PY.imod(self.obj, x.obj));
+    }
 };
 
 int.PY$__pow__ = function(self, x) {
@@ -154,6 +180,14 @@ int.PY$__ibitor__    = int.PY$__bitor__;
 int.PY$__ibitxor__   = int.PY$__bitxor__;
 int.PY$__ifloordiv__ = int.PY$__floordiv__;
 
+(function() {
+    var cache = [];
+    for (var i = -5; i <= 256; i++) {
+        cache.push(int(i));
+    }
+    $PY.c_smallint = cache;
+})();
+
 var $cn1 = int(-1);
 var $c0 = int(0);
 var $c1 = int(1);
@@ -59,6 +59,10 @@ bool.PY$__hash__ = function(self) {
     return self.obj === 0 ? $c0 : $c1;
 };
 
+bool.PY$__hash__.raw = function(self) {
+    return self.obj;
+};
+
 bool.PY$__repr__ = bool.PY$__str__;
 
 bool.PY$__eq__ = function(self, other) {
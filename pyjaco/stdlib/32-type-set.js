@@ -0,0 +1,478 @@
+/**
+  Copyright 2011-2013 Christian Iversen <chrivers@iversen-net.dk>
+
+  Permission is hereby granted, free of charge, to any person
+  obtaining a copy of this software and associated documentation
+  files (the "Software"), to deal in the Software without
+  restriction, including without limitation the rights to use,
+  copy, modify, merge, publish, distribute, sublicense, and/or sell
+  copies of the Software, and to permit persons to whom the
+  Software is furnished to do so, subject to the following
+  conditions:
+
+  The above copyright notice and this permission notice shall be
+  included in all copies or substantial portions of the Software.
+
+  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+  OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+  NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+  HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+  OTHER DEALINGS IN THE SOFTWARE.
+**/
+
+/*
+  set and frozenset, stored in the same hash tables as dict (see
+  24-type-dict.js). Only the keys of the table are used.
+
+  frozenset shares the methods of set that do not modify it, and adds
+  __hash__. The operators return an object of the same type as the left
+  operand.
+*/
+
+var set = __inherit(object, "set");
+var frozenset = __inherit(object, "frozenset");
+
+__builtins__.PY$set = set;
+__builtins__.PY$frozenset = frozenset;
+
+$PY.isset = function(obj) {
+    var cls = obj.PY$__class__;
+    return cls !== undefined && (cls === set || cls === frozenset || $PY.isinstance(obj, set) || $PY.isinstance(obj, frozenset));
+};
+
+/*
+  Returns a hash table holding the elements of [obj], which can be any
+  iterable. Sets return their own table, so it must not be modified.
+*/
+$PY.settable = function(obj) {
+    if (obj.PY$__class__ === set || obj.PY$__class__ === frozenset) {
+        return obj.table;
+    }
+    var table = new $PY.HashTable();
+    if (obj.PY$__class__ === undefined && obj.length !== undefined) {
+        for (var i = 0; i < obj.length; i++) {
+            table.set(obj[i], true);
+        }
+    } else {
+        iterate(obj, function(key) {
+            table.set(key, true);
+        });
+    }
+    return table;
+};
+
+$PY.newset = function(self, table) {
+    var res = (self.PY$__class__ === frozenset ? frozenset : set)();
+    res.table = table;
+    return res;
+};
+
+set.PY$__init__ = function(self, iterable) {
+    if (iterable === undefined) {
+        self.table = new $PY.HashTable();
+    } else {
+        var table = $PY.settable(iterable);
+        self.table = table === iterable.table ? table.copy() : table;
+    }
+};
+
+set.PY$__str__ = function(self) {
+    var strings = [];
+
+    self.table.each(function(key) {
+        strings.push(js($PY.repr(key)));
+    });
+
+    return str(js(self.PY$__class__.PY$__name__) + "([" + strings.join(", ") + "])");
+};
+
+set.PY$__repr__ = set.PY$__str__;
+
+set._js_ = function() {
+    var res = [];
+
+    this.table.each(function(key) {
+        res.push(js(key));
+    });
+
+    return res;
+};
+
+set.PY$__hash__ = function(self) {
+    throw __builtins__.PY$TypeError("unhashable type: 'set'");
+};
+
+set.PY$__len__ = function(self) {
+    return int(self.table.size);
+};
+
+set.PY$__iter__ = function(self) {
+    return $PY.setiter(self.table);
+};
+
+/*
+  Iterates the keys of a hash table in place, like the dict iterators.
+  Raises RuntimeError if the size of the set changes while iterating.
+*/
+var setiter = __inherit(object, "setiterator");
+
+setiter.PY$__init__ = function(self, table) {
+    self.table = table;
+    self.index = 0;
+    self.used = table.size;
+};
+
+setiter.PY$__iter__ = function(self) {
+    return self;
+};
+
+setiter.PY$__str__ = function(self) {
+    return str("<setiterator object>");
+};
+
+setiter.PY$__repr__ = setiter.PY$__str__;
+
+setiter.__pyjaco_next__ = function() {
+    var table = this.table;
+    if (table.size !== this.used) {
+        this.used = -1;
+        throw __builtins__.PY$RuntimeError("Set changed size during iteration");
+    }
+    var keys = table.keys;
+    while (this.index < keys.length) {
+        var key = keys[this.index++];
+        if (key !== $PY.c_deleted) {
+            return key;
+        }
+    }
+    return null;
+};
+
+$PY.nextable(setiter);
+
+$PY.setiter = setiter;
+
+set.PY$__contains__ = function(self, key) {
+    return self.table.find(key) !== -1 ? True : False;
+};
+
+set.PY$copy = function(self) {
+    return $PY.newset(self, self.table.copy());
+};
+
+/*
+  True if every element of table [a] is in table [b]
+*/
+$PY.subtable = function(a, b) {
+    if (a.size > b.size) {
+        return false;
+    }
+    var keys = a.keys;
+    for (var i = 0; i < keys.length; i++) {
+        if (keys[i] !== $PY.c_deleted && b.find(keys[i]) === -1) {
+            return false;
+        }
+    }
+    return true;
+};
+
+set.PY$issubset = function(self, other) {
+    return $PY.subtable(self.table, $PY.settable(other)) ? True : False;
+};
+
+set.PY$issuperset = function(self, other) {
+    return $PY.subtable($PY.settable(other), self.table) ? True : False;
+};
+
+set.PY$isdisjoint = function(self, other) {
+    var a = self.table;
+    var b = $PY.settable(other);
+    if (a.size > b.size) {
+        var t = a; a = b; b = t;
+    }
+    var keys = a.keys;
+    for (var i = 0; i < keys.length; i++) {
+        if (keys[i] !== $PY.c_deleted && b.find(keys[i]) !== -1) {
+            return False;
+        }
+    }
+    return True;
+};
+
+set.PY$__eq__ = function(self, other) {
+    if (!$PY.isset(other)) {
+        return False;
+    }
+    return self.table.size === other.table.size && $PY.subtable(self.table, other.table) ? True : False;
+};
+
+set.PY$__ne__ = function(self, other) {
+    return $PY.__not__(self.PY$__eq__(self, other));
+};
+
+$PY.setcheck = function(other) {
+    if (!$PY.isset(other)) {
+        throw __builtins__.PY$TypeError("can only compare to a set");
+    }
+    return other.table;
+};
+
+set.PY$__le__ = function(self, other) {
+    return $PY.subtable(self.table, $PY.setcheck(other)) ? True : False;
+};
+
+set.PY$__lt__ = function(self, other) {
+    var table = $PY.setcheck(other);
+    return self.table.size < table.size && $PY.subtable(self.table, table) ? True : False;
+};
+
+set.PY$__ge__ = function(self, other) {
+    return $PY.subtable($PY.setcheck(other), self.table) ? True : False;
+};
+
+set.PY$__gt__ = function(self, other) {
+    var table = $PY.setcheck(other);
+    return self.table.size > table.size && $PY.subtable(table, self.table) ? True : False;
+};
+
+/*
+  Set algebra on hash tables. The results are new tables.
+*/
+
+$PY.tunion = function(a, b) {
+    var res = a.copy();
+    b.each(function(key) {
+        res.set(key, true);
+    });
+    return res;
+};
+
+$PY.tintersection = function(a, b) {
+    var res = new $PY.HashTable();
+    if (a.size > b.size) {
+        var t = a; a = b; b = t;
+    }
+    a.each(function(key) {
+        if (b.find(key) !== -1) {
+            res.set(key, true);
+        }
+    });
+    return res;
+};
+
+$PY.tdifference = function(a, b) {
+    var res = new $PY.HashTable();
+    a.each(function(key) {
+        if (b.find(key) === -1) {
+            res.set(key, true);
+        }
+    });
+    return res;
+};
+
+$PY.tsymdifference = function(a, b) {
+    var res = $PY.tdifference(a, b);
+    b.each(function(key) {
+        if (a.find(key) === -1) {
+            res.set(key, true);
+        }
+    });
+    return res;
+};
+
+set.PY$union = function(self) {
+    var table = self.table;
+    for (var i = 1; i < arguments.length; i++) {
+        table = $PY.tunion(table, $PY.settable(arguments[i]));
+    }
+    return $PY.newset(self, table === self.table ? table.copy() : table);
+};
+
+set.PY$intersection = function(self) {
+    var table = self.table;
+    for (var i = 1; i < arguments.length; i++) {
+        table = $PY.tintersection(table, $PY.settable(arguments[i]));
+    }
+    return $PY.newset(self, table === self.table ? table.copy() : table);
+};
+
+set.PY$difference = function(self) {
+    var table = self.table;
+    for (var i = 1; i < arguments.length; i++) {
+        table = $PY.tdifference(table, $PY.settable(arguments[i]));
+    }
+    return $PY.newset(self, table === self.table ? table.copy() : table);
+};
+
+set.PY$symmetric_difference = function(self, other) {
+    return $PY.newset(self, $PY.tsymdifference(self.table, $PY.settable(other)));
+};
+
+$PY.setoperand = function(op, other) {
+    if (!$PY.isset(other)) {
+        throw __builtins__.PY$TypeError("unsupported operand type(s) for " + op + ": 'set' and '" + js(__builtins__.PY$type(other).PY$__name__) + "'");
+    }
+    return other.table;
+};
+
+set.PY$__bitor__ = function(self, other) {
+    return $PY.newset(self, $PY.tunion(self.table, $PY.setoperand("|", other)));
+};
+
+set.PY$__bitand__ = function(self, other) {
+    return $PY.newset(self, $PY.tintersection(self.table, $PY.setoperand("&", other)));
+};
+
+set.PY$__sub__ = function(self, other) {
+    return $PY.newset(self, $PY.tdifference(self.table, $PY.setoperand("-", other)));
+};
+
+set.PY$__bitxor__ = function(self, other) {
+    return $PY.newset(self, $PY.tsymdifference(self.table, $PY.setoperand("^", other)));
+};
+
+set.PY$__or__  = set.PY$__bitor__;
+set.PY$__and__ = set.PY$__bitand__;
+set.PY$__xor__ = set.PY$__bitxor__;
+
+/*
+  Copy the methods that do not modify the set to frozenset.
+*/
+(function() {
+    var names = ["__init__", "__str__", "__repr__", "__len__", "__iter__", "__contains__", "copy",
+                 "issubset", "issuperset", "isdisjoint", "__eq__", "__ne__", "__le__", "__lt__", "__ge__", "__gt__",
+                 "union", "intersection", "difference", "symmetric_difference",
+                 "__bitor__", "__bitand__", "__sub__", "__bitxor__", "__or__", "__and__", "__xor__"];
+    for (var i = 0; i < names.length; i++) {
+        frozenset["PY$" + names[i]] = set["PY$" + names[i]];
+    }
+    frozenset._js_ = set._js_;
+})();
+
+frozenset.PY$__ibitor__  = frozenset.PY$__bitor__;
+frozenset.PY$__ibitand__ = frozenset.PY$__bitand__;
+frozenset.PY$__isub__    = frozenset.PY$__sub__;
+frozenset.PY$__ibitxor__ = frozenset.PY$__bitxor__;
+
+frozenset.PY$copy = function(self) {
+    return self;
+};
+
+frozenset.PY$__hash__ = function(self) {
+    return int(frozenset.PY$__hash__.raw(self));
+};
+
+frozenset.PY$__hash__.raw = function(self) {
+    /*
+     * Order independent, like the CPython implementation: every element
+     * hash is scrambled, and the results are xor'ed together. It is
+     * kept on the frozenset, which cannot change.
+     */
+    if (self.hash !== undefined) {
+        return self.hash;
+    }
+    var hash = 1927868237 * (self.table.size + 1);
+    self.table.each(function(key) {
+        var h = $PY.rawhash(key);
+        hash ^= (h ^ (h << 16) ^ 89869747) * 3644798167;
+    });
+    hash = hash * 69069 + 907133923;
+    self.hash = hash | 0;
+    return self.hash;
+};
+
+/*
+  Methods modifying the set
+*/
+
+set.PY$add = function(self, key) {
+    self.table.set(key, true);
+    return None;
+};
+
+set.PY$discard = function(self, key) {
+    self.table.remove(key);
+    return None;
+};
+
+set.PY$remove = function(self, key) {
+    if (!self.table.remove(key)) {
+        throw __builtins__.PY$KeyError(str(key));
+    }
+    return None;
+};
+
+set.PY$pop = function(self) {
+    var table = self.table;
+    var slot = table.last();
+    if (slot === -1) {
+        throw __builtins__.PY$KeyError("pop from an empty set");
+    }
+    var res = table.keys[slot];
+    table.drop(slot);
+    return res;
+};
+
+set.PY$clear = function(self) {
+    self.table.clear();
+    return None;
+};
+
+set.PY$update = function(self) {
+    var table = self.table;
+    for (var i = 1; i < arguments.length; i++) {
+        $PY.settable(arguments[i]).each(function(key) {
+            table.set(key, true);
+        });
+    }
+    return None;
+};
+
+set.PY$intersection_update = function(self) {
+    self.table = set.PY$intersection.apply(null, arguments).table;
+    return None;
+};
+
+set.PY$difference_update = function(self) {
+    var table = self.table;
+    for (var i = 1; i < arguments.length; i++) {
+        $PY.settable(arguments[i]).each(function(key) {
+            table.remove(key);
+        });
+    }
+    return None;
+};
+
+set.PY$symmetric_difference_update = function(self, other) {
+    self.table = $PY.tsymdifference(self.table, $PY.settable(other));
+    return None;
+};
+
+set.PY$__ibitor__ = function(self, other) {
+    var table = self.table;
+    $PY.setoperand("|=", other).each(function(key) {
+        table.set(key, true);
+    });
+    return self;
+};
+
+set.PY$__ibitand__ = function(self, other) {
+    self.table = $PY.tintersection(self.table, $PY.setoperand("&=", other));
+    return self;
+};
+
+set.PY$__isub__ = function(self, other) {
+    var table = self.table;
+    $PY.setoperand("-=", other).each(function(key) {
+        table.remove(key);
+    });
+    return self;
+};
+
+set.PY$__ibitxor__ = function(self, other) {
+    self.table = $PY.tsymdifference(self.table, $PY.setoperand("^=", other));
+    return self;
+};
@@ -0,0 +1,309 @@
+/**
+  Copyright 2011-2013 Christian Iversen <chrivers@iversen-net.dk>
+
+  Permission is hereby granted, free of charge, to any person
+  obtaining a copy of this software and associated documentation
+  files (the "Software"), to deal in the Software without
+  restriction, including without limitation the rights to use,
+  copy, modify, merge, publish, distribute, sublicense, and/or sell
+  copies of the Software, and to permit persons to whom the
+  Software is furnished to do so, subject to the following
+  conditions:
+
+  The above copyright notice and this permission notice shall be
+  included in all copies or substantial portions of the Software.
+
+  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+  OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+  NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+  HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+  OTHER DEALINGS IN THE SOFTWARE.
+**/
+
+/*
+  collections.deque, kept in a ring buffer. [ring] has a power of two
+  length, and holds the [size] items starting at [head], wrapping around
+  its end. [limit] is maxlen as a javascript number, or -1 for none.
+*/
+var deque = __inherit(object, "deque");
+
+deque.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    var iterable = pyargs.varargs[1];
+    if (iterable === undefined) {
+        iterable = pyargs.kw.iterable;
+    }
+    var maxlen = pyargs.varargs[2];
+    if (maxlen === undefined) {
+        maxlen = pyargs.kw.maxlen;
+    }
+
+    if (maxlen === undefined || maxlen === None) {
+        self.limit = -1;
+        self.PY$maxlen = None;
+    } else {
+        self.limit = js(int(maxlen));
+        if (self.limit < 0) {
+            throw __builtins__.PY$ValueError("maxlen must be non-negative");
+        }
+        self.PY$maxlen = int(self.limit);
+    }
+    self.ring = new Array(8);
+    self.head = 0;
+    self.size = 0;
+
+    if (iterable !== undefined) {
+        self.PY$extend(self, iterable);
+    }
+};
+
+$PY.dequegrow = function(self) {
+    var ring = self.ring;
+    var mask = ring.length - 1;
+    var res = new Array(ring.length * 2);
+    for (var i = 0; i < self.size; i++) {
+        res[i] = ring[(self.head + i) & mask];
+    }
+    self.ring = res;
+    self.head = 0;
+};
+
+/*
+  Returns the items of [self] as a new javascript array, from left to
+  right.
+*/
+$PY.dequeitems = function(self) {
+    var ring = self.ring;
+    var mask = ring.length - 1;
+    var res = new Array(self.size);
+    for (var i = 0; i < self.size; i++) {
+        res[i] = ring[(self.head + i) & mask];
+    }
+    return res;
+};
+
+$PY.dequeset = function(self, items) {
+    var cap = 8;
+    while (cap < items.length) {
+        cap *= 2;
+    }
+    self.ring = new Array(cap);
+    for (var i = 0; i < items.length; i++) {
+        self.ring[i] = items[i];
+    }
+    self.head = 0;
+    self.size = items.length;
+};
+
+/*
+  Returns the ring slot of python index [index] into [self].
+*/
+$PY.dequeslot = function(self, index) {
+    var i = js(int(index));
+    if (i < 0) {
+        i += self.size;
+    }
+    if (i < 0 || i >= self.size) {
+        throw __builtins__.PY$IndexError("deque index out of range");
+    }
+    return (self.head + i) & (self.ring.length - 1);
+};
+
+deque.PY$append = function(self, x) {
+    if (self.size === self.limit) {
+        if (self.limit === 0) {
+            return None;
+        }
+        self.PY$popleft(self);
+    }
+    if (self.size === self.ring.length) {
+        $PY.dequegrow(self);
+    }
+    self.ring[(self.head + self.size) & (self.ring.length - 1)] = x;
+    self.size++;
+    return None;
+};
+
+deque.PY$appendleft = function(self, x) {
+    if (self.size === self.limit) {
+        if (self.limit === 0) {
+            return None;
+        }
+        self.PY$pop(self);
+    }
+    if (self.size === self.ring.length) {
+        $PY.dequegrow(self);
+    }
+    self.head = (self.head - 1) & (self.ring.length - 1);
+    self.ring[self.head] = x;
+    self.size++;
+    return None;
+};
+
+deque.PY$pop = function(self) {
+    if (self.size === 0) {
+        throw __builtins__.PY$IndexError("pop from an empty deque");
+    }
+    self.size--;
+    var slot = (self.head + self.size) & (self.ring.length - 1);
+    var res = self.ring[slot];
+    self.ring[slot] = undefined;
+    return res;
+};
+
+deque.PY$popleft = function(self) {
+    if (self.size === 0) {
+        throw __builtins__.PY$IndexError("pop from an empty deque");
+    }
+    var res = self.ring[self.head];
+    self.ring[self.head] = undefined;
+    self.head = (self.head + 1) & (self.ring.length - 1);
+    self.size--;
+    return res;
+};
+
+deque.PY$extend = function(self, iterable) {
+    if (iterable === self) {
+        iterable = $PY.dequeitems(self);
+    }
+    iterate(iterable, function(x) {
+        self.PY$append(self, x);
+    });
+    return None;
+};
+
+deque.PY$extendleft = function(self, iterable) {
+    if (iterable === self) {
+        iterable = $PY.dequeitems(self);
+    }
+    iterate(iterable, function(x) {
+        self.PY$appendleft(self, x);
+    });
+    return None;
+};
+
+deque.PY$__iadd__ = function(self, other) {
+    self.PY$extend(self, other);
+    return self;
+};
+
+deque.PY$clear = function(self) {
+    self.ring = new Array(8);
+    self.head = 0;
+    self.size = 0;
+    return None;
+};
+
+deque.PY$rotate = function(self, n) {
+    n = n === undefined ? 1 : js(int(n));
+    if (self.size > 1) {
+        n %= self.size;
+        if (n < 0) {
+            n += self.size;
+        }
+        var items = $PY.dequeitems(self);
+        $PY.dequeset(self, items.slice(self.size - n).concat(items.slice(0, self.size - n)));
+    }
+    return None;
+};
+
+deque.PY$reverse = function(self) {
+    $PY.dequeset(self, $PY.dequeitems(self).reverse());
+    return None;
+};
+
+deque.PY$count = function(self, x) {
+    var res = 0;
+    var items = $PY.dequeitems(self);
+    for (var i = 0; i < items.length; i++) {
+        if (items[i].PY$__eq__(items[i], x) === True) {
+            res++;
+        }
+    }
+    return int(res);
+};
+
+deque.PY$remove = function(self, x) {
+    var items = $PY.dequeitems(self);
+    for (var i = 0; i < items.length; i++) {
+        if (items[i].PY$__eq__(items[i], x) === True) {
+            items.splice(i, 1);
+            $PY.dequeset(self, items);
+            return None;
+        }
+    }
+    throw __builtins__.PY$ValueError("deque.remove(x): x not in deque");
+};
+
+deque.PY$__len__ = function(self) {
+    return int(self.size);
+};
+
+deque.PY$__iter__ = function(self) {
+    return iter($PY.dequeitems(self));
+};
+
+deque.PY$__reversed__ = function(self) {
+    return iter($PY.dequeitems(self).reverse());
+};
+
+deque.PY$__contains__ = function(self, x) {
+    return self.PY$count(self, x).obj > 0 ? True : False;
+};
+
+deque.PY$__getitem__ = function(self, index) {
+    return self.ring[$PY.dequeslot(self, index)];
+};
+
+deque.PY$__setitem__ = function(self, index, value) {
+    self.ring[$PY.dequeslot(self, index)] = value;
+};
+
+deque.PY$__delitem__ = function(self, index) {
+    $PY.dequeslot(self, index);
+    var items = $PY.dequeitems(self);
+    var i = js(int(index));
+    items.splice(i < 0 ? i + items.length : i, 1);
+    $PY.dequeset(self, items);
+};
+
+deque.PY$__eq__ = function(self, other) {
+    if (other.PY$__class__ !== deque || other.size !== self.size) {
+        return False;
+    }
+    var a = $PY.dequeitems(self);
+    var b = $PY.dequeitems(other);
+    for (var i = 0; i < a.length; i++) {
+        if (a[i].PY$__eq__(a[i], b[i]) !== True) {
+            return False;
+        }
+    }
+    return True;
+};
+
+deque.PY$__hash__ = function(self) {
+    throw __builtins__.PY$TypeError("unhashable type: 'deque'");
+};
+
+deque.PY$__copy__ = function(self) {
+    return deque(list($PY.dequeitems(self)), self.PY$maxlen);
+};
+
+deque.PY$__repr__ = function(self) {
+    var items = list($PY.dequeitems(self));
+    var res = js(items.PY$__repr__(items));
+    if (self.limit === -1) {
+        return str("deque(" + res + ")");
+    } else {
+        return str("deque(" + res + ", maxlen=" + self.limit + ")");
+    }
+};
+
+deque.PY$__str__ = deque.PY$__repr__;
+
+$PY.module("collections", {
+    PY$deque: deque
+});
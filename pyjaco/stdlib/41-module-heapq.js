@@ -0,0 +1,217 @@
+/**
+  Copyright 2011-2013 Christian Iversen <chrivers@iversen-net.dk>
+
+  Permission is hereby granted, free of charge, to any person
+  obtaining a copy of this software and associated documentation
+  files (the "Software"), to deal in the Software without
+  restriction, including without limitation the rights to use,
+  copy, modify, merge, publish, distribute, sublicense, and/or sell
+  copies of the Software, and to permit persons to whom the
+  Software is furnished to do so, subject to the following
+  conditions:
+
+  The above copyright notice and this permission notice shall be
+  included in all copies or substantial portions of the Software.
+
+  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+  OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+  NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+  HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+  OTHER DEALINGS IN THE SOFTWARE.
+**/
+
+/*
+  The heapq module, working on the item arrays of lists. The sift
+  functions take the less-than test to use, so nsmallest and nlargest
+  can order decorated items with them.
+*/
+$PY.heaplt = function(a, b) {
+    return a.PY$__lt__(a, b) === True;
+};
+
+$PY.heapitems = function(heap) {
+    if (!$PY.isinstance(heap, list)) {
+        throw __builtins__.PY$TypeError("heap argument must be a list");
+    }
+    return heap.items;
+};
+
+$PY.siftdown = function(heap, startpos, pos, lt) {
+    var newitem = heap[pos];
+    while (pos > startpos) {
+        var parentpos = (pos - 1) >> 1;
+        var parent = heap[parentpos];
+        if (!lt(newitem, parent)) {
+            break;
+        }
+        heap[pos] = parent;
+        pos = parentpos;
+    }
+    heap[pos] = newitem;
+};
+
+$PY.siftup = function(heap, pos, lt) {
+    var endpos = heap.length;
+    var startpos = pos;
+    var newitem = heap[pos];
+    var childpos = 2 * pos + 1;
+    while (childpos < endpos) {
+        var rightpos = childpos + 1;
+        if (rightpos < endpos && !lt(heap[childpos], heap[rightpos])) {
+            childpos = rightpos;
+        }
+        heap[pos] = heap[childpos];
+        pos = childpos;
+        childpos = 2 * pos + 1;
+    }
+    heap[pos] = newitem;
+    $PY.siftdown(heap, startpos, pos, lt);
+};
+
+$PY.heapify = function(heap, lt) {
+    for (var i = (heap.length >> 1) - 1; i >= 0; i--) {
+        $PY.siftup(heap, i, lt);
+    }
+};
+
+/*
+  Returns the first [n] items of [iterable] in the order given by
+  [before], a less-than test on keys. Equal items keep their order, like
+  they do with sorted().
+*/
+$PY.heapselect = function(args, before) {
+    var pyargs = __uncook(args);
+    var n = js(int(pyargs.varargs[0]));
+    var key = pyargs.varargs[2];
+    if (key === undefined) {
+        key = pyargs.kw.key;
+    }
+    if (key === None) {
+        key = undefined;
+    }
+
+    var items = [];
+    iterate(pyargs.varargs[1], function(item) {
+        items.push({key: key === undefined ? item : key(item), index: items.length, item: item});
+    });
+    var lt = function(a, b) {
+        return before(a.key, b.key) || (!before(b.key, a.key) && a.index < b.index);
+    };
+    $PY.heapify(items, lt);
+
+    var res = [];
+    while (res.length < n && items.length > 0) {
+        var last = items.pop();
+        if (items.length > 0) {
+            res.push(items[0].item);
+            items[0] = last;
+            $PY.siftup(items, 0, lt);
+        } else {
+            res.push(last.item);
+        }
+    }
+    return list(res);
+};
+
+$PY.module("heapq", {
+    PY$heappush: function(heap, item) {
+        var items = $PY.heapitems(heap);
+        items.push(item);
+        $PY.siftdown(items, 0, items.length - 1, $PY.heaplt);
+        return None;
+    },
+
+    PY$heappop: function(heap) {
+        var items = $PY.heapitems(heap);
+        if (items.length === 0) {
+            throw __builtins__.PY$IndexError("index out of range");
+        }
+        var last = items.pop();
+        if (items.length === 0) {
+            return last;
+        }
+        var res = items[0];
+        items[0] = last;
+        $PY.siftup(items, 0, $PY.heaplt);
+        return res;
+    },
+
+    PY$heapreplace: function(heap, item) {
+        var items = $PY.heapitems(heap);
+        if (items.length === 0) {
+            throw __builtins__.PY$IndexError("index out of range");
+        }
+        var res = items[0];
+        items[0] = item;
+        $PY.siftup(items, 0, $PY.heaplt);
+        return res;
+    },
+
+    PY$heappushpop: function(heap, item) {
+        var items = $PY.heapitems(heap);
+        if (items.length > 0 && $PY.heaplt(items[0], item)) {
+            var res = items[0];
+            items[0] = item;
+            $PY.siftup(items, 0, $PY.heaplt);
+            return res;
+        }
+        return item;
+    },
+
+    PY$heapify: function(heap) {
+        $PY.heapify($PY.heapitems(heap), $PY.heaplt);
+        return None;
+    },
+
+    PY$nsmallest: function() {
+        return $PY.heapselect(arguments, $PY.heaplt);
+    },
+
+    PY$nlargest: function() {
+        return $PY.heapselect(arguments, function(a, b) {
+            return $PY.heaplt(b, a);
+        });
+    },
+
+    /*
+      Unlike python, merge reads all of its inputs before it returns.
+    */
+    PY$merge: function() {
+        var its = [];
+        for (var i = 0; i < arguments.length; i++) {
+            its.push(iter(arguments[i]));
+        }
+        var heads = [];
+        var advance = function(entry) {
+            entry.item = $PY.next(its[entry.index]);
+            return entry.item !== null;
+        };
+        var lt = function(a, b) {
+            return $PY.heaplt(a.item, b.item) || (!$PY.heaplt(b.item, a.item) && a.index < b.index);
+        };
+        for (var i = 0; i < its.length; i++) {
+            var entry = {index: i, item: undefined};
+            if (advance(entry)) {
+                heads.push(entry);
+            }
+        }
+        $PY.heapify(heads, lt);
+
+        var res = [];
+        while (heads.length > 0) {
+            res.push(heads[0].item);
+            if (!advance(heads[0])) {
+                var last = heads.pop();
+                if (heads.length === 0) {
+                    break;
+                }
+                heads[0] = last;
+            }
+            $PY.siftup(heads, 0, lt);
+        }
+        return iter(res);
+    }
+});
@@ -0,0 +1,661 @@
+/**
+  Copyright 2011-2013 Christian Iversen <chrivers@iversen-net.dk>
+
+  Permission is hereby granted, free of charge, to any person
+  obtaining a copy of this software and associated documentation
+  files (the "Software"), to deal in the Software without
+  restriction, including without limitation the rights to use,
+  copy, modify, merge, publish, distribute, sublicense, and/or sell
+  copies of the Software, and to permit persons to whom the
+  Software is furnished to do so, subject to the following
+  conditions:
+
+  The above copyright notice and this permission notice shall be
+  included in all copies or substantial portions of the Software.
+
+  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+  OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+  NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+  HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+  OTHER DEALINGS IN THE SOFTWARE.
+**/
+
+/*
+  The itertools module. Every combinator is a lazy iterator class using
+  the __pyjaco_next__ protocol (see 20-type-iter.js), so they chain
+  without building intermediate arrays. imap, ifilter and izip are the
+  classes behind map, filter and zip.
+*/
+
+/*
+  Returns argument [index] of the uncooked arguments [pyargs], or the
+  keyword argument [name], or [fallback].
+*/
+$PY.itarg = function(pyargs, index, name, fallback) {
+    if (pyargs.varargs.length > index) {
+        return pyargs.varargs[index];
+    } else if (pyargs.kw[name] !== undefined) {
+        return pyargs.kw[name];
+    } else {
+        return fallback;
+    }
+};
+
+/*
+  Returns the items of [seq] as a new javascript array.
+*/
+$PY.itpool = function(seq) {
+    if (seq.PY$__class__ === list || seq.PY$__class__ === tuple) {
+        return seq.items.slice();
+    }
+    var res = [];
+    iterate(seq, function(item) {
+        res.push(item);
+    });
+    return res;
+};
+
+$PY.itindex = function(value, name) {
+    if (value === undefined || value === None) {
+        return -1;
+    }
+    var res = js(value);
+    if (typeof res !== 'number' || res < 0 || res !== Math.floor(res)) {
+        throw __builtins__.PY$ValueError(name + " for islice() must be None or an integer: 0 <= x <= maxint.");
+    }
+    return res;
+};
+
+$PY.itself = function(self) {
+    return self;
+};
+
+var count = __inherit(object, "count");
+
+count.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    self.n = $PY.itarg(pyargs, 1, "start", $c0);
+    self.step = $PY.itarg(pyargs, 2, "step", $c1);
+};
+
+count.PY$__iter__ = $PY.itself;
+
+count.__pyjaco_next__ = function() {
+    var res = this.n;
+    this.n = res.PY$__add__(res, this.step);
+    return res;
+};
+
+count.PY$__repr__ = function(self) {
+    if (self.step.PY$__class__ === int && self.step.obj === 1) {
+        return str("count(" + js($PY.repr(self.n)) + ")");
+    } else {
+        return str("count(" + js($PY.repr(self.n)) + ", " + js($PY.repr(self.step)) + ")");
+    }
+};
+
+count.PY$__str__ = count.PY$__repr__;
+
+$PY.nextable(count);
+
+var cycle = __inherit(object, "cycle");
+
+cycle.PY$__init__ = function(self, seq) {
+    self.it = iter(seq);
+    self.saved = [];
+    self.index = -1;
+};
+
+cycle.PY$__iter__ = $PY.itself;
+
+cycle.__pyjaco_next__ = function() {
+    if (this.index === -1) {
+        var value = $PY.next(this.it);
+        if (value !== null) {
+            this.saved.push(value);
+            return value;
+        } else if (this.saved.length === 0) {
+            return null;
+        }
+        this.index = 0;
+    }
+    var res = this.saved[this.index];
+    this.index = (this.index + 1) % this.saved.length;
+    return res;
+};
+
+$PY.nextable(cycle);
+
+var repeat = __inherit(object, "repeat");
+
+repeat.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    var times = $PY.itarg(pyargs, 2, "times", undefined);
+    self.value = $PY.itarg(pyargs, 1, "object", undefined);
+    self.times = times === undefined ? -1 : Math.max(0, js(times));
+};
+
+repeat.PY$__iter__ = $PY.itself;
+
+repeat.__pyjaco_next__ = function() {
+    if (this.times === 0) {
+        return null;
+    } else if (this.times > 0) {
+        this.times--;
+    }
+    return this.value;
+};
+
+repeat.PY$__len__ = function(self) {
+    if (self.times === -1) {
+        throw __builtins__.PY$TypeError("len() of unsized object");
+    }
+    return int(self.times);
+};
+
+repeat.PY$__repr__ = function(self) {
+    if (self.times === -1) {
+        return str("repeat(" + js($PY.repr(self.value)) + ")");
+    } else {
+        return str("repeat(" + js($PY.repr(self.value)) + ", " + self.times + ")");
+    }
+};
+
+repeat.PY$__str__ = repeat.PY$__repr__;
+
+$PY.nextable(repeat);
+
+var chain = __inherit(object, "chain");
+
+chain.PY$__init__ = function(self) {
+    self.sources = iter(Array.prototype.slice.call(arguments, 1));
+    self.it = null;
+};
+
+chain.PY$from_iterable = function(cls, iterables) {
+    var res = cls();
+    res.sources = iter(iterables);
+    return res;
+};
+
+chain.PY$__iter__ = $PY.itself;
+
+chain.__pyjaco_next__ = function() {
+    while (true) {
+        if (this.it !== null) {
+            var value = $PY.next(this.it);
+            if (value !== null) {
+                return value;
+            }
+        }
+        var source = $PY.next(this.sources);
+        if (source === null) {
+            this.it = null;
+            return null;
+        }
+        this.it = iter(source);
+    }
+};
+
+$PY.nextable(chain);
+
+var islice = __inherit(object, "islice");
+
+islice.PY$__init__ = function(self, seq) {
+    var start = 0;
+    var stop;
+    var step = 1;
+    if (arguments.length < 3 || arguments.length > 5) {
+        throw __builtins__.PY$TypeError("islice() takes 2 to 4 arguments");
+    } else if (arguments.length === 3) {
+        stop = $PY.itindex(arguments[2], "Stop argument");
+    } else {
+        start = Math.max(0, $PY.itindex(arguments[2], "Indices"));
+        stop = $PY.itindex(arguments[3], "Indices");
+        if (arguments.length === 5 && arguments[4] !== None) {
+            step = js(arguments[4]);
+            if (typeof step !== 'number' || step < 1 || step !== Math.floor(step)) {
+                throw __builtins__.PY$ValueError("Step for islice() must be a positive integer or None.");
+            }
+        }
+    }
+    self.it = iter(seq);
+    self.nextindex = start;
+    self.stop = stop;
+    self.step = step;
+    self.count = 0;
+};
+
+islice.PY$__iter__ = $PY.itself;
+
+islice.__pyjaco_next__ = function() {
+    var stop = this.stop;
+    while (this.count < this.nextindex) {
+        if ($PY.next(this.it) === null) {
+            return null;
+        }
+        this.count++;
+    }
+    if (stop !== -1 && this.count >= stop) {
+        return null;
+    }
+    var res = $PY.next(this.it);
+    if (res === null) {
+        return null;
+    }
+    this.count++;
+    this.nextindex += this.step;
+    if (stop !== -1 && this.nextindex > stop) {
+        this.nextindex = stop;
+    }
+    return res;
+};
+
+$PY.nextable(islice);
+
+var takewhile = __inherit(object, "takewhile");
+
+takewhile.PY$__init__ = function(self, predicate, seq) {
+    self.predicate = predicate;
+    self.it = iter(seq);
+    self.done = false;
+};
+
+takewhile.PY$__iter__ = $PY.itself;
+
+takewhile.__pyjaco_next__ = function() {
+    if (this.done) {
+        return null;
+    }
+    var value = $PY.next(this.it);
+    if (value === null || !$PY.truthy(this.predicate(value))) {
+        this.done = true;
+        return null;
+    }
+    return value;
+};
+
+$PY.nextable(takewhile);
+
+var dropwhile = __inherit(object, "dropwhile");
+
+dropwhile.PY$__init__ = function(self, predicate, seq) {
+    self.predicate = predicate;
+    self.it = iter(seq);
+    self.dropping = true;
+};
+
+dropwhile.PY$__iter__ = $PY.itself;
+
+dropwhile.__pyjaco_next__ = function() {
+    var value;
+    while ((value = $PY.next(this.it)) !== null) {
+        if (!this.dropping || !$PY.truthy(this.predicate(value))) {
+            this.dropping = false;
+            return value;
+        }
+    }
+    return null;
+};
+
+$PY.nextable(dropwhile);
+
+/*
+  groupby yields (key, group) pairs, where the groups share the
+  underlying iterator: advancing groupby skips the rest of the current
+  group, as in python.
+*/
+var groupby = __inherit(object, "groupby");
+
+groupby.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    var key = $PY.itarg(pyargs, 2, "key", None);
+    self.it = iter($PY.itarg(pyargs, 1, "iterable", undefined));
+    self.keyfunc = key === None ? undefined : key;
+    self.tgtkey = undefined;
+    self.currkey = undefined;
+    self.currvalue = undefined;
+};
+
+groupby.PY$__iter__ = $PY.itself;
+
+/*
+  Reads the next value and its key into [currvalue] and [currkey].
+*/
+groupby.step = function() {
+    var value = $PY.next(this.it);
+    if (value === null) {
+        return false;
+    }
+    var key = this.keyfunc === undefined ? value : this.keyfunc(value);
+    if (typeof key === 'string') {
+        key = str(key);
+    } else if (typeof key === 'number') {
+        key = int(key);
+    }
+    this.currvalue = value;
+    this.currkey = key;
+    return true;
+};
+
+groupby.__pyjaco_next__ = function() {
+    while (this.currkey === undefined || (this.tgtkey !== undefined && $PY.keyeq(this.tgtkey, this.currkey))) {
+        if (!this.step()) {
+            return null;
+        }
+    }
+    this.tgtkey = this.currkey;
+    return tuple([this.currkey, $PY.grouper(this, this.tgtkey)]);
+};
+
+$PY.nextable(groupby);
+
+var _grouper = __inherit(object, "_grouper");
+
+_grouper.PY$__init__ = function(self, parent, key) {
+    self.parent = parent;
+    self.key = key;
+};
+
+_grouper.PY$__iter__ = $PY.itself;
+
+_grouper.__pyjaco_next__ = function() {
+    var parent = this.parent;
+    if (parent.currvalue === undefined && !parent.step()) {
+        return null;
+    }
+    if (!$PY.keyeq(this.key, parent.currkey)) {
+        return null;
+    }
+    var res = parent.currvalue;
+    parent.currvalue = undefined;
+    return res;
+};
+
+$PY.nextable(_grouper);
+
+$PY.grouper = _grouper;
+
+var product = __inherit(object, "product");
+
+product.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    var times = pyargs.kw.repeat === undefined ? 1 : js(pyargs.kw.repeat);
+    var pools = [];
+    for (var i = 1; i < pyargs.varargs.length; i++) {
+        pools.push($PY.itpool(pyargs.varargs[i]));
+    }
+    self.pools = [];
+    for (var n = 0; n < times; n++) {
+        self.pools = self.pools.concat(pools);
+    }
+    self.indices = null;
+    self.done = false;
+};
+
+product.PY$__iter__ = $PY.itself;
+
+product.__pyjaco_next__ = function() {
+    var pools = this.pools;
+    var indices = this.indices;
+    var i;
+    if (this.done) {
+        return null;
+    } else if (indices === null) {
+        indices = this.indices = [];
+        for (i = 0; i < pools.length; i++) {
+            if (pools[i].length === 0) {
+                this.done = true;
+                return null;
+            }
+            indices.push(0);
+        }
+    } else {
+        for (i = pools.length - 1; i >= 0; i--) {
+            if (++indices[i] < pools[i].length) {
+                break;
+            }
+            indices[i] = 0;
+        }
+        if (i < 0) {
+            this.done = true;
+            return null;
+        }
+    }
+    var res = new Array(pools.length);
+    for (i = 0; i < pools.length; i++) {
+        res[i] = pools[i][indices[i]];
+    }
+    return tuple(res);
+};
+
+$PY.nextable(product);
+
+var permutations = __inherit(object, "permutations");
+
+permutations.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    var r = $PY.itarg(pyargs, 2, "r", None);
+    self.pool = $PY.itpool($PY.itarg(pyargs, 1, "iterable", undefined));
+    var n = self.pool.length;
+    self.r = r === None ? n : js(r);
+    if (self.r < 0) {
+        throw __builtins__.PY$ValueError("r must be non-negative");
+    }
+    self.indices = [];
+    self.cycles = [];
+    for (var i = 0; i < n; i++) {
+        self.indices.push(i);
+    }
+    for (i = 0; i < self.r; i++) {
+        self.cycles.push(n - i);
+    }
+    self.first = true;
+    self.done = self.r > n;
+};
+
+permutations.PY$__iter__ = $PY.itself;
+
+permutations.__pyjaco_next__ = function() {
+    var n = this.pool.length;
+    var r = this.r;
+    var indices = this.indices;
+    var cycles = this.cycles;
+    if (this.done) {
+        return null;
+    } else if (this.first) {
+        this.first = false;
+    } else {
+        var i;
+        for (i = r - 1; i >= 0; i--) {
+            cycles[i]--;
+            if (cycles[i] === 0) {
+                indices.push(indices.splice(i, 1)[0]);
+                cycles[i] = n - i;
+            } else {
+                var j = n - cycles[i];
+                var x = indices[i];
+                indices[i] = indices[j];
+                indices[j] = x;
+                break;
+            }
+        }
+        if (i < 0) {
+            this.done = true;
+            return null;
+        }
+    }
+    var res = new Array(r);
+    for (var k = 0; k < r; k++) {
+        res[k] = this.pool[indices[k]];
+    }
+    return tuple(res);
+};
+
+$PY.nextable(permutations);
+
+var combinations = __inherit(object, "combinations");
+
+combinations.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    self.pool = $PY.itpool($PY.itarg(pyargs, 1, "iterable", undefined));
+    self.r = js($PY.itarg(pyargs, 2, "r", undefined));
+    if (self.r === undefined) {
+        throw __builtins__.PY$TypeError("combinations() requires 2 arguments");
+    } else if (self.r < 0) {
+        throw __builtins__.PY$ValueError("r must be non-negative");
+    }
+    self.indices = [];
+    for (var i = 0; i < self.r; i++) {
+        self.indices.push(i);
+    }
+    self.first = true;
+    self.done = self.r > self.pool.length;
+};
+
+combinations.PY$__iter__ = $PY.itself;
+
+combinations.__pyjaco_next__ = function() {
+    var n = this.pool.length;
+    var r = this.r;
+    var indices = this.indices;
+    if (this.done) {
+        return null;
+    } else if (this.first) {
+        this.first = false;
+    } else {
+        var i;
+        for (i = r - 1; i >= 0; i--) {
+            if (indices[i] !== i + n - r) {
+                break;
+            }
+        }
+        if (i < 0) {
+            this.done = true;
+            return null;
+        }
+        indices[i]++;
+        for (var j = i + 1; j < r; j++) {
+            indices[j] = indices[j - 1] + 1;
+        }
+    }
+    var res = new Array(r);
+    for (var k = 0; k < r; k++) {
+        res[k] = this.pool[indices[k]];
+    }
+    return tuple(res);
+};
+
+$PY.nextable(combinations);
+
+var izip_longest = __inherit(object, "izip_longest");
+
+izip_longest.PY$__init__ = function(self) {
+    var pyargs = __uncook(arguments);
+    self.fillvalue = pyargs.kw.fillvalue === undefined ? None : pyargs.kw.fillvalue;
+    self.iters = [];
+    for (var i = 1; i < pyargs.varargs.length; i++) {
+        self.iters.push(iter(pyargs.varargs[i]));
+    }
+    self.active = self.iters.length;
+};
+
+izip_longest.PY$__iter__ = $PY.itself;
+
+izip_longest.__pyjaco_next__ = function() {
+    var iters = this.iters;
+    if (this.active === 0) {
+        return null;
+    }
+    var res = new Array(iters.length);
+    for (var i = 0; i < iters.length; i++) {
+        var value = iters[i] === null ? null : $PY.next(iters[i]);
+        if (value === null) {
+            if (iters[i] !== null) {
+                iters[i] = null;
+                this.active--;
+                if (this.active === 0) {
+                    return null;
+                }
+            }
+            value = this.fillvalue;
+        }
+        res[i] = value;
+    }
+    return tuple(res);
+};
+
+$PY.nextable(izip_longest);
+
+/*
+  The iterators made by tee share a linked list of the values read from
+  the source, so values are kept only until every copy has passed them.
+*/
+var _tee = __inherit(object, "tee");
+
+_tee.PY$__init__ = function(self, source, link) {
+    self.source = source;
+    self.link = link;
+};
+
+_tee.PY$__iter__ = $PY.itself;
+
+_tee.PY$__copy__ = function(self) {
+    return $PY.teeobject(self.source, self.link);
+};
+
+_tee.__pyjaco_next__ = function() {
+    var link = this.link;
+    if (link.next === undefined) {
+        var value = $PY.next(this.source);
+        if (value === null) {
+            return null;
+        }
+        link.value = value;
+        link.next = {};
+    }
+    this.link = link.next;
+    return link.value;
+};
+
+$PY.nextable(_tee);
+
+$PY.teeobject = _tee;
+
+$PY.tee = function(seq, n) {
+    n = n === undefined ? 2 : js(n);
+    if (n < 0) {
+        throw __builtins__.PY$ValueError("n must be >= 0");
+    }
+    var first = iter(seq);
+    if (first.PY$__class__ !== $PY.teeobject) {
+        first = $PY.teeobject(first, {});
+    }
+    var res = [];
+    for (var i = 0; i < n; i++) {
+        res.push(i === 0 ? first : $PY.teeobject(first.source, first.link));
+    }
+    return tuple(res);
+};
+
+$PY.module("itertools", {
+    PY$count: count,
+    PY$cycle: cycle,
+    PY$repeat: repeat,
+    PY$chain: chain,
+    PY$islice: islice,
+    PY$takewhile: takewhile,
+    PY$dropwhile: dropwhile,
+    PY$groupby: groupby,
+    PY$product: product,
+    PY$permutations: permutations,
+    PY$combinations: combinations,
+    PY$izip_longest: izip_longest,
+    PY$tee: $PY.tee,
+    PY$imap: imap,
+    PY$ifilter: ifilter,
+    PY$izip: izip
+});
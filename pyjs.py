@@ -83,7 +83,7 @@ def compile_file(infile, outfile, options):
     elif options.builtins == "import-each":
         outfile.write(BuiltinGenerator().generate_loadbuiltins())
 
-    c = Compiler()
+    c = Compiler(opts = dict(native_numbers = options.native_numbers, es6_generators = options.es6_generators))
     c.append_string(infile.read())
     outfile.write(str(c))
 
@@ -248,6 +248,18 @@ def main():
             default = False,
             help = "Watch the input files for changes and recompile. If the input file is a single file, watch it for changes and recompile. If a directory, recompile if any .py or .pyjaco files in the directory have changes.")
 
+    parser.add_option("--boxed-numbers",
+            action = "store_false",
+            dest = "native_numbers",
+            default = True,
+            help = "Always box numbers in int/float objects, instead of keeping int and float locals as plain javascript numbers")
+
+    parser.add_option("--es6-generators",
+            action = "store_true",
+            dest = "es6_generators",
+            default = False,
+            help = "Compile generators to native javascript generator functions (function*), instead of state machines")
+
     options, args = parser.parse_args()
 
     if len(args) == 0 and options.builtins != "generate":
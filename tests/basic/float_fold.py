@@ -0,0 +1,6 @@
+print 0.1 + 0.2 > 0.3
+print 0.1 + 0.2 == 0.3
+print 0.1 * 3 == 0.30000000000000004
+x = 1999999999999.99 * 1
+print x == 1999999999999.99, x > 1999999999999.9
+print 1.0 / 3 * 3 == 1.0
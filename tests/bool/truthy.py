@@ -0,0 +1,30 @@
+class Empty(object):
+    def __len__(self):
+        return 0
+
+class Flag(object):
+    def __init__(self, value):
+        self.value = value
+    def __nonzero__(self):
+        return self.value
+
+values = [0, 1, 0.0, -2.5, "", "x", u"", [], [0], (), (0,), {}, {1: 2}, set(), set([0]), None, True, False, Empty(), Flag(True), Flag(False)]
+for value in values:
+    res = []
+    if value:
+        res.append("if")
+    if not value:
+        res.append("not")
+    res.append("yes" if value else "no")
+    res.append(bool(value))
+    res.append(not value)
+    print res
+
+queue = [1, 2]
+while queue:
+    print queue.pop(0)
+print "still" if queue else "empty", not not queue
+n = 0
+while not n or (n < 3 and not Empty()):
+    n = n + 1
+print n, [x for x in values if x and not isinstance(x, Flag)]
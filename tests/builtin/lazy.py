@@ -0,0 +1,65 @@
+names = ["ann", "bob", "cid"]
+ages = [31, 25, 47, 60]
+
+for i, name in enumerate(names):
+    print i, name
+
+for i, name in enumerate(names, 1):
+    print i, name
+
+for name, age in zip(names, ages):
+    print name, age
+
+for i, pair in enumerate(zip(names, ages)):
+    print i, pair
+
+e = enumerate("ab")
+print e.next()
+print list(e)
+print list(enumerate([]))
+
+print zip(names, ages, "xyz")
+print zip()
+print map(None, names, ages)
+print map(lambda a, b: a + b, ages, ages)
+print map(len, names)
+
+print filter(None, [0, 1, "", "a", None, [], [2]])
+print filter(lambda x: x > 30, ages)
+print filter(lambda c: c != "b", "abcb")
+print filter(None, (0, 1, 2))
+
+print list(reversed(names))
+print list(reversed("abc"))
+print list(reversed((1, 2, 3)))
+print list(reversed(xrange(4)))
+print "".join(reversed("olleh"))
+
+class Seq(object):
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, i):
+        return i * 10
+
+class Back(object):
+    def __reversed__(self):
+        return iter([3, 2, 1])
+
+print list(reversed(Seq()))
+print list(reversed(Back()))
+
+try:
+    reversed({})
+except TypeError:
+    print "not a sequence"
+
+total = 0
+for i, age in enumerate(map(lambda x: x * 2, filter(lambda x: x < 50, ages))):
+    total += i * age
+print total
+
+print sum(x for x in reversed(ages))
+print max(zip(ages, names))
+print dict(zip(names, ages))["bob"]
+print sorted(dict(enumerate(names)).items())
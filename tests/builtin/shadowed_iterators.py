@@ -0,0 +1,21 @@
+def izip(a, b):
+    return "mine"
+
+def imap(f, seq):
+    return "mine"
+
+def ifilter(f, seq):
+    return "mine"
+
+def dictiter(table, kind):
+    return "mine"
+
+def striter(s, cls):
+    return "mine"
+
+print zip([1, 2], [3, 4])
+print map(lambda x: x * 2, [1, 2])
+print filter(None, [0, 1, 2])
+print sorted(iter({"a": 1, "b": 2}))
+print list("ab")
+print izip(1, 2)
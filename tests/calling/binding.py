@@ -0,0 +1,62 @@
+def pos(a, b):
+    return a - b
+
+def defaults(a, b=10, c="c"):
+    return "%s %s %s" % (a, b, c)
+
+def star(a, *args):
+    return a, args
+
+def starstar(a, **kw):
+    return a, sorted(kw.items())
+
+def both(a, b=2, *args, **kw):
+    return a, b, args, sorted(kw.items())
+
+print pos(5, 3)
+print pos(b=3, a=5)
+print pos(5, b=3)
+print pos(*[5, 3])
+print defaults(1)
+print defaults(1, 2)
+print defaults(1, c=3)
+print defaults(1, 2, 3)
+print star(1)
+print star(1, 2, 3)
+print star(*(1, 2))
+print starstar(1)
+print starstar(1, x=2)
+print starstar(a=1, x=2, y=3)
+print both(1)
+print both(1, 3, 4, 5)
+print both(1, z=9)
+print both(*[1, 2, 3], **{"q": 4})
+
+class C(object):
+
+    def __init__(self, n=1):
+        self.n = n
+
+    def add(self, x, y=0):
+        return self.n + x + y
+
+    @staticmethod
+    def twice(x):
+        return x * 2
+
+c = C()
+print c.add(1), c.add(1, 2), c.add(1, y=3), C(5).add(x=1)
+print C.twice(4), c.twice(5)
+m = c.add
+print m(10), m(10, y=10)
+
+def deco(f):
+    def wrapper(*args, **kw):
+        return "<%s>" % f(*args, **kw)
+    return wrapper
+
+@deco
+def wrapped(a, b=1):
+    return a + b
+
+print wrapped(1), wrapped(1, 2), wrapped(1, b=5)
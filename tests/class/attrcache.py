@@ -0,0 +1,49 @@
+class Point(object):
+    scale = 1
+    def __init__(self, x):
+        self.x = x
+
+class Label(object):
+    def __init__(self, x):
+        self.x = "label %s" % x
+
+class Proxy(object):
+    def __getattr__(self, name):
+        return "missing %s" % name
+
+def total(items):
+    res = []
+    for item in items:
+        res.append(item.x)
+    return res
+
+items = [Point(1), Label(2), Point(3), Proxy()]
+print total(items)
+p = items[0]
+print p.scale
+p.scale = 5
+print p.scale, Point(0).scale
+Point.scale = 7
+print Point(0).scale, p.scale
+del p.x
+print hasattr(p, "x")
+setattr(p, "x", 9)
+print p.x, getattr(p, "x"), Point.__name__
+
+def everything(self, name):
+    return "always %s" % name
+
+print p.x
+Point.__getattribute__ = everything
+print p.x
+
+class Odd(object):
+    def __init__(self):
+        self.constructor = 1
+        self.valueOf = 2
+        self.toString = 3
+        self.hasOwnProperty = 4
+        self.__proto__ = 5
+
+o = Odd()
+print o.constructor, o.valueOf, o.toString, o.hasOwnProperty, o.__proto__
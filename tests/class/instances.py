@@ -0,0 +1,38 @@
+class Point(object):
+    dims = 2
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def norm1(self):
+        return abs(self.x) + abs(self.y)
+
+class Adder(object):
+
+    def __init__(self, n):
+        self.n = n
+
+    def __call__(self, x):
+        return x + self.n
+
+class Adder3(Adder):
+
+    def __init__(self):
+        Adder.__init__(self, 3)
+
+p = Point(1, -2)
+q = Point(3, 4)
+print p.norm1(), q.norm1(), p.dims, q.dims
+q.dims = 3
+print p.dims, q.dims, Point.dims
+print p.__class__ is Point, isinstance(p, Point), isinstance(p, Adder)
+print id(p) == id(p), id(p) == id(q), hash(p) == hash(p)
+print callable(p), callable(Point), callable(Adder(1))
+
+add = Adder(10)
+print add(5), Adder3()(4), map(Adder3(), [1, 2])
+print isinstance(Adder3(), Adder), Adder3().__class__ is Adder3
+
+points = [Point(i, i) for i in range(1000)]
+print sum([pt.norm1() for pt in points])
@@ -0,0 +1,37 @@
+class Stack(object):
+    def __init__(self):
+        self.items = []
+    def __len__(self):
+        return len(self.items)
+    def push(self, *values):
+        for value in values:
+            self.items.append(value)
+        return self
+    def top(self, default = None):
+        if self.items:
+            return self.items[-1]
+        return default
+    @staticmethod
+    def twice(x):
+        return x * 2
+
+class Adder(object):
+    def __call__(self, a, b):
+        return a + b
+
+def shout(text):
+    return text.upper()
+
+s = Stack()
+print s.top("empty"), len(s)
+s.push(1).push(2, 3, 4, 5, 6)
+print s.top(), s.top(default = 0), Stack.top(s), s.twice(21)
+push = s.push
+push(7)
+print s.items, len(s)
+s.callback = shout
+s.adder = Adder()
+print s.callback("hi"), s.adder(1, 2)
+print "-".join(["a", "b"]), s.items.index(3)
+callback = s.callback
+print callback("value")
@@ -0,0 +1,53 @@
+class Key(object):
+
+    def __init__(self, name, h):
+        self.name = name
+        self.h = h
+
+    def __hash__(self):
+        return self.h
+
+    def __eq__(self, other):
+        return isinstance(other, Key) and self.name == other.name
+
+    def __repr__(self):
+        return "Key(%s)" % self.name
+
+d = {}
+for i in range(20):
+    d[Key("k%d" % i, i % 3)] = i
+
+print len(d)
+print d[Key("k7", 1)], d[Key("k12", 0)]
+print Key("k7", 1) in d, Key("k7", 2) in d, Key("x", 1) in d
+
+for i in range(0, 20, 2):
+    del d[Key("k%d" % i, i % 3)]
+
+print len(d)
+print sorted(d.values())
+print d.get(Key("k4", 1)), d.get(Key("k5", 2))
+
+n = {}
+n[1] = "int"
+n[1.0] = "float"
+n[True] = "bool"
+print len(n), n[1]
+n["1"] = "str"
+print len(n), n[1], n["1"]
+
+big = {}
+for i in range(100):
+    big[i] = i * i
+for i in range(90):
+    big.pop(i)
+print len(big), sorted(big.keys())
+print big.pop(95), big.pop(200, "missing")
+big.clear()
+print len(big), 5 in big
+big[5] = 1
+print big.items()
+
+o = dict(a = 1)
+while o:
+    print o.popitem()
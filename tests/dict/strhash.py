@@ -0,0 +1,13 @@
+class Name(str):
+    pass
+
+long = "abcdefghij" * 100
+d = {long: 1, (1, "a"): 2, frozenset([1, 2]): 3}
+d[long[:-1] + "j"] += 10
+d[(1, "a")] += 10
+d[frozenset([2, 1])] += 10
+d[Name("plain")] = 4
+print d["plain"], d[long], d[(1, "a")], d[frozenset([1, 2])]
+s = set([1, 1.0, True, "a", u"a"])
+print len(s), (2, "b") in set([(2, "b")])
+print hash(long) == hash(long[:]), hash((1, "a")) == hash((1, u"a")), hash(1) == hash(1.0) == hash(True)
@@ -0,0 +1,7 @@
+d = {}
+k = "k%d" % 3
+d[k] = 1
+d["k3"] += 1
+d["x" + "y"] = 5
+print sorted(d.items())
+print hash(k) == hash("k3"), k in set(["k3"]), "xy" in d
@@ -0,0 +1,69 @@
+d = {"a": 1, "b": 2, "c": 3}
+
+res = []
+for k, v in d.items():
+    res.append(k + str(v))
+print sorted(res)
+
+res = []
+for k, v in d.iteritems():
+    res.append(v)
+print sorted(res)
+
+for k, v in sorted(d.items()):
+    print k, v
+else:
+    print "else"
+
+for k, v in d.items():
+    if v == 2:
+        break
+else:
+    print "not reached"
+print k
+
+for k, v in d.items():
+    d[k + k] = v
+print sorted(d.keys())
+
+for k, v in d.items():
+    if len(k) == 2:
+        del d[k]
+print sorted(d.items())
+
+try:
+    for k, v in d.iteritems():
+        d["z"] = 0
+except RuntimeError:
+    print "changed size"
+del d["z"]
+
+print sorted(d.iterkeys())
+print sorted(d.itervalues())
+print sorted(d.iteritems())
+print sorted(list(iter(d)))
+
+ks = d.viewkeys()
+vs = d.viewvalues()
+its = d.viewitems()
+print len(ks), len(vs), len(its)
+print "a" in ks, "x" in ks
+print 2 in vs, 5 in vs
+print ("a", 1) in its, ("a", 2) in its
+d["d"] = 4
+print len(ks), sorted(ks), sorted(vs)
+
+class Pairs(object):
+    def items(self):
+        return [(1, "one"), (2, "two")]
+
+for k, v in Pairs().items():
+    print k, v
+
+n = 0
+it = d.iteritems()
+for k, v in it:
+    n += v
+print n
+
+print [k for k in d if d[k] > 2]
@@ -0,0 +1,62 @@
+def loops(n, step):
+    res = []
+    for i in range(n):
+        res.append(i)
+    for i in range(2, n):
+        res.append(i)
+    for i in xrange(n, 0, -1):
+        res.append(i)
+    for i in range(n, -n, -3):
+        res.append(i)
+    for i in range(0, n, step):
+        res.append(i)
+    for i in range(n, 0, -step):
+        res.append(i)
+    return res
+
+def target(n):
+    j = 42
+    for j in range(n, n):
+        pass
+    print "untouched", j
+    for j in range(n):
+        j = j * 10
+    print "last", j
+    total = 0
+    for k in xrange(n):
+        total += k
+    return total
+
+def orelse(n, stop):
+    for i in range(n):
+        if i == stop:
+            print "break at", i
+            break
+    else:
+        print "no break"
+    for i in range(n):
+        for k in range(n):
+            if k == 1:
+                break
+    else:
+        print "inner break does not skip outer else"
+
+def zero(step):
+    try:
+        for i in range(0, 10, step):
+            pass
+    except ValueError:
+        print "zero step"
+
+print loops(5, 2)
+print loops(0, 1)
+print target(5)
+orelse(5, 3)
+orelse(5, 10)
+zero(0)
+print range(10, 0, -2)
+
+for x in range(3):
+    print "module", x
+else:
+    print "module done", x
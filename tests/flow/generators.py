@@ -0,0 +1,152 @@
+def countdown(n):
+    while n > 0:
+        yield n
+        n -= 1
+
+def evens(items):
+    for x in items:
+        if x % 2:
+            continue
+        if x > 10:
+            break
+        yield x
+    else:
+        yield "no break"
+
+def nested(n):
+    for i in range(n):
+        for j in range(i):
+            yield (i, j)
+
+def echo():
+    total = 0
+    while True:
+        value = yield total
+        if value is None:
+            return
+        total += value
+
+def guarded(items):
+    for x in items:
+        try:
+            yield 10 / x
+        except ZeroDivisionError:
+            yield "division by zero"
+
+def catcher():
+    while True:
+        try:
+            yield "waiting"
+        except ValueError:
+            yield "caught"
+            break
+    yield "done"
+
+print list(countdown(5))
+print list(evens([1, 2, 3, 4, 12, 6]))
+print list(evens([2, 4]))
+print list(nested(4))
+print list(guarded([1, 0, 5]))
+
+e = echo()
+print e.next()
+print e.send(5)
+print e.send(10)
+try:
+    e.send(None)
+except StopIteration:
+    print "echo stopped"
+
+c = catcher()
+print c.next()
+print c.throw(ValueError)
+print c.next()
+try:
+    c.next()
+except StopIteration:
+    print "catcher stopped"
+
+g = countdown(2)
+print g.next(), g.next()
+try:
+    g.next()
+except StopIteration:
+    print "countdown stopped"
+
+print sum(x * x for x in range(10))
+print list(x + y for x in range(3) for y in range(x) if y != 1)
+print sorted(c for c in "generator" if c > "m")
+
+lazy = (x * 2 for x in countdown(3))
+print lazy.next()
+for x in lazy:
+    print "lazy", x
+
+lst = [1, 2, 3]
+flag = True
+g = (x for x in lst if flag)
+flag = 5
+print list(g)
+
+def collector():
+    items = []
+    while True:
+        item = yield
+        if item is None:
+            break
+        items.append(item)
+    yield items
+
+def ticks(n):
+    for i in range(n):
+        yield
+
+c = collector()
+c.next()
+c.send(1)
+c.send(2)
+print c.send(None)
+print list(ticks(3))
+
+def closing():
+    try:
+        yield 1
+        yield 2
+    except GeneratorExit:
+        print "closed"
+        raise
+
+g = closing()
+print g.next()
+g.close()
+print list(g)
+
+def stops():
+    yield 1
+    raise StopIteration()
+
+def stops_class():
+    yield 1
+    yield 2
+    raise StopIteration
+
+def relay(seq):
+    it = iter(seq)
+    while True:
+        yield it.next()
+
+print list(stops())
+print list(stops_class())
+print list(relay([4, 5, 6]))
+print [x * 2 for x in relay("ab")]
+
+def thrower():
+    yield 1
+    yield 2
+
+t = thrower()
+try:
+    t.throw(KeyError("early"))
+except KeyError:
+    print "raised"
+print list(t)
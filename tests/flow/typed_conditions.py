@@ -0,0 +1,47 @@
+class Box(object):
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+def check(n, s):
+    flag = len(s) > 2
+    name = "n"
+    if flag:
+        print "flag is set"
+    if not flag:
+        print "flag is clear"
+    if name == "n" and flag:
+        print "name and flag"
+    b = Box(n)
+    if b == Box(3):
+        print "box equals"
+    found = False
+    for i in range(n):
+        if i == 2:
+            found = True
+            break
+    else:
+        found = None
+    if found is None:
+        print "loop ran out"
+    elif found:
+        print "found"
+    try:
+        value = 1
+        value = s.upper()
+        value = n.upper()
+    except:
+        print "value is", value
+    else:
+        print "value is", value
+    squares = [k * k for k in range(n)]
+    print squares
+    while flag:
+        flag = not flag
+        print "while", flag
+    return flag
+
+print check(1, "a")
+print check(3, "abc")
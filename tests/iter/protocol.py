@@ -0,0 +1,57 @@
+def count(n):
+    i = 0
+    while i < n:
+        yield i
+        i += 1
+
+class Countdown(object):
+    def __init__(self, n):
+        self.n = n
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self.n <= 0:
+            raise StopIteration
+        self.n -= 1
+        return self.n
+
+total = 0
+for x in [1, 2, 3]:
+    total += x
+print total
+
+for c in "abc":
+    print c
+
+for x in count(3):
+    print x
+
+for x in Countdown(3):
+    print x
+
+print list(count(4))
+print list(Countdown(4))
+print tuple(xrange(3))
+print zip(count(3), "abcd", Countdown(5))
+print all(count(0)), any(count(3)), all(Countdown(3))
+print [x * 2 for x in Countdown(3)]
+print sorted(Countdown(5))
+
+a, b = count(2)
+print a, b
+
+it = iter([None, 1])
+print it.next(), it.next()
+try:
+    it.next()
+except StopIteration:
+    print "done"
+
+g = count(2)
+print g.next(), g.next()
+try:
+    g.next()
+except StopIteration:
+    print "done"
@@ -0,0 +1,50 @@
+from collections import deque
+import collections
+
+d = deque()
+for i in range(20):
+    d.append(i)
+    d.appendleft(-i)
+print d, len(d)
+print d.pop(), d.popleft(), d[0], d[-1], d[5]
+d.rotate(3)
+print d
+d.rotate(-5)
+print d
+d.extend([100, 101])
+d.extendleft("ab")
+print d, 100 in d, 7 in d, d.count(0)
+d.remove(100)
+d.reverse()
+d[0] = "first"
+del d[1]
+print d
+print list(d)[:3], list(reversed(d))[:3]
+
+q = collections.deque([1, 2, 3], maxlen=3)
+q.append(4)
+print q, q.maxlen
+q.appendleft(0)
+print q
+q.extend(range(10))
+print q, len(q)
+print deque(maxlen=0), deque("abc") == deque(["a", "b", "c"]), deque([1]) == [1]
+
+e = deque()
+try:
+    e.pop()
+except IndexError, err:
+    print "IndexError", err
+try:
+    e.remove(1)
+except ValueError, err:
+    print "ValueError", err
+
+work = deque(range(1000))
+total = 0
+while work:
+    x = work.popleft()
+    total += x
+    if x % 7 == 0 and x < 1000:
+        work.append(x + 1000)
+print total
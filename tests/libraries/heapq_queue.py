@@ -0,0 +1,34 @@
+import heapq
+from heapq import heappush, heappop
+
+h = []
+for x in [5, 1, 8, 3, 9, 2, 7, 1]:
+    heappush(h, x)
+print h[0], len(h)
+out = []
+while h:
+    out.append(heappop(h))
+print out
+
+l = [9, 4, 7, 1, 8, 2]
+heapq.heapify(l)
+print l[0], heapq.heapreplace(l, 5), heapq.heappushpop(l, 0), heapq.heappushpop(l, 6)
+print sorted(l)
+
+tasks = []
+heappush(tasks, (2, "write"))
+heappush(tasks, (1, "read"))
+heappush(tasks, (3, "close"))
+heappush(tasks, (1, "open"))
+while tasks:
+    print heappop(tasks)
+
+data = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+print heapq.nsmallest(3, data), heapq.nlargest(3, data)
+words = ["bb", "a", "ccc", "dd", "e"]
+print heapq.nsmallest(2, words, key=len), heapq.nlargest(2, words, key=len)
+print list(heapq.merge([1, 4, 7], [2, 5, 8], [0, 3, 9]))
+try:
+    heappop([])
+except IndexError, err:
+    print "IndexError"
@@ -0,0 +1,68 @@
+import itertools
+from itertools import count, cycle, repeat, chain, islice, takewhile, dropwhile, groupby
+from itertools import product, permutations, combinations, izip_longest, tee, imap, ifilter, izip
+
+print list(islice(count(), 5))
+print list(islice(count(10, 5), 3))
+print list(islice(count(start = 3), 2))
+print list(islice(cycle("abc"), 7))
+print list(cycle([]))
+print list(repeat(7, 3)), list(repeat("x", 0))
+print list(islice(repeat(None), 2))
+print repr(count(4)), repr(repeat(1, 2))
+
+print list(chain([1, 2], (3,), "ab", []))
+print list(chain.from_iterable([[1], [2, 3], []]))
+print list(chain())
+
+print list(islice("abcdefg", 2, None))
+print list(islice("abcdefg", 0, 6, 2))
+print list(islice("abcdefg", 1, 3))
+print list(islice(range(10), None, None, 3))
+try:
+    islice("abc", -1)
+except ValueError:
+    print "bad index"
+
+print list(takewhile(lambda x: x < 5, [1, 4, 6, 4, 1]))
+print list(dropwhile(lambda x: x < 5, [1, 4, 6, 4, 1]))
+
+for k, g in groupby("AAAABBBCCDAABBB"):
+    print k, list(g)
+print [k for k, g in groupby("AAAABBBCCD")]
+for k, g in groupby([1, 3, 2, 4, 5, 7], key = lambda x: x % 2):
+    print k, list(g)
+groups = [(k, list(g)) for k, g in groupby(sorted(["bob", "ann", "al", "bea"]), lambda s: s[0])]
+print groups
+
+print list(product("ab", [0, 1]))
+print list(product([1, 2], repeat = 2))
+print list(product("ab", []))
+print list(product())
+print list(permutations("abc"))
+print list(permutations(range(4), 2))
+print list(permutations("ab", 3))
+print list(combinations("abcd", 2))
+print list(combinations(range(4), 3))
+print list(combinations("ab", 0))
+print list(izip_longest("abc", [1]))
+print list(izip_longest("ab", "xyz", fillvalue = "-"))
+
+a, b = tee(iter([1, 2, 3]))
+print a.next(), list(a), list(b)
+c, d, e = tee(count(), 3)
+print c.next(), c.next(), d.next(), list(islice(e, 3))
+print tee([1], 0)
+
+print list(imap(lambda x, y: x * y, [1, 2, 3], count(1)))
+print list(imap(None, "ab", "cd"))
+print list(ifilter(None, [0, 1, 2, ""]))
+print list(izip("abc", count()))
+
+total = 0
+for i, x in izip(count(), islice(cycle([1, 2, 3]), 100000)):
+    total += x
+print total
+
+print sum(islice(imap(lambda x: x * x, count(1)), 10))
+print itertools.islice is islice
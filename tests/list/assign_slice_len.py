@@ -0,0 +1,9 @@
+m = [1, 2, 3, 4]
+m[0:1] = [len(m)]
+print m
+m[::2] = ['x'] * len(m[::2])
+print m
+m[len(m) - 1:] = [len("abc")]
+print m
+del m[:len(m) - 2]
+print m
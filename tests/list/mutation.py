@@ -0,0 +1,63 @@
+l = range(10)
+del l[2:4]
+print l
+del l[5:]
+print l
+del l[:1]
+print l
+del l[-2:]
+print l
+l = range(12)
+del l[::3]
+print l
+del l[::-2]
+print l
+del l[1]
+del l[-1]
+print l
+
+l = range(5)
+l.insert(0, "a")
+l.insert(-1, "b")
+l.insert(100, "c")
+l.insert(-100, "d")
+print l
+l.remove("b")
+print l
+print l.pop(), l.pop(1), l.pop(-2), l
+l[1:3] = ["x", "y", "z"]
+print l
+l[1:4] = ["q"]
+print l
+l[1:2] = ["r", "s"]
+print l
+
+q = range(100)
+total = 0
+while q:
+    x = q.pop(0)
+    total += x
+    if x % 10 == 0 and x < 500:
+        q.append(x + 1000)
+    if len(q) == 50:
+        print q[0], q[-1], q[10], len(q)
+        q[0] = -1
+        print q[:3], -1 in q
+print total, q
+
+q = range(40)
+for i in range(30):
+    q.pop(0)
+q.extend([1, 2])
+q.insert(1, 99)
+print q, len(q), q.index(99)
+q.sort()
+print q
+try:
+    [].pop()
+except IndexError, e:
+    print "IndexError", e
+try:
+    [1].pop(5)
+except IndexError, e:
+    print "IndexError", e
@@ -0,0 +1,25 @@
+calls = [0]
+
+def key(x):
+    calls[0] += 1
+    return x[1]
+
+records = [("a", 3), ("b", 1), ("c", 3), ("d", 2), ("e", 1), ("f", 2)]
+l = list(records)
+l.sort(key=key)
+print l, calls[0]
+l = list(records)
+l.sort(key=key, reverse=True)
+print l
+print sorted(records, key=lambda r: r[1], reverse=True)
+print sorted(records, reverse=True)
+print sorted([3, 1.5, 2, -1, True]), sorted([3, 1.5, 2, -1], reverse=True)
+print sorted(["b", "a", "C", "ab", ""]), sorted("hello")
+print sorted([[2, 1], [1, 2], [1]]), sorted([(1, "b"), (1, "a")])
+print sorted([5, 3, 9], cmp=lambda a, b: b - a), sorted([5, 3, 9], lambda a, b: a - b, None, True)
+print sorted(range(10), key=lambda x: x % 3)
+print sorted({"x": 1, "y": 2}), sorted(set([3, 1, 2]))
+l = [4, 2, 3]
+print l.sort(), l
+words = ["pear", "Fig", "apple", "fig", "Pear"]
+print sorted(words, key=lambda w: w.lower()), sorted(words, key=len, reverse=True)
@@ -0,0 +1,13 @@
+from __future__ import division
+
+def sizes(items, text, pair):
+    n = len(items)
+    total = 0
+    for i in range(len(text)):
+        total = total + len(pair) + n
+    return n, total, len(text) - 1, len(pair) * 2
+
+print 2 * 3, "a" + "b", len("abc"), -7 // 2, 7 / 2, 2 ** 10, "%d-%s" % (1, "x")
+print -(3 - 5), ~7, not 0, not "x", 1 << 40, 1.5 * 4, ord("A"), chr(66), abs(-4)
+print 7 % -3, 2.0 ** -1, "ab" * 3, 0xff & 0x0f | 0x30, len(()) + len((1, "a"))
+print sizes([1, 2], "hello", (3, 4)), sizes({1: 2}, u"hi", ())
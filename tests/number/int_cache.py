@@ -0,0 +1,13 @@
+a = int("42")
+print a is 42, (a + 1) is 43, (a * 6) is 252, (a - 47) is -5
+print int("ff", 16), int(3.9) is 3, int(-3.9) is -3
+
+n = 0
+for i in xrange(1000):
+    if i % 100 == 42:
+        n += 1
+print n
+
+s = "".join(["k", "e", "y"])
+print s == "key", intern(s) is "key", intern(s) is intern("k" + "ey")
+print {"key": 1}[s], {1000: "big"}[999 + 1], {2.5: "half"}[5 / 2.0]
@@ -0,0 +1,80 @@
+def count(n):
+    total = 0
+    i = 0
+    while i < n:
+        total += i * i
+        i = i + 1
+    return total
+
+def divmods(a, b):
+    q = a // b
+    r = a % b
+    d = a / b
+    return [q, r, d]
+
+def floats(n):
+    x = 0.5
+    step = 1.25
+    for j in [1, 2, 3]:
+        x = x * 2 + step
+    y = -x + 20
+    return [x, y, x // 2, x % 3, -x // 2, -x % 3, x - n]
+
+def compare(n):
+    a = 3
+    b = 7
+    res = []
+    if a < n < b:
+        res.append("between")
+    if a <= 3 == a:
+        res.append("chained")
+    if not a > b:
+        res.append("not greater")
+    res.append(a == b)
+    res.append(a != b)
+    return res
+
+def zero():
+    a = 1
+    b = 0
+    try:
+        a = a // b
+    except ZeroDivisionError:
+        print "integer division by zero"
+    try:
+        a = a % b
+    except ZeroDivisionError:
+        print "integer modulo by zero"
+    f = 1.5
+    g = 0.0
+    try:
+        f = f / g
+    except ZeroDivisionError:
+        print "float division by zero"
+    return a
+
+def bits():
+    x = 12
+    x <<= 2
+    x |= 3
+    x ^= 1
+    y = ~x
+    return [x, y, x >> 1, x & 6, 2 ** 10, -2 ** 2]
+
+def convert(s):
+    a = int(s) + 1
+    b = float(s) / 4
+    c = int(7.9) + int(-7.9)
+    return [a, b, c]
+
+print count(10)
+print divmods(7, 2)
+print divmods(-7, 2)
+print divmods(7, -2)
+print divmods(-7, -2)
+print floats(10)
+print compare(5)
+print compare(2)
+print zero()
+print bits()
+print convert("12")
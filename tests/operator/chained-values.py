@@ -0,0 +1,30 @@
+class Value(object):
+    def __init__(self, n):
+        self.n = n
+    def __lt__(self, other):
+        return self.n < other.n and "lt%d" % self.n
+
+calls = []
+def get(n):
+    calls.append(n)
+    return Value(n)
+
+print get(1) < get(2) < get(3), calls
+calls = []
+print get(3) < get(2) < get(1), calls
+
+def clamp(values, lo, hi):
+    res = []
+    for v in values:
+        res.append(lo <= v < hi or v and -1 or "zero")
+    return res
+
+def pairs(items):
+    for a, b in items:
+        yield a or b, a and b
+
+print clamp([0, 1, 5, 9, 10], 1, 10)
+print list(pairs([(0, 1), (2, 0), ("", None), ([], "x")]))
+fallback = None
+name = fallback or "anonymous"
+print name, (lambda x, y: x < y <= 10)(1, 2), [x > 1 and x for x in range(4)]
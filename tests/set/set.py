@@ -0,0 +1,81 @@
+a = set([1, 2, 3, 4])
+b = {3, 4, 5}
+
+print len(a), len(b)
+print 3 in a, 5 in a, 5 not in a
+print sorted(a | b)
+print sorted(a & b)
+print sorted(a - b)
+print sorted(a ^ b)
+print sorted(a.union([7, 8], (9,)))
+print sorted(a.intersection(range(2, 10)))
+print sorted(a.difference([1]))
+print a.issubset(range(10)), a.issuperset([1, 2]), a.isdisjoint(b)
+print a <= a, a < a, set([1]) < a, a > b, a == set([4, 3, 2, 1]), a != b
+
+s = set()
+for x in range(20):
+    s.add(x % 7)
+print len(s), sorted(s)
+s.discard(3)
+s.discard(100)
+s.remove(4)
+try:
+    s.remove(4)
+except KeyError:
+    print "KeyError"
+print sorted(s)
+
+s |= set([10, 11])
+s -= set([0])
+s &= set([1, 2, 10, 11, 12])
+print sorted(s)
+s ^= set([1, 12])
+print sorted(s)
+s.update("ab", [1])
+print len(s), "a" in s, "c" in s
+s.clear()
+print len(s), bool(s)
+
+print set([1, 1.0, True]) == set([1])
+print sorted(set("mississippi"))
+print sorted(set(x * x for x in range(-3, 4)))
+print sorted({x % 4 for x in range(50) if x > 10})
+print sorted({(x, y) for x in range(2) for y in "ab"})
+
+f = frozenset([1, 2])
+d = {f: "frozen"}
+print d[frozenset([2, 1])]
+print hash(frozenset([1, 2])) == hash(frozenset([2, 1]))
+print sorted(f | set([3])), type(f | set([3])).__name__, type(set([3]) | f).__name__
+print set([1, 2]) == frozenset([1, 2])
+try:
+    hash(set())
+except TypeError:
+    print "TypeError"
+
+p = set([5])
+print p.pop(), len(p)
+try:
+    p.pop()
+except KeyError:
+    print "KeyError"
+print set([1]), frozenset(), set()
+
+big = set(range(1000))
+big.discard(500)
+total = 0
+for x in big:
+    total += x
+print total, sum(frozenset([1, 2, 3])), sorted(iter(set("abc")))
+it = iter(set([7]))
+print it.next()
+try:
+    it.next()
+except StopIteration:
+    print "stop"
+try:
+    for x in big:
+        big.add(-1)
+except RuntimeError:
+    print "RuntimeError"
@@ -0,0 +1,7 @@
+s = "hello world"
+print "o w" in s, "low" in s, "" in s, "h" in s, "x" not in s
+print "WORLD".lower() in s, s.upper() in s
+try:
+    print 1 in s
+except TypeError, e:
+    print "TypeError"
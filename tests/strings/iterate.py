@@ -0,0 +1,31 @@
+s = "pyjaco" * 1000
+n = 0
+for c in s:
+    if c == "j":
+        n += 1
+print n
+
+print list("hello")
+print [c for c in "abc"]
+print "-".join(reversed(list("abc")))
+
+it = iter("xy")
+print it.next()
+print it.next()
+try:
+    it.next()
+except StopIteration:
+    print "stop"
+
+u = u"a\U0001F600b"
+chars = list(u)
+print len(chars) == len(u)
+print all(c == u[i] for i, c in enumerate(u))
+print chars[0] == u[:1], chars[-1] == u[-1:]
+print "".join(chars) == u
+print ord(chars[0]), ord(chars[-1])
+
+x, y, z = "xyz"
+print z, y, x
+
+print "".join([c.upper() for c in "iterate"])
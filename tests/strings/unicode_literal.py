@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+b = "é"
+u = u"é"
+print len(b), len(u)
+print u"ab" == "ab", {u"k": 1}["k"]
+print type(u"x").__name__
+print (u"a" + "b").upper()
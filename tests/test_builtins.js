@@ -220,7 +220,7 @@ function test_list() {
     raises(__builtins__.PY$ValueError, function() { t.PY$index(t, 5) });
     test(function() { return t.PY$count(t, 5) == 0 });
 
-    raises(__builtins__.PY$AttributeError, function() { return __builtins__.PY$hash(t) });
+    raises(__builtins__.PY$TypeError, function() { return __builtins__.PY$hash(t) });
 
     var t = list([3, 4, 5, 5, 4, 4, 1]);
 
@@ -253,7 +253,7 @@ function test_list() {
     test(function() { return t.PY$index(t, 5) == 2 });
     test(function() { return t.PY$count(t, 5) == 2 });
 
-    raises(__builtins__.PY$AttributeError, function() { return __builtins__.PY$hash(t) });
+    raises(__builtins__.PY$TypeError, function() { return __builtins__.PY$hash(t) });
 
     t.PY$append(t, 3);
     test(function() { return str(t) == '[3, 4, 5, 5, 4, 4, 1, 3]' });
@@ -370,7 +370,8 @@ function test_map() {
     test(function() { return str(__builtins__.PY$map(f, a)) == '[1, 4, 9]' });
 
     raises(__builtins__.PY$TypeError, function() { __builtins__.PY$map(f) });
-    raises(__builtins__.PY$NotImplementedError, function() { __builtins__.PY$map(f, a, a) });
+    test(function() { return str(__builtins__.PY$map(f, a, a)) == '[1, 4, 9]' });
+    test(function() { return str(__builtins__.PY$map(__builtins__.PY$None, a, list([4]))) == '[(1, 4), (2, None), (3, None)]' });
 }
 
 function test_zip() {
@@ -0,0 +1,25 @@
+def pairs(n):
+    for i in range(n):
+        yield i, i * i
+
+queue = [(1, "a"), (2, "b"), (3, "c")] + [(0, "")] * 40
+while len(queue) > 3:
+    queue.pop(0)
+a, b = queue[0]
+x, y = "xy"
+first, second, third = queue
+print a, b, x, y, first, second
+a, b = b, a
+print a, b
+d = {"one": 1, "two": 2}
+print sorted([v for k, v in d.items()]), [k + str(v) for k, v in sorted(d.items())]
+for k, v in sorted(d.items()):
+    print k, v
+for n, sq in pairs(3):
+    print n, sq
+for values in [(1, 2, 3), [1], (), "abc", pairs(1)]:
+    try:
+        p, q = values
+        print "ok", p, q
+    except ValueError, e:
+        print "ValueError", e
@@ -10,7 +10,6 @@ KNOWN_TO_FAIL = [
     "tests/namespace/del_global.py",
     "tests/namespace/del_local.py",
     "tests/functions/cmp.py",
-    "tests/flow/yield.py",
 
     "tests/libraries/xmlwriter.py",
     "tests/modules/classname.py",